@@ -0,0 +1,171 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from pymongo import UpdateOne, ReplaceOne
+from pymongo.errors import PyMongoError
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rollup buckets: period -> strftime format of the bucket (None for the all-time total)
+ROLLUP_PERIODS = {
+    "day": "%Y-%m-%d",
+    "month": "%Y-%m",
+    "all": None,
+}
+
+def _field_key(value: Optional[str], default: str) -> str:
+    # Status and payment method become field names; keep them valid as dotted paths
+    return str(value or default).replace(".", "_").replace("$", "_")
+
+def _increments(status: str, method: str, recurring: bool, amount: float, count: int) -> dict:
+    """Flat $inc document for `count` donations totalling `amount`"""
+    status = _field_key(status, "pending")
+    method = _field_key(method, "unknown")
+    inc = {
+        "amount": amount,
+        "count": count,
+        f"by_status.{status}.amount": amount,
+        f"by_status.{status}.count": count,
+        f"by_payment_method.{method}.amount": amount,
+        f"by_payment_method.{method}.count": count,
+    }
+    if recurring:
+        inc["recurring_amount"] = amount
+        inc["recurring_count"] = count
+    return inc
+
+def _buckets(created_at: datetime, currency: str) -> list:
+    """Identity of every rollup document a donation contributes to"""
+    buckets = []
+    for period, fmt in ROLLUP_PERIODS.items():
+        bucket = created_at.strftime(fmt) if fmt else "all"
+        buckets.append({"_id": f"{period}:{bucket}:{currency}", "period": period, "bucket": bucket, "currency": currency})
+    return buckets
+
+async def _apply(db, donation: dict, inc: dict) -> None:
+    now = datetime.utcnow()
+    operations = [
+        UpdateOne(
+            {"_id": bucket["_id"]},
+            {
+                "$inc": inc,
+                "$set": {"updated_at": now},
+                "$setOnInsert": {"period": bucket["period"], "bucket": bucket["bucket"], "currency": bucket["currency"]}
+            },
+            upsert=True
+        )
+        for bucket in _buckets(donation.get("created_at") or now, donation.get("currency") or "INR")
+    ]
+    try:
+        await db.donation_rollups.bulk_write(operations, ordered=False)
+    except PyMongoError as e:
+        # The donation itself is stored; a rebuild brings the rollups back in line
+        logger.error(f"Donation rollup update failed, rebuild required: {e}")
+
+def _donation_increments(donation: dict, sign: int) -> dict:
+    amount = float(donation.get("amount") or 0) * sign
+    return _increments(donation.get("status"), donation.get("payment_method"), donation.get("recurring", False), amount, sign)
+
+async def record_donation(db, donation: dict) -> None:
+    """Add a new donation to its daily, monthly and all-time rollups"""
+    await _apply(db, donation, _donation_increments(donation, 1))
+
+async def remove_donation(db, donation: dict) -> None:
+    """Take a deleted donation out of its rollups"""
+    await _apply(db, donation, _donation_increments(donation, -1))
+
+async def move_donation_status(db, before: dict, after: dict) -> None:
+    """Shift a donation between status buckets after an update"""
+    old_status = _field_key(before.get("status"), "pending")
+    new_status = _field_key(after.get("status"), "pending")
+    if old_status == new_status:
+        return
+    amount = float(before.get("amount") or 0)
+    await _apply(db, before, {
+        f"by_status.{old_status}.amount": -amount,
+        f"by_status.{old_status}.count": -1,
+        f"by_status.{new_status}.amount": amount,
+        f"by_status.{new_status}.count": 1,
+    })
+
+async def rebuild_rollups(db) -> int:
+    """Recompute every rollup from the donations collection; returns the number of rollup documents"""
+    pipeline = [
+        {"$group": {
+            "_id": {
+                "day": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+                "currency": {"$ifNull": ["$currency", "INR"]},
+                "status": {"$ifNull": ["$status", "pending"]},
+                "method": {"$ifNull": ["$payment_method", "unknown"]},
+                "recurring": {"$ifNull": ["$recurring", False]},
+            },
+            "amount": {"$sum": "$amount"},
+            "count": {"$sum": 1},
+        }}
+    ]
+    documents = {}
+    async for group in db.donations.aggregate(pipeline):
+        key = group["_id"]
+        inc = _increments(key["status"], key["method"], key["recurring"], float(group["amount"] or 0), group["count"])
+        for bucket in _buckets(datetime.strptime(key["day"], "%Y-%m-%d"), key["currency"]):
+            document = documents.setdefault(bucket["_id"], {
+                **bucket, "amount": 0.0, "count": 0, "recurring_amount": 0.0, "recurring_count": 0,
+                "by_status": {}, "by_payment_method": {},
+            })
+            # Fold the flat dotted increments into the nested document
+            for path, value in inc.items():
+                target = document
+                *parents, leaf = path.split(".")
+                for parent in parents:
+                    target = target.setdefault(parent, {})
+                target[leaf] = target.get(leaf, 0) + value
+
+    now = datetime.utcnow()
+    operations = [ReplaceOne({"_id": _id}, {**document, "updated_at": now}, upsert=True) for _id, document in documents.items()]
+    if operations:
+        await db.donation_rollups.bulk_write(operations, ordered=False)
+    # Drop buckets that no longer have any donations
+    await db.donation_rollups.delete_many({"_id": {"$nin": list(documents)}})
+    logger.info(f"Donation rollups rebuilt: {len(documents)} buckets")
+    return len(documents)
+
+def _format_rollup(document: dict) -> dict:
+    count = document.get("count", 0)
+    recurring_count = document.get("recurring_count", 0)
+    breakdown = lambda values: {
+        key: {"amount": round(value.get("amount", 0), 2), "count": value.get("count", 0)}
+        for key, value in (values or {}).items() if value.get("count", 0)
+    }
+    return {
+        "currency": document["currency"],
+        "period": document["period"],
+        "bucket": document["bucket"],
+        "amount": round(document.get("amount", 0), 2),
+        "count": count,
+        "recurring_amount": round(document.get("recurring_amount", 0), 2),
+        "recurring_count": recurring_count,
+        "recurring_share": round(recurring_count / count, 4) if count else 0,
+        "by_status": breakdown(document.get("by_status")),
+        "by_payment_method": breakdown(document.get("by_payment_method")),
+    }
+
+async def donation_summary(db, days: int = 30, months: int = 12) -> dict:
+    """Totals per currency plus recent daily and monthly buckets, read from rollups only"""
+    today = datetime.utcnow()
+    first_day = (today - timedelta(days=days - 1)).strftime(ROLLUP_PERIODS["day"])
+    month_index = today.year * 12 + today.month - 1 - (months - 1)
+    first_month = f"{month_index // 12:04d}-{month_index % 12 + 1:02d}"
+
+    documents = await db.donation_rollups.find({"$or": [
+        {"period": "all"},
+        {"period": "day", "bucket": {"$gte": first_day}},
+        {"period": "month", "bucket": {"$gte": first_month}},
+    ]}).to_list(length=None)
+
+    summary = {"totals": [], "daily": [], "monthly": []}
+    for document in sorted(documents, key=lambda d: (d["bucket"], d["currency"])):
+        if not document.get("count"):
+            continue
+        target = {"all": "totals", "day": "daily", "month": "monthly"}[document["period"]]
+        summary[target].append(_format_rollup(document))
+    return summary
@@ -3,13 +3,30 @@ import bcrypt
 from datetime import datetime, timedelta
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from typing import Optional
+import asyncio
+import hashlib
 import os
+import time
 
 # JWT Configuration
 SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'shield-foundation-secret-key-2024')
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 24
 
+# HMAC key bytes are derived once instead of on every encode/decode
+SIGNING_KEY = SECRET_KEY.encode('utf-8')
+
+# Verified token cache configuration
+TOKEN_CACHE_SIZE = int(os.environ.get('TOKEN_CACHE_SIZE', '1024'))
+TOKEN_CACHE_ENABLED = os.environ.get('TOKEN_CACHE_ENABLED', 'true').lower() == 'true'
+
+# Password hashing pool configuration
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', '2'))
+PASSWORD_HASH_MAX_PENDING = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', '32'))
+
 security = HTTPBearer()
 
 def hash_password(password: str) -> str:
@@ -22,18 +39,122 @@ def verify_password(password: str, hashed: str) -> bool:
     """Verify a password against its hash"""
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
+class PasswordHasher:
+    """Runs bcrypt on a dedicated, size-limited thread pool so it never blocks the event loop"""
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def _run(self, func, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many authentication requests, please retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(verify_password, password, hashed)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "queued": max(0, self.pending - self.workers),
+            "peak_pending": self.peak_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+password_hasher = PasswordHasher()
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password without blocking the event loop"""
+    return await password_hasher.hash(password)
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """Verify a password without blocking the event loop"""
+    return await password_hasher.verify(password, hashed)
+
+class VerifiedTokenCache:
+    """LRU of recently verified tokens, keyed by SHA-256 digest and valid until each token expires"""
+
+    def __init__(self, max_entries: int = TOKEN_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Optional[dict]:
+        digest = hashlib.sha256(token.encode('utf-8')).digest()
+        entry = self._entries.get(digest)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, claims = entry
+        if expires_at <= time.time():
+            # Fall through to a full decode so the caller gets the expiry error
+            del self._entries[digest]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return claims
+
+    def put(self, token: str, expires_at: float, claims: dict) -> None:
+        digest = hashlib.sha256(token.encode('utf-8')).digest()
+        self._entries[digest] = (expires_at, claims)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": TOKEN_CACHE_ENABLED,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+token_cache = VerifiedTokenCache()
+
 def create_access_token(data: dict) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def verify_token(token: str) -> dict:
     """Verify and decode a JWT token"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SIGNING_KEY, algorithms=[ALGORITHM])
         return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(
@@ -41,16 +162,21 @@ def verify_token(token: str) -> dict:
             detail="Token has expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    """Get the current authenticated user from JWT token"""
-    payload = verify_token(credentials.credentials)
+def get_token_claims(token: str) -> dict:
+    """Get the user claims for a token, skipping signature checks for recently verified tokens"""
+    if TOKEN_CACHE_ENABLED:
+        claims = token_cache.get(token)
+        if claims is not None:
+            return claims
+
+    payload = verify_token(token)
     username: str = payload.get("sub")
     if username is None:
         raise HTTPException(
@@ -58,7 +184,15 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return {"username": username, "role": payload.get("role")}
+    claims = {"username": username, "role": payload.get("role")}
+    if TOKEN_CACHE_ENABLED and isinstance(payload.get("exp"), (int, float)):
+        token_cache.put(token, payload["exp"], claims)
+    return claims
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """Get the current authenticated user from JWT token"""
+    # Handlers may add keys to the user dict, so never hand out the cached one
+    return dict(get_token_claims(credentials.credentials))
 
 # Dependency for admin-only routes
 async def admin_required(current_user: dict = Depends(get_current_user)):
@@ -0,0 +1,126 @@
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+import asyncio
+import os
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Cache Configuration
+CACHE_TTL_SECONDS = float(os.environ.get('CACHE_TTL_SECONDS', '300'))
+CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', '512'))
+
+class TTLCache:
+    """In-process LRU cache with per-entry expiry, keyed by (collection, query)"""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, ttl_seconds: float = CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._pending: dict = {}
+        self._dependents: dict = {}
+        self._listeners: list = []
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, collection: str, key: Hashable = None, default: Any = None) -> Any:
+        """Return a fresh cached value, or default if missing or expired"""
+        cache_key = (collection, key)
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[cache_key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(cache_key)
+        self.hits += 1
+        return value
+
+    def set(self, collection: str, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries when full"""
+        cache_key = (collection, key)
+        self._entries[cache_key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def add_dependency(self, namespace: str, *collections: str) -> None:
+        """Invalidate `namespace` whenever any of `collections` is invalidated (for composite payloads)"""
+        for collection in collections:
+            self._dependents.setdefault(collection, set()).add(namespace)
+
+    def add_listener(self, callback: Callable[[set], None]) -> None:
+        """Call `callback` with the affected namespaces on every invalidation"""
+        self._listeners.append(callback)
+
+    def invalidate(self, *collections: str) -> None:
+        """Drop every entry belonging to the given collections and their dependents"""
+        targets = set(collections)
+        for collection in collections:
+            targets |= self._dependents.get(collection, set())
+        for cache_key in [k for k in self._entries if k[0] in targets]:
+            del self._entries[cache_key]
+        # Loads started before the write must not repopulate stale data
+        for cache_key in [k for k in self._pending if k[0] in targets]:
+            del self._pending[cache_key]
+        for callback in self._listeners:
+            callback(targets)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pending.clear()
+
+    async def get_or_load(self, collection: str, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value or await loader once, sharing it with concurrent callers"""
+        sentinel = object()
+        value = self.get(collection, key, sentinel)
+        if value is not sentinel:
+            return value
+
+        cache_key = (collection, key)
+        pending = self._pending.get(cache_key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+            # The caller that was loading got cancelled; load on our own instead
+            return await self.get_or_load(collection, key, loader)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[cache_key] = future
+        try:
+            value = await loader()
+        except BaseException as e:
+            # Cancellation (client disconnect, shutdown) must not leave waiters on a future nobody resolves
+            if self._pending.get(cache_key) is future:
+                del self._pending[cache_key]
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                # Mark the exception as retrieved when nobody else was waiting
+                future.exception()
+            else:
+                future.cancel()
+            raise
+        if self._pending.get(cache_key) is future:
+            del self._pending[cache_key]
+            self.set(collection, key, value)
+        future.set_result(value)
+        return value
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+# Shared cache for public CMS reads; admin writes invalidate by collection
+cms_cache = TTLCache()
@@ -0,0 +1,230 @@
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Dict, List, Optional
+import logging
+import os
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Compression Configuration
+COMPRESSION_ENABLED = os.environ.get('COMPRESSION_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', '1024'))
+COMPRESSION_GZIP_LEVEL = int(os.environ.get('COMPRESSION_GZIP_LEVEL', '6'))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', '5'))
+# Bodies at least this large are compressed on the thread pool instead of blocking the event loop
+COMPRESSION_THREAD_MIN_SIZE = int(os.environ.get('COMPRESSION_THREAD_MIN_SIZE', '65536'))
+
+COMPRESSIBLE_TYPES = (
+    "application/json", "application/x-ndjson", "application/javascript",
+    "application/xml", "image/svg+xml", "text/",
+)
+
+def supported_encodings() -> List[str]:
+    """Encodings this worker can produce, most preferred first"""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick br or gzip from an Accept-Encoding header (RFC 9110 12.5.3), or None for identity"""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip().lower()] = quality
+    best, best_quality = None, 0.0
+    for encoding in supported_encodings():
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        # Ties keep the earlier (smaller output) encoding
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+def choose_encoding(accept_encoding: Optional[str], size: int) -> Optional[str]:
+    """Encoding for a body of `size` bytes, honouring the enable flag and minimum size"""
+    if not COMPRESSION_ENABLED or size < COMPRESSION_MIN_SIZE:
+        return None
+    return negotiate(accept_encoding)
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """Compress a complete body; `level` overrides the configured gzip level / brotli quality"""
+    if encoding == "br":
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY if level is None else level)
+    if encoding == "gzip":
+        # wbits=31 writes a gzip header with a zero mtime, so equal bodies compress to equal bytes
+        compressor = zlib.compressobj(COMPRESSION_GZIP_LEVEL if level is None else level, zlib.DEFLATED, 31)
+        return compressor.compress(body) + compressor.flush()
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+async def compress_async(body: bytes, encoding: str) -> bytes:
+    """compress() for request handlers: large bodies go to the thread pool (zlib and brotli release the GIL)"""
+    if len(body) >= COMPRESSION_THREAD_MIN_SIZE:
+        return await run_in_threadpool(compress, body, encoding)
+    return compress(body, encoding)
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Distinct strong validator per representation: "abc" -> "abc-br" """
+    weak = etag.startswith("W/")
+    tag = etag[2:] if weak else etag
+    return ("W/" if weak else "") + tag[:-1] + f'-{encoding}"'
+
+def strip_encoding(etag: str) -> str:
+    """Undo encoded_etag so conditional requests match any representation"""
+    for encoding in ("br", "gzip"):
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
+
+def add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if vary is None:
+        headers["vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["vary"] = f"{vary}, Accept-Encoding"
+
+class _StreamCompressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+            self.compress, self.finish = self._compressor.process, self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+            self.compress, self.finish = self._compressor.compress, self._compressor.flush
+
+class CompressionStats:
+    """Bytes in and out per encoding for this worker"""
+
+    def __init__(self):
+        self._encodings: Dict[str, Dict[str, int]] = {}
+        self.precompressed = 0
+        self.skipped = 0
+
+    def record(self, encoding: str, original: int, compressed: int) -> None:
+        counters = self._encodings.setdefault(encoding, {"responses": 0, "bytes_in": 0, "bytes_out": 0})
+        counters["responses"] += 1
+        counters["bytes_in"] += original
+        counters["bytes_out"] += compressed
+
+    def stats(self) -> dict:
+        return {
+            "enabled": COMPRESSION_ENABLED,
+            "encodings": supported_encodings(),
+            "min_size": COMPRESSION_MIN_SIZE,
+            "precompressed": self.precompressed,
+            "skipped": self.skipped,
+            "by_encoding": {
+                encoding: {**counters, "ratio": round(counters["bytes_out"] / counters["bytes_in"], 4) if counters["bytes_in"] else 0}
+                for encoding, counters in self._encodings.items()
+            },
+        }
+
+compression_stats = CompressionStats()
+
+class CompressionMiddleware:
+    """Negotiate br/gzip for compressible responses; bodies that already carry Content-Encoding pass through"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        await self.app(scope, receive, _CompressingSend(send, encoding, self.minimum_size).send)
+
+class _CompressingSend:
+    def __init__(self, send: Send, encoding: Optional[str], minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_StreamCompressor] = None
+        self.passthrough = False
+        self.original = 0
+        self.compressed = 0
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self._send(message)
+            return
+        if message["type"] == "http.response.start":
+            # Headers wait for the first body chunk, which decides the encoding
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        if self.compressor is not None:
+            await self._send_chunk(message)
+            return
+
+        headers = MutableHeaders(raw=self.start["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        content_type = headers.get("content-type", "")
+        eligible = (
+            self.start["status"] not in (204, 304)
+            and "content-encoding" not in headers
+            and content_type.startswith(COMPRESSIBLE_TYPES)
+        )
+        if eligible:
+            add_vary(headers)
+        if "content-encoding" in headers:
+            # Precompressed by conditional_response from the cached variants
+            compression_stats.precompressed += 1
+        if not eligible or self.encoding is None or (not more_body and len(body) < self.minimum_size):
+            if eligible:
+                compression_stats.skipped += 1
+            self.passthrough = True
+            await self._send(self.start)
+            await self._send(message)
+            return
+
+        headers["content-encoding"] = self.encoding
+        if "etag" in headers:
+            headers["etag"] = encoded_etag(headers["etag"], self.encoding)
+        if not more_body:
+            compressed = await compress_async(body, self.encoding)
+            headers["content-length"] = str(len(compressed))
+            compression_stats.record(self.encoding, len(body), len(compressed))
+            self.passthrough = True
+            await self._send(self.start)
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+
+        # Streaming body (exports): compress chunk by chunk without knowing the final length
+        del headers["content-length"]
+        self.compressor = _StreamCompressor(self.encoding)
+        await self._send(self.start)
+        await self._send_chunk(message)
+
+    async def _send_chunk(self, message: Message) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if len(body) >= COMPRESSION_THREAD_MIN_SIZE:
+            chunk = await run_in_threadpool(self.compressor.compress, body)
+        else:
+            chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        self.original += len(body)
+        self.compressed += len(chunk)
+        if not more_body:
+            compression_stats.record(self.encoding, self.original, self.compressed)
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
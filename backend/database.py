@@ -1,10 +1,21 @@
 from motor.motor_asyncio import AsyncIOMotorClient
-from datetime import datetime
+from pymongo import UpdateOne, monitoring
+from pymongo.errors import DuplicateKeyError
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Optional
 import os
+import asyncio
 import logging
+import socket
+import threading
 from dotenv import load_dotenv
 from pathlib import Path
 
+from indexes import ensure_indexes, REGISTRY_VERSION
+from analytics import rebuild_rollups
+from html_text import html_to_text
+from cache import TTLCache
+
 # Load environment variables
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -13,56 +24,364 @@ logger = logging.getLogger(__name__)
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ.get('DB_NAME', 'shield_foundation')]
+DB_NAME = os.environ.get('DB_NAME', 'shield_foundation')
 
-async def init_database():
-    """Initialize database with default data"""
-    try:
-        # Create admin user if doesn't exist
-        admin_collection = db.admin_users
-        existing_admin = await admin_collection.find_one({"username": "admin"})
-        
-        if not existing_admin:
-            from auth import hash_password
-            admin_user = {
-                "username": "admin",
-                "password": hash_password("admin123"),
-                "name": "Shield Admin",
-                "role": "super_admin",
-                "created_at": datetime.utcnow()
-            }
-            await admin_collection.insert_one(admin_user)
-            logger.info("Default admin user created")
-        
-        # Initialize impact stats if doesn't exist
-        stats_collection = db.impact_stats
-        existing_stats = await stats_collection.find_one()
-        
-        if not existing_stats:
-            initial_stats = {
-                "youth_trained": 1300,
-                "youth_placed": 1000,
-                "seniors_supported": 6000,
-                "women_empowered": 200,
-                "updated_at": datetime.utcnow(),
-                "updated_by": "system"
+# Connection pool configuration (per worker process)
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '50'))
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', '0'))
+MONGO_MAX_IDLE_TIME_MS = int(os.environ.get('MONGO_MAX_IDLE_TIME_MS', '60000'))
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.environ.get('MONGO_WAIT_QUEUE_TIMEOUT_MS', '5000'))
+MONGO_COMPRESSORS = os.environ.get('MONGO_COMPRESSORS', 'zstd,snappy,zlib')
+MONGO_READ_PREFERENCE = os.environ.get('MONGO_READ_PREFERENCE', 'primary')
+
+# Startup configuration: "background" serves traffic while bootstrap runs, "blocking" waits for it
+STARTUP_MODE = os.environ.get('STARTUP_MODE', 'background')
+STARTUP_LOCK_TTL_SECONDS = int(os.environ.get('STARTUP_LOCK_TTL_SECONDS', '600'))
+STARTUP_POLL_SECONDS = float(os.environ.get('STARTUP_POLL_SECONDS', '2'))
+
+# Database explorer configuration
+COLLECTION_NAMES_TTL_SECONDS = float(os.environ.get('COLLECTION_NAMES_TTL_SECONDS', '10'))
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """Track connection pool usage from pymongo's CMAP events"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.open = 0
+        self.checked_out = 0
+        self.waiting = 0
+        self.created = 0
+        self.closed = 0
+        self.checkout_failed = 0
+        self.cleared = 0
+
+    def _add(self, **deltas):
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._add(cleared=1)
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._add(open=1, created=1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._add(open=-1, closed=1)
+
+    def connection_check_out_started(self, event):
+        self._add(waiting=1)
+
+    def connection_check_out_failed(self, event):
+        self._add(waiting=-1, checkout_failed=1)
+
+    def connection_checked_out(self, event):
+        self._add(waiting=-1, checked_out=1)
+
+    def connection_checked_in(self, event):
+        self._add(checked_out=-1)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_pool_size": MONGO_MAX_POOL_SIZE,
+                "min_pool_size": MONGO_MIN_POOL_SIZE,
+                "open": self.open,
+                "checked_out": self.checked_out,
+                "idle": self.open - self.checked_out,
+                "waiting": self.waiting,
+                "created": self.created,
+                "closed": self.closed,
+                "checkout_failed": self.checkout_failed,
+                "cleared": self.cleared,
             }
-            await stats_collection.insert_one(initial_stats)
-            logger.info("Initial impact stats created")
+
+pool_stats = PoolStatsListener()
+
+def _available_compressors() -> list:
+    """Keep only the wire compressors whose libraries are installed"""
+    available = []
+    for name in [c.strip() for c in MONGO_COMPRESSORS.split(",") if c.strip()]:
+        try:
+            if name == "zstd":
+                import zstandard  # noqa: F401
+            elif name == "snappy":
+                import snappy  # noqa: F401
+        except ImportError:
+            logger.info(f"MongoDB compressor {name} unavailable, skipping")
+            continue
+        available.append(name)
+    return available
+
+_client: Optional[AsyncIOMotorClient] = None
+# Set at shutdown so late db access fails instead of opening a client nobody closes
+_closed = False
+
+def connect_to_mongo() -> AsyncIOMotorClient:
+    """Create this worker's shared Motor client (idempotent)"""
+    global _client, _closed
+    _closed = False
+    if _client is None:
+        options = {
+            "maxPoolSize": MONGO_MAX_POOL_SIZE,
+            "minPoolSize": MONGO_MIN_POOL_SIZE,
+            "maxIdleTimeMS": MONGO_MAX_IDLE_TIME_MS,
+            "waitQueueTimeoutMS": MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            "readPreference": MONGO_READ_PREFERENCE,
+            "event_listeners": [pool_stats],
+        }
+        compressors = _available_compressors()
+        if compressors:
+            options["compressors"] = ",".join(compressors)
+        _client = AsyncIOMotorClient(mongo_url, **options)
+        logger.info(
+            f"MongoDB client created (pool {MONGO_MIN_POOL_SIZE}-{MONGO_MAX_POOL_SIZE}, "
+            f"compressors {compressors or 'none'}, read preference {MONGO_READ_PREFERENCE})"
+        )
+    return _client
+
+def close_mongo_connection() -> None:
+    """Close this worker's Motor client and its pooled connections"""
+    global _client, _closed
+    _closed = True
+    if _client is not None:
+        _client.close()
+        _client = None
+        logger.info("MongoDB client closed")
+
+class _DatabaseProxy:
+    """Module-level handle that resolves to the current worker's database on each access"""
+
+    def _database(self):
+        if _closed:
+            raise RuntimeError("MongoDB client is closed for this worker")
+        return connect_to_mongo()[DB_NAME]
+
+    def __getattr__(self, name):
+        return getattr(self._database(), name)
+
+    def __getitem__(self, name):
+        return self._database()[name]
+
+# Created lazily so gunicorn workers never share a client inherited across fork
+db = _DatabaseProxy()
+
+# Readiness of this worker, reported by the /api/ready probe
+startup_state = {
+    "seeded": False,
+    "indexes_ready": False,
+    "index_failures": [],
+    "index_registry_version": REGISTRY_VERSION,
+    "error": None,
+}
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+async def acquire_startup_lock(name: str) -> bool:
+    """Take a named lock document shared by all workers; expired locks can be taken over"""
+    now = datetime.utcnow()
+    try:
+        await db.startup_locks.find_one_and_update(
+            {"_id": name, "$or": [{"expires_at": {"$lt": now}}, {"owner": WORKER_ID}]},
+            {"$set": {
+                "owner": WORKER_ID,
+                "acquired_at": now,
+                "expires_at": now + timedelta(seconds=STARTUP_LOCK_TTL_SECONDS)
+            }},
+            upsert=True
+        )
+        return True
+    except DuplicateKeyError:
+        # Another worker holds an unexpired lock, so the upsert collided with its document
+        return False
+
+async def release_startup_lock(name: str) -> None:
+    await db.startup_locks.delete_one({"_id": name, "owner": WORKER_ID})
+
+async def seed_defaults():
+    """Create the default admin user and impact stats if they don't exist"""
+    # Create admin user if doesn't exist
+    admin_collection = db.admin_users
+    existing_admin = await admin_collection.find_one({"username": "admin"})
+    
+    if not existing_admin:
+        from auth import hash_password_async
+        admin_user = {
+            "username": "admin",
+            "password": await hash_password_async("admin123"),
+            "name": "Shield Admin",
+            "role": "super_admin",
+            "created_at": datetime.utcnow()
+        }
+        await admin_collection.insert_one(admin_user)
+        logger.info("Default admin user created")
+    
+    # Initialize impact stats if doesn't exist
+    stats_collection = db.impact_stats
+    existing_stats = await stats_collection.find_one()
+    
+    if not existing_stats:
+        initial_stats = {
+            "youth_trained": 1300,
+            "youth_placed": 1000,
+            "seniors_supported": 6000,
+            "women_empowered": 200,
+            "updated_at": datetime.utcnow(),
+            "updated_by": "system"
+        }
+        await stats_collection.insert_one(initial_stats)
+        logger.info("Initial impact stats created")
+
+async def backfill_donation_rollups():
+    """Build donation rollups for donations recorded before rollups existed"""
+    if await db.donation_rollups.find_one() is None and await db.donations.find_one() is not None:
+        await rebuild_rollups(db)
+
+# Admin lists page by (sort field, id); a row without an id would fall outside every cursor
+KEYSET_COLLECTIONS = ["contacts", "volunteers", "newsletters", "donations", "news", "blogs"]
+
+async def backfill_ids():
+    """Give legacy documents without an id the string form of their _id, the id the lists already show"""
+    for collection_name in KEYSET_COLLECTIONS:
+        result = await db[collection_name].update_many(
+            {"id": None},
+            [{"$set": {"id": {"$toString": "$_id"}}}]
+        )
+        if result.modified_count:
+            logger.info(f"Assigned ids to {result.modified_count} legacy {collection_name} documents")
+
+# Collections whose HTML content is also stored as plain_text
+PLAIN_TEXT_COLLECTIONS = ["news", "blogs"]
+
+async def backfill_plain_text():
+    """Derive plain_text for documents written before it was stored"""
+    for collection_name in PLAIN_TEXT_COLLECTIONS:
+        operations = [
+            UpdateOne({"_id": document["_id"]}, {"$set": {"plain_text": html_to_text(document.get("content", ""))}})
+            async for document in db[collection_name].find({"plain_text": {"$exists": False}}, {"content": 1})
+        ]
+        if operations:
+            await db[collection_name].bulk_write(operations, ordered=False)
+            logger.info(f"Derived plain_text for {len(operations)} {collection_name} documents")
+
+async def index_status() -> Optional[dict]:
+    """The finished reconciliation of the current registry, or None while none has finished"""
+    status = await db.startup_status.find_one({"_id": "indexes"})
+    return status if status and status.get("version") == REGISTRY_VERSION else None
+
+async def indexes_current() -> bool:
+    # A reconciliation with failed indexes counts as stale, so the next bootstrap retries it
+    status = await index_status()
+    return bool(status) and not status.get("failed")
+
+def record_index_failures(failed: list) -> None:
+    startup_state["index_failures"] = failed
+    startup_state["indexes_ready"] = not failed
+
+async def init_database(after_bootstrap: Optional[Callable[[], Awaitable[Any]]] = None):
+    """Seed defaults and reconcile indexes once across all workers"""
+    # after_bootstrap runs only in the worker holding the bootstrap lock (shared files, not per-worker state)
+    try:
+        while True:
+            if await acquire_startup_lock("bootstrap"):
+                try:
+                    await seed_defaults()
+                    await backfill_donation_rollups()
+                    await backfill_ids()
+                    await backfill_plain_text()
+                    startup_state["seeded"] = True
+                    
+                    # Index builds only rerun when the registry changes or a build failed
+                    failed = []
+                    if not await indexes_current():
+                        # Waiting workers must not report the previous attempt's failures as this one's
+                        await db.startup_status.update_one({"_id": "indexes"}, {"$unset": {"version": ""}})
+                        report = await ensure_indexes(db)
+                        failed = report["failed"]
+                        await db.startup_status.update_one(
+                            {"_id": "indexes"},
+                            {"$set": {
+                                "version": REGISTRY_VERSION,
+                                "failed": report["failed"],
+                                "completed_at": datetime.utcnow(),
+                                "completed_by": WORKER_ID
+                            }},
+                            upsert=True
+                        )
+                    record_index_failures(failed)
+                    if after_bootstrap is not None:
+                        await after_bootstrap()
+                finally:
+                    await release_startup_lock("bootstrap")
+                break
             
-        # Create indexes for better performance
-        await db.contacts.create_index("email")
-        await db.volunteers.create_index("email")
-        await db.newsletters.create_index("email", unique=True)
-        await db.admin_users.create_index("username", unique=True)
-        await db.news.create_index([("created_at", -1)])
-        await db.donations.create_index("email")
-        await db.donations.create_index([("created_at", -1)])
-        await db.donations.create_index("status")
+            # Another worker is bootstrapping; wait for it to finish
+            status = await index_status()
+            if status:
+                startup_state["seeded"] = True
+                record_index_failures(status.get("failed", []))
+                break
+            await asyncio.sleep(STARTUP_POLL_SECONDS)
         
+        startup_state["error"] = None
         logger.info("Database initialization completed")
         
     except Exception as e:
+        startup_state["error"] = str(e)
         logger.error(f"Database initialization failed: {e}")
         raise
+
+async def get_collection_stats(collection_name: str) -> dict:
+    """Get document count and storage sizes for a collection from its metadata"""
+    try:
+        cursor = db[collection_name].aggregate([{"$collStats": {"storageStats": {}}}])
+        stats = (await cursor.to_list(length=None))[0]["storageStats"]
+        return {
+            "collection": collection_name,
+            "count": stats.get("count", 0),
+            "size": stats.get("size", 0),
+            "storage_size": stats.get("storageSize", 0),
+            "index_size": stats.get("totalIndexSize", 0),
+            "avg_obj_size": stats.get("avgObjSize", 0),
+            "indexes": stats.get("nindexes", 0)
+        }
+    except Exception as e:
+        # Views and restricted deployments don't support $collStats
+        logger.warning(f"$collStats unavailable for {collection_name}: {e}")
+        return {
+            "collection": collection_name,
+            "count": await db[collection_name].estimated_document_count(),
+            "size": 0,
+            "storage_size": 0,
+            "index_size": 0,
+            "avg_obj_size": 0,
+            "indexes": 0
+        }
+
+# Admin metadata: kept out of the public cms_cache and its LRU
+collection_names_cache = TTLCache(max_entries=1, ttl_seconds=COLLECTION_NAMES_TTL_SECONDS)
+
+async def collection_exists(name: str) -> bool:
+    """Check a collection name against a briefly cached listing"""
+    if name in await collection_names_cache.get_or_load("collections", "names", db.list_collection_names):
+        return True
+    # Collections created since the listing (reports, change markers) show up without waiting for the TTL
+    collection_names_cache.invalidate("collections")
+    return name in await collection_names_cache.get_or_load("collections", "names", db.list_collection_names)
+
+async def get_all_collection_stats() -> list:
+    """Get metadata stats for every collection concurrently"""
+    collections = await db.list_collection_names()
+    return await asyncio.gather(*(get_collection_stats(name) for name in collections))
@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import AsyncIterator, List
+import csv
+import io
+import json
+
+# Export Configuration
+EXPORT_BATCH_SIZE = 500
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Exportable collections: (date field used for range filters and ordering, exported fields)
+EXPORT_COLLECTIONS = {
+    "contacts": ("created_at", [
+        "id", "name", "email", "phone", "subject", "message", "inquiry_type", "status", "created_at"
+    ]),
+    "volunteers": ("created_at", [
+        "id", "name", "email", "phone", "skills", "availability", "interests", "experience", "status", "created_at"
+    ]),
+    "donations": ("created_at", [
+        "id", "name", "email", "phone", "amount", "currency", "payment_method", "message", "anonymous",
+        "recurring", "frequency", "status", "payment_reference", "notes", "created_at", "updated_at"
+    ]),
+    "newsletters": ("subscribed_at", [
+        "id", "email", "is_active", "subscribed_at"
+    ]),
+}
+
+# Leading characters that spreadsheet apps evaluate as formulas
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+def _json_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def _csv_value(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        value = "; ".join(str(item) for item in value)
+    if not isinstance(value, str):
+        return str(value)
+    # Neutralize formula injection from public form input
+    if value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+async def stream_csv(cursor, fields: List[str]) -> AsyncIterator[bytes]:
+    """Stream documents from a motor cursor as CSV in bounded chunks"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    async for document in cursor:
+        writer.writerow([_csv_value(document.get(field)) for field in fields])
+        if buffer.tell() >= EXPORT_CHUNK_BYTES:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+async def stream_ndjson(cursor, fields: List[str]) -> AsyncIterator[bytes]:
+    """Stream documents from a motor cursor as newline-delimited JSON in bounded chunks"""
+    lines = []
+    size = 0
+    async for document in cursor:
+        line = json.dumps({field: _json_value(document.get(field)) for field in fields}, ensure_ascii=False)
+        lines.append(line)
+        size += len(line) + 1
+        if size >= EXPORT_CHUNK_BYTES:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+            size = 0
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
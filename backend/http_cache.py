@@ -0,0 +1,141 @@
+from fastapi import Request, Response
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Hashable, Optional, Sequence
+import asyncio
+import hashlib
+
+from cache import TTLCache, cms_cache
+from compression import COMPRESSION_ENABLED, choose_encoding, compress_async, encoded_etag, strip_encoding
+from database import db
+from snapshots import SnapshotPublisher
+from responses import dumps
+
+class CachedPayload:
+    """A serialized public response with its validators and compressed variants"""
+    __slots__ = ("body", "etag", "last_modified", "variants")
+
+    def __init__(self, body: bytes, etag: str, last_modified: Optional[datetime]):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.variants: dict = {}
+
+    async def encoded(self, encoding: str, keep: bool = True) -> bytes:
+        """The body in `encoding`, compressed once per cached version unless `keep` is False"""
+        body = self.variants.get(encoding)
+        if body is None:
+            body = await compress_async(self.body, encoding)
+            if keep:
+                self.variants[encoding] = body
+        return body
+
+def encode_payload(payload: Any) -> bytes:
+    """Serialize a payload once, exactly like the app's default response class"""
+    return dumps(payload)
+
+async def latest_update(collection: str) -> Optional[datetime]:
+    """Get the most recent change in a collection: its newest updated_at or its last delete"""
+    doc, change = await asyncio.gather(
+        db[collection].find_one(
+            {"updated_at": {"$exists": True}},
+            {"updated_at": 1, "_id": 0},
+            sort=[("updated_at", -1)]
+        ),
+        db.collection_changes.find_one({"_id": collection}),
+    )
+    candidates = [
+        value for value in ((doc or {}).get("updated_at"), (change or {}).get("changed_at"))
+        if isinstance(value, datetime)
+    ]
+    return max(candidates) if candidates else None
+
+async def touch_collection(collection: str) -> None:
+    """Record a change that leaves no updated_at behind (a delete) so Last-Modified still advances"""
+    await db.collection_changes.update_one(
+        {"_id": collection},
+        {"$max": {"changed_at": datetime.utcnow()}},
+        upsert=True
+    )
+
+def build_payload(body: bytes, last_modified: Optional[datetime]) -> CachedPayload:
+    """Compute a strong ETag from the collection's last update and the body hash"""
+    digest = hashlib.sha256()
+    if last_modified:
+        digest.update(last_modified.isoformat().encode("utf-8"))
+    digest.update(body)
+    return CachedPayload(body, f'"{digest.hexdigest()[:32]}"', last_modified)
+
+async def render_payload(loader: Callable[[], Awaitable[Any]], sources: Sequence[str]) -> CachedPayload:
+    """Load and serialize a payload; the newest update across its source collections is Last-Modified"""
+    payload, *updates = await asyncio.gather(loader(), *(latest_update(source) for source in sources))
+    updates = [update for update in updates if update]
+    return build_payload(encode_payload(payload), max(updates) if updates else None)
+
+# Pre-rendered public payloads on disk: nginx serves them directly, workers read them before Mongo
+snapshot_publisher = SnapshotPublisher(render_payload)
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+def is_not_modified(request: Request, entry: CachedPayload) -> bool:
+    """Evaluate If-None-Match, falling back to If-Modified-Since (RFC 9110)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # If-None-Match uses weak comparison; any encoding of the current version matches
+        candidates = {strip_encoding(tag.strip().removeprefix("W/")) for tag in if_none_match.split(",")}
+        return entry.etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and entry.last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        last_modified = entry.last_modified
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        # HTTP dates have one-second resolution
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+def validator_headers(entry: CachedPayload, encoding: Optional[str] = None) -> dict:
+    headers = {"ETag": encoded_etag(entry.etag, encoding) if encoding else entry.etag, "Cache-Control": "public, no-cache"}
+    if entry.last_modified:
+        headers["Last-Modified"] = _http_date(entry.last_modified)
+    if COMPRESSION_ENABLED:
+        headers["Vary"] = "Accept-Encoding"
+    return headers
+
+async def conditional_response(
+    request: Request,
+    collection: str,
+    key: Hashable,
+    loader: Callable[[], Awaitable[Any]],
+    sources: Optional[Sequence[str]] = None,
+    cache: TTLCache = cms_cache,
+    keep_variants: bool = True,
+) -> Response:
+    """Serve a cached public payload, answering 304 when the client copy is current"""
+    # Composite payloads pass their source collections; an empty list skips Last-Modified entirely
+    async def build():
+        stored = await snapshot_publisher.read(collection, key)
+        if stored is not None:
+            return CachedPayload(*stored)
+        return await render_payload(loader, [collection] if sources is None else sources)
+
+    entry = await cache.get_or_load(collection, key, build)
+    encoding = choose_encoding(request.headers.get("accept-encoding"), len(entry.body))
+    headers = validator_headers(entry, encoding)
+    if is_not_modified(request, entry):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        return Response(content=await entry.encoded(encoding, keep_variants), media_type="application/json", headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
@@ -0,0 +1,147 @@
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Unique custom ids; partial so legacy documents without an id don't collide on null
+def _unique_id() -> IndexModel:
+    return IndexModel(
+        [("id", ASCENDING)],
+        unique=True,
+        partialFilterExpression={"id": {"$exists": True}}
+    )
+
+# Public CMS lists: find({"is_active": True}).sort(order, created_at); admin: find({}).sort(order, created_at)
+def _ordered_cms() -> list:
+    return [
+        _unique_id(),
+        IndexModel([("is_active", ASCENDING), ("order", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("order", ASCENDING), ("created_at", DESCENDING)]),
+    ]
+
+# Page sections: find({"page", "is_active"}).sort(order, created_at); admin: find({"page"}).sort(...)
+def _page_sections() -> list:
+    return [
+        _unique_id(),
+        IndexModel([("page", ASCENDING), ("is_active", ASCENDING), ("order", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("page", ASCENDING), ("order", ASCENDING), ("created_at", DESCENDING)]),
+    ]
+
+# Declarative registry: collection -> indexes matching every query shape in server.py
+INDEX_REGISTRY = {
+    "admin_users": [
+        IndexModel([("username", ASCENDING)], unique=True),
+        IndexModel([("email", ASCENDING)]),
+        _unique_id(),
+    ],
+    "contacts": [
+        _unique_id(),
+        IndexModel([("email", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)]),
+    ],
+    "volunteers": [
+        _unique_id(),
+        IndexModel([("email", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)]),
+    ],
+    "newsletters": [
+        _unique_id(),
+        IndexModel([("email", ASCENDING)], unique=True),
+        IndexModel([("is_active", ASCENDING), ("subscribed_at", DESCENDING), ("id", DESCENDING)]),
+    ],
+    "donations": [
+        _unique_id(),
+        IndexModel([("email", ASCENDING)]),
+        IndexModel([("status", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)]),
+    ],
+    "news": [
+        _unique_id(),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)]),
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING)]),
+        # /api/search: status prefix so only published articles are scanned; plain_text so markup never matches
+        IndexModel(
+            [("status", ASCENDING), ("title", TEXT), ("plain_text", TEXT)],
+            weights={"title": 10, "plain_text": 1},
+            default_language="english",
+            name="news_plain_text_search"
+        ),
+    ],
+    "blogs": [
+        _unique_id(),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)]),
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING)]),
+        # /api/blogs?category=&tag=; tags is an array, so the second index is multikey
+        IndexModel([("status", ASCENDING), ("category", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("status", ASCENDING), ("tags", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel(
+            [("status", ASCENDING), ("title", TEXT), ("tags", TEXT), ("excerpt", TEXT), ("plain_text", TEXT)],
+            weights={"title": 10, "tags": 6, "excerpt": 3, "plain_text": 1},
+            default_language="english",
+            name="blogs_plain_text_search"
+        ),
+    ],
+    "success_stories": _ordered_cms(),
+    "gallery_items": _ordered_cms(),
+    "testimonials": _ordered_cms(),
+    "impact_highlights": _ordered_cms(),
+    "leadership_team": [
+        _unique_id(),
+        IndexModel([("is_active", ASCENDING), ("category", ASCENDING), ("order", ASCENDING), ("created_at", DESCENDING)]),
+        IndexModel([("category", ASCENDING), ("order", ASCENDING), ("created_at", DESCENDING)]),
+    ],
+    "page_sections": _page_sections(),
+    "detailed_page_sections": _page_sections(),
+    # Summary reads: {"period": "day"|"month", "bucket": {"$gte": ...}}
+    "donation_rollups": [IndexModel([("period", ASCENDING), ("bucket", ASCENDING)])],
+    # Daily report snapshots are looked up by _id; expire them after a week
+    "analytics_reports": [IndexModel([("generated_at", ASCENDING)], expireAfterSeconds=7 * 24 * 3600)],
+    # Singleton documents read with find_one(sort=updated_at desc)
+    "site_content": [IndexModel([("updated_at", DESCENDING)])],
+    "site_settings": [IndexModel([("updated_at", DESCENDING)])],
+    "impact_stats": [IndexModel([("updated_at", DESCENDING)])],
+}
+
+# Indexes dropped from the registry that existing deployments still carry: collection -> index names
+RETIRED_INDEXES = {
+    # Prefixes of the (created_at, id) keyset indexes; text indexes over the HTML content
+    "donations": ["created_at_-1"],
+    "news": ["created_at_-1", "news_text_search"],
+    "blogs": ["blogs_text_search"],
+}
+
+# Changes whenever an index is added, removed or altered, so reconciliation reruns only then
+REGISTRY_VERSION = hashlib.sha1(repr([
+    [(collection_name, [index.document for index in indexes]) for collection_name, indexes in INDEX_REGISTRY.items()],
+    sorted(RETIRED_INDEXES.items()),
+]).encode("utf-8")).hexdigest()
+
+async def ensure_indexes(db) -> dict:
+    """Create every registered index and drop retired ones; existing identical indexes are a no-op"""
+    report = {"created": [], "dropped": [], "failed": []}
+    # Retired indexes go first: a collection holds one text index, so its replacement can only follow
+    for collection_name, names in RETIRED_INDEXES.items():
+        existing = await db[collection_name].index_information()
+        for name in names:
+            if name not in existing:
+                continue
+            try:
+                await db[collection_name].drop_index(name)
+                report["dropped"].append(f"{collection_name}.{name}")
+            except OperationFailure as e:
+                logger.error(f"Index {collection_name}.{name} could not be dropped: {e}")
+                report["failed"].append(f"{collection_name}.{name}")
+    for collection_name, indexes in INDEX_REGISTRY.items():
+        for index in indexes:
+            name = index.document["name"]
+            try:
+                await db[collection_name].create_indexes([index])
+                report["created"].append(f"{collection_name}.{name}")
+            except OperationFailure as e:
+                # Conflicting options or duplicate ids must not stop the worker from booting
+                logger.error(f"Index {collection_name}.{name} could not be applied: {e}")
+                report["failed"].append(f"{collection_name}.{name}")
+    logger.info(f"Index reconciliation finished: {len(report['created'])} ensured, {len(report['dropped'])} dropped, {len(report['failed'])} failed")
+    return report
@@ -49,6 +49,9 @@ class Volunteer(BaseModel):
 class NewsletterSubscribe(BaseModel):
     email: EmailStr
 
+class NewsletterBatchSubscribe(BaseModel):
+    emails: List[EmailStr] = Field(..., min_length=1, max_length=1000)
+
 class Newsletter(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     email: str
@@ -82,6 +85,7 @@ class News(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     title: str
     content: str
+    plain_text: str = ""  # content without markup, for excerpts
     status: str
     author: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -124,6 +128,7 @@ class Blog(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     title: str
     content: str
+    plain_text: str = ""  # content without markup, for search and snippets
     excerpt: str
     category: str
     tags: List[str] = []
@@ -168,6 +173,30 @@ class MessageResponse(BaseModel):
     message: str
     success: bool = True
 
+class BulkImportRequest(BaseModel):
+    items: List[dict] = Field(..., min_length=1, max_length=1000)
+    ordered: bool = False  # stop at the first failure instead of applying every valid item
+
+class ReorderRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=1000)  # item ids in their new display order
+    start: int = Field(default=1, ge=0)  # order value given to the first id
+
+class BulkImportResponse(BaseModel):
+    message: str
+    success: bool = True
+    inserted: int = 0
+    updated: int = 0
+    failed: int = 0
+    results: List[dict] = []
+
+class NewsletterBatchResponse(BaseModel):
+    message: str
+    success: bool = True
+    subscribed: int = 0
+    reactivated: int = 0
+    already_subscribed: int = 0
+    failed: List[str] = []
+
 class LoginResponse(BaseModel):
     message: str
     success: bool = True
@@ -0,0 +1,92 @@
+from fastapi import HTTPException
+from datetime import datetime
+from typing import Any, Optional, Tuple
+from bson import ObjectId
+from bson.errors import InvalidId
+import base64
+import json
+import os
+
+# Pagination Configuration
+DEFAULT_PAGE_SIZE = int(os.environ.get('DEFAULT_PAGE_SIZE', '50'))
+MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', '200'))
+
+# Projection expressions for shaping rows on the server (find projections accept them on MongoDB 4.4+)
+def field_or(field: str, default: Any = None) -> dict:
+    """Projection value equivalent to document.get(field, default); a null field also falls back"""
+    return {"$ifNull": [f"${field}", default]}
+
+# Documents created before UUIDs were assigned fall back to their ObjectId
+ID_OR_OBJECT_ID = {"$ifNull": ["$id", {"$toString": "$_id"}]}
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$d": value.isoformat()}
+    if isinstance(value, ObjectId):
+        return {"$o": str(value)}
+    return value
+
+def _load(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$d" in value:
+            return datetime.fromisoformat(value["$d"])
+        if "$o" in value:
+            return ObjectId(value["$o"])
+    return value
+
+def encode_cursor(sort_value: Any, doc_id: Any) -> str:
+    """Encode the (sort value, id) position of the last returned row as an opaque token"""
+    position = {"v": _dump(sort_value), "id": _dump(doc_id)}
+    raw = json.dumps(position, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return _load(position["v"]), _load(position["id"])
+    except (ValueError, KeyError, TypeError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+def keyset_query(query: dict, sort_field: str, cursor: Optional[str], tiebreaker: str = "id") -> dict:
+    """Restrict a query to rows strictly after the cursor in (sort_field desc, tiebreaker desc) order"""
+    if not cursor:
+        return query
+    sort_value, doc_id = decode_cursor(cursor)
+    if sort_field == tiebreaker:
+        after = {sort_field: {"$lt": sort_value}}
+    else:
+        after = {"$or": [
+            {sort_field: {"$lt": sort_value}},
+            {sort_field: sort_value, tiebreaker: {"$lt": doc_id}},
+        ]}
+    return {"$and": [query, after]} if query else after
+
+async def fetch_page(
+    collection,
+    query: dict,
+    sort_field: str = "created_at",
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    projection: Optional[dict] = None,
+    tiebreaker: str = "id",
+    cursor_fields: Optional[Tuple[str, str]] = None,
+):
+    """Fetch one page of documents and the cursor for the next page (None on the last page)"""
+    # cursor_fields names the projected sort value and tiebreaker when the projection renames them
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    sort = [(sort_field, -1)] if sort_field == tiebreaker else [(sort_field, -1), (tiebreaker, -1)]
+    documents = await collection.find(
+        keyset_query(query, sort_field, cursor, tiebreaker),
+        projection,
+        sort=sort
+    ).limit(limit + 1).to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        last = documents[-1]
+        sort_key, tiebreaker_key = cursor_fields or (sort_field, tiebreaker)
+        next_cursor = encode_cursor(last.get(sort_key), last.get(tiebreaker_key))
+    return documents, next_cursor
@@ -0,0 +1,199 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+import asyncio
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Reporting Configuration
+REPORT_BATCH_SIZE = int(os.environ.get('REPORT_BATCH_SIZE', '2000'))
+REPORT_COHORT_MONTHS = int(os.environ.get('REPORT_COHORT_MONTHS', '12'))
+# A recurring donor has churned once their last gift is this many intervals old
+CHURN_GRACE_INTERVALS = float(os.environ.get('CHURN_GRACE_INTERVALS', '1.5'))
+
+FREQUENCY_DAYS = {"monthly": 30, "quarterly": 91, "yearly": 365}
+EXCLUDED_DONATION_STATUSES = ["failed", "cancelled"]
+
+_report_lock = asyncio.Lock()
+
+async def load_frame(collection, fields: List[str], query: Optional[dict] = None) -> pd.DataFrame:
+    """Read only `fields` from a collection in batches into a columnar DataFrame"""
+    columns: Dict[str, list] = {field: [] for field in fields}
+    projection = {"_id": 0, **{field: 1 for field in fields}}
+    cursor = collection.find(query or {}, projection).batch_size(REPORT_BATCH_SIZE)
+    while True:
+        batch = await cursor.to_list(length=REPORT_BATCH_SIZE)
+        if not batch:
+            break
+        for field in fields:
+            columns[field].extend(document.get(field) for document in batch)
+    return pd.DataFrame(columns)
+
+def _month_index(dates: pd.Series) -> pd.Series:
+    return dates.dt.year * 12 + dates.dt.month - 1
+
+def _month_label(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+def cohort_retention(donations: pd.DataFrame) -> List[dict]:
+    """Share of each first-donation month's donors who gave again N months later"""
+    if donations.empty:
+        return []
+    month = _month_index(donations["created_at"])
+    first = month.groupby(donations["email"]).transform("min")
+    activity = pd.DataFrame({"cohort": first, "offset": month - first, "email": donations["email"]})
+    counts = activity.drop_duplicates().groupby(["cohort", "offset"]).size().unstack(fill_value=0)
+    # Months with no returning donors have no column yet
+    counts = counts.reindex(columns=range(int(month.max() - first.min()) + 1), fill_value=0)
+    counts = counts.sort_index().tail(REPORT_COHORT_MONTHS)
+    sizes = counts[0].to_numpy()
+    retention = np.round(counts.to_numpy() / sizes[:, None], 4)
+    return [
+        {
+            "cohort": _month_label(int(cohort)),
+            "donors": int(size),
+            # Offsets after the cohort's observable window are dropped instead of reported as 0
+            "retention": row[: int(month.max() - cohort) + 1].tolist(),
+        }
+        for cohort, size, row in zip(counts.index, sizes, retention)
+    ]
+
+def donor_lifetime_value(donations: pd.DataFrame) -> List[dict]:
+    """Per-currency distribution of total giving per donor"""
+    if donations.empty:
+        return []
+    donors = donations.groupby(["currency", "email"]).agg(
+        total=("amount", "sum"),
+        gifts=("amount", "size"),
+        first=("created_at", "min"),
+        last=("created_at", "max"),
+    )
+    donors["lifespan_days"] = (donors["last"] - donors["first"]).dt.days
+    result = []
+    for currency, group in donors.groupby(level="currency"):
+        totals = group["total"].to_numpy()
+        top_decile = np.sort(totals)[::-1][: max(1, len(totals) // 10)]
+        result.append({
+            "currency": currency,
+            "donors": int(len(group)),
+            "mean_ltv": round(float(totals.mean()), 2),
+            "median_ltv": round(float(np.median(totals)), 2),
+            "p90_ltv": round(float(np.percentile(totals, 90)), 2),
+            "mean_gifts": round(float(group["gifts"].mean()), 2),
+            "mean_gift_size": round(float(totals.sum() / group["gifts"].sum()), 2),
+            "mean_lifespan_days": round(float(group["lifespan_days"].mean()), 1),
+            "repeat_donor_share": round(float((group["gifts"] > 1).mean()), 4),
+            "top_decile_share": round(float(top_decile.sum() / totals.sum()), 4) if totals.sum() else 0,
+        })
+    return result
+
+def recurring_churn(donations: pd.DataFrame, now: datetime) -> dict:
+    """Recurring donors whose last gift is older than their frequency allows"""
+    recurring = donations[donations["recurring"].fillna(False).astype(bool)]
+    if recurring.empty:
+        return {"donors": 0, "churned": 0, "churn_rate": 0, "by_frequency": {}}
+    donors = recurring.groupby("email").agg(
+        last=("created_at", "max"),
+        frequency=("frequency", "last"),
+    )
+    frequency = donors["frequency"].fillna("monthly").str.lower()
+    frequency = frequency.where(frequency.isin(list(FREQUENCY_DAYS)), "monthly")
+    interval = frequency.map(FREQUENCY_DAYS).astype(float)
+    idle_days = (pd.Timestamp(now) - donors["last"]).dt.days
+    churned = idle_days > interval * CHURN_GRACE_INTERVALS
+    by_frequency = churned.groupby(frequency).agg(["size", "sum"])
+    return {
+        "donors": int(len(donors)),
+        "churned": int(churned.sum()),
+        "churn_rate": round(float(churned.mean()), 4),
+        "by_frequency": {
+            name: {"donors": int(row["size"]), "churned": int(row["sum"]), "churn_rate": round(float(row["sum"] / row["size"]), 4)}
+            for name, row in by_frequency.iterrows()
+        },
+    }
+
+def _distribution(values: pd.Series) -> List[dict]:
+    counts = values.dropna().value_counts()
+    total = counts.sum()
+    return [
+        {"value": str(value), "count": int(count), "share": round(float(count / total), 4)}
+        for value, count in counts.items()
+    ]
+
+def volunteer_interests(volunteers: pd.DataFrame) -> dict:
+    """How often each interest and availability option is chosen"""
+    if volunteers.empty:
+        return {"volunteers": 0, "interests": [], "availability": []}
+    return {
+        "volunteers": int(len(volunteers)),
+        "interests": _distribution(volunteers["interests"].explode()),
+        "availability": _distribution(volunteers["availability"]),
+    }
+
+def contact_activity(contacts: pd.DataFrame) -> dict:
+    """Inquiry type mix and monthly contact volume"""
+    if contacts.empty:
+        return {"contacts": 0, "inquiry_types": [], "monthly": []}
+    monthly = _month_index(contacts["created_at"]).value_counts().sort_index().tail(REPORT_COHORT_MONTHS)
+    return {
+        "contacts": int(len(contacts)),
+        "inquiry_types": _distribution(contacts["inquiry_type"]),
+        "monthly": [{"month": _month_label(int(month)), "count": int(count)} for month, count in monthly.items()],
+    }
+
+def _compute(donations: pd.DataFrame, volunteers: pd.DataFrame, contacts: pd.DataFrame, now: datetime) -> dict:
+    for frame in (donations, volunteers, contacts):
+        frame["created_at"] = pd.to_datetime(frame["created_at"])
+    donations["amount"] = pd.to_numeric(donations["amount"], errors="coerce").fillna(0.0)
+    donations["email"] = donations["email"].astype("string").str.lower()
+    donations["currency"] = donations["currency"].fillna("INR")
+    return {
+        "cohort_retention": cohort_retention(donations),
+        "donor_lifetime_value": donor_lifetime_value(donations),
+        "recurring_churn": recurring_churn(donations, now),
+        "volunteer_interests": volunteer_interests(volunteers),
+        "contacts": contact_activity(contacts),
+    }
+
+async def build_reports(db) -> dict:
+    """Load the source collections and compute every report"""
+    donations, volunteers, contacts = await asyncio.gather(
+        load_frame(
+            db.donations,
+            ["email", "amount", "currency", "recurring", "frequency", "created_at"],
+            {"status": {"$nin": EXCLUDED_DONATION_STATUSES}}
+        ),
+        load_frame(db.volunteers, ["interests", "availability", "created_at"]),
+        load_frame(db.contacts, ["inquiry_type", "created_at"]),
+    )
+    now = datetime.utcnow()
+    # The DataFrame work is CPU-bound; keep it off the event loop
+    reports = await asyncio.to_thread(_compute, donations, volunteers, contacts, now)
+    reports["generated_at"] = now.isoformat()
+    return reports
+
+async def daily_reports(db, refresh: bool = False) -> dict:
+    """Return today's reports, computing them at most once per day across all workers"""
+    day = datetime.utcnow().strftime("%Y-%m-%d")
+    if not refresh:
+        cached = await db.analytics_reports.find_one({"_id": day})
+        if cached:
+            return cached["reports"]
+    async with _report_lock:
+        # Another request in this worker may have finished the build while we waited
+        if not refresh:
+            cached = await db.analytics_reports.find_one({"_id": day})
+            if cached:
+                return cached["reports"]
+        reports = await build_reports(db)
+        await db.analytics_reports.replace_one(
+            {"_id": day},
+            {"reports": reports, "generated_at": datetime.utcnow()},
+            upsert=True
+        )
+        logger.info(f"Analytics reports generated for {day}")
+        return reports
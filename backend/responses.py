@@ -0,0 +1,31 @@
+from bson import ObjectId
+from decimal import Decimal
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from typing import Any
+import orjson
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+def _default(value: Any) -> Any:
+    """Encode the types orjson has no native support for"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def dumps(content: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON; datetimes, UUIDs and ObjectIds need no pre-conversion"""
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+class APIJSONResponse(ORJSONResponse):
+    """App-wide JSON response rendered by orjson"""
+
+    # Handlers that return an instance directly also skip FastAPI's jsonable_encoder pass
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
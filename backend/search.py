@@ -0,0 +1,166 @@
+from typing import List, Optional
+import asyncio
+import html
+import os
+import re
+
+from cache import TTLCache, cms_cache
+from pagination import keyset_query, encode_cursor
+
+# Search Configuration
+SEARCH_PAGE_SIZE = int(os.environ.get('SEARCH_PAGE_SIZE', '10'))
+SEARCH_MAX_PAGE_SIZE = int(os.environ.get('SEARCH_MAX_PAGE_SIZE', '50'))
+SNIPPET_LENGTH = int(os.environ.get('SEARCH_SNIPPET_LENGTH', '200'))
+SEARCH_CACHE_MAX_ENTRIES = int(os.environ.get('SEARCH_CACHE_MAX_ENTRIES', '128'))
+SEARCH_CACHE_TTL_SECONDS = float(os.environ.get('SEARCH_CACHE_TTL_SECONDS', '60'))
+
+# Searchable collections: fields shown in hits, fields scanned for the snippet.
+# Snippets come from plain_text (content without markup), never from the HTML itself.
+SEARCH_SOURCES = {
+    "blogs": {
+        "fields": {"id": 1, "title": 1, "excerpt": 1, "plain_text": 1, "category": 1, "tags": 1, "image": 1, "author": 1, "created_at": 1},
+        "snippet_fields": ["excerpt", "plain_text"],
+    },
+    "news": {
+        "fields": {"id": 1, "title": 1, "plain_text": 1, "author": 1, "created_at": 1},
+        "snippet_fields": ["plain_text"],
+    },
+}
+
+# Result pages are keyed by arbitrary query strings, so they get their own small cache
+# instead of competing with (and evicting) the CMS entries in cms_cache
+search_cache = TTLCache(max_entries=SEARCH_CACHE_MAX_ENTRIES, ttl_seconds=SEARCH_CACHE_TTL_SECONDS)
+
+def _sources_changed(namespaces: set) -> None:
+    if "search" in namespaces or namespaces.intersection(SEARCH_SOURCES):
+        search_cache.clear()
+
+cms_cache.add_listener(_sources_changed)
+
+def search_terms(q: str) -> List[str]:
+    """Positive terms of a $text query, used for highlighting (negations are dropped)"""
+    terms = []
+    for phrase in re.findall(r'"([^"]+)"', q):
+        terms.append(phrase.strip())
+    for word in re.sub(r'"[^"]*"', " ", q).split():
+        if not word.startswith("-"):
+            terms.append(word)
+    return [term for term in terms if term]
+
+def _term_pattern(terms: List[str]) -> Optional[re.Pattern]:
+    if not terms:
+        return None
+    # Match word prefixes so stemmed hits ("volunteering" for "volunteer") still highlight
+    alternatives = sorted((re.escape(term) for term in terms), key=len, reverse=True)
+    return re.compile(r"\b(?:" + "|".join(alternatives) + r")\w*", re.IGNORECASE)
+
+def highlight(text: str, pattern: Optional[re.Pattern]) -> str:
+    """HTML-escape text and wrap matched terms in <mark>"""
+    if not pattern:
+        return html.escape(text)
+    parts = []
+    last = 0
+    for match in pattern.finditer(text):
+        parts.append(html.escape(text[last:match.start()]))
+        parts.append("<mark>" + html.escape(match.group(0)) + "</mark>")
+        last = match.end()
+    parts.append(html.escape(text[last:]))
+    return "".join(parts)
+
+def make_snippet(texts: List[str], terms: List[str], length: int = SNIPPET_LENGTH) -> str:
+    """Pick a window of about `length` characters around the first matched term"""
+    pattern = _term_pattern(terms)
+    texts = [text for text in texts if text]
+    if not texts:
+        return ""
+    source, start = texts[0], 0
+    if pattern:
+        for text in texts:
+            match = pattern.search(text)
+            if match:
+                source, start = text, max(0, match.start() - length // 4)
+                break
+    # Snap the window to word boundaries
+    if start > 0:
+        space = source.rfind(" ", 0, start)
+        start = space + 1 if space != -1 else start
+    end = min(len(source), start + length)
+    if end < len(source):
+        space = source.rfind(" ", start, end)
+        end = space if space > start else end
+    window = source[start:end].strip()
+    snippet = highlight(window, pattern)
+    if start > 0:
+        snippet = "…" + snippet
+    if end < len(source):
+        snippet = snippet + "…"
+    return snippet
+
+def _ranked_stage(q: str) -> List[dict]:
+    # $text must be the first stage; status shares the text index prefix
+    return [
+        {"$match": {"status": "published", "$text": {"$search": q}}},
+        {"$project": {"_id": 0, "id": 1, "score": {"$meta": "textScore"}}},
+    ]
+
+async def search_content(db, q: str, sources: List[str], cursor: Optional[str] = None, limit: int = SEARCH_PAGE_SIZE):
+    """Rank published blogs/news by text score and return one page of hits with snippets"""
+    limit = max(1, min(limit, SEARCH_MAX_PAGE_SIZE))
+
+    # Phase 1: rank ids only, so the sort never carries full documents
+    first, rest = sources[0], sources[1:]
+    pipeline = _ranked_stage(q) + [{"$addFields": {"type": first}}]
+    for source in rest:
+        pipeline.append({"$unionWith": {
+            "coll": source,
+            "pipeline": _ranked_stage(q) + [{"$addFields": {"type": source}}]
+        }})
+    after = keyset_query({}, "score", cursor, tiebreaker="id")
+    if after:
+        pipeline.append({"$match": after})
+    pipeline += [{"$sort": {"score": -1, "id": -1}}, {"$limit": limit + 1}]
+    ranked = await db[first].aggregate(pipeline).to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(ranked) > limit:
+        ranked = ranked[:limit]
+        next_cursor = encode_cursor(ranked[-1]["score"], ranked[-1]["id"])
+
+    # Phase 2: load the page's documents, one query per collection
+    ids_by_source = {}
+    for hit in ranked:
+        ids_by_source.setdefault(hit["type"], []).append(hit["id"])
+
+    async def load(source, ids):
+        documents = await db[source].find(
+            {"id": {"$in": ids}}, {"_id": 0, **SEARCH_SOURCES[source]["fields"]}
+        ).to_list(length=len(ids))
+        return source, {document["id"]: document for document in documents}
+
+    loaded = dict(await asyncio.gather(*(load(source, ids) for source, ids in ids_by_source.items())))
+
+    terms = search_terms(q)
+    hits = []
+    for hit in ranked:
+        document = loaded.get(hit["type"], {}).get(hit["id"])
+        if not document:
+            continue
+        snippet_texts = [document.get(field, "") for field in SEARCH_SOURCES[hit["type"]]["snippet_fields"]]
+        result = {
+            "type": hit["type"],
+            "id": document["id"],
+            "title": document.get("title", ""),
+            "title_highlighted": highlight(document.get("title", ""), _term_pattern(terms)),
+            "snippet": make_snippet(snippet_texts, terms),
+            "author": document.get("author", "Unknown"),
+            "date": document.get("created_at"),
+            "score": round(hit["score"], 4),
+        }
+        if hit["type"] == "blogs":
+            result.update({
+                "category": document.get("category", ""),
+                "tags": document.get("tags", []),
+                "image": document.get("image"),
+            })
+        hits.append(result)
+    return hits, next_cursor
@@ -1,22 +1,38 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, InsertOne, UpdateOne
+from pydantic import ValidationError
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from datetime import datetime
 import os
 import logging
 from pathlib import Path
 import asyncio
+import functools
 import uuid
 
 # Import custom modules
 from models import *
 from auth import *
-from database import db, init_database
+from database import db, init_database, get_all_collection_stats, collection_exists, connect_to_mongo, close_mongo_connection, pool_stats, startup_state, STARTUP_MODE
+from cache import cms_cache
+from http_cache import conditional_response, snapshot_publisher, touch_collection
+from compression import CompressionMiddleware, compression_stats
+from responses import APIJSONResponse
+from pagination import fetch_page, field_or, ID_OR_OBJECT_ID, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from exports import EXPORT_COLLECTIONS, EXPORT_BATCH_SIZE, stream_csv, stream_ndjson
+from analytics import record_donation, remove_donation, move_donation_status, rebuild_rollups, donation_summary
+from reports import daily_reports
+from write_buffer import write_buffer
+from html_text import html_to_text
+from search import search_content, search_cache, SEARCH_SOURCES, SEARCH_PAGE_SIZE, SEARCH_MAX_PAGE_SIZE
 
 ROOT_DIR = Path(__file__).parent
 
 # Create the main app
-app = FastAPI(title="Shield Foundation API", version="1.0.0")
+app = FastAPI(title="Shield Foundation API", version="1.0.0", default_response_class=APIJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -30,6 +46,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON/text responses (br or gzip); cached public payloads arrive precompressed
+app.add_middleware(CompressionMiddleware)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -40,13 +59,38 @@ logger = logging.getLogger(__name__)
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
-    await init_database()
+    connect_to_mongo()
+    if STARTUP_MODE == "blocking":
+        await init_database(after_bootstrap=snapshot_publisher.publish_all)
+    else:
+        # Serve liveness immediately; /api/ready reports when bootstrap has finished
+        app.state.bootstrap_task = asyncio.create_task(run_bootstrap())
+
+async def run_bootstrap():
+    try:
+        # Snapshots are published once, by the worker that holds the bootstrap lock
+        await init_database(after_bootstrap=snapshot_publisher.publish_all)
+    except Exception:
+        # Already logged and recorded in startup_state for the readiness probe
+        pass
 
 # Health check endpoint
 @api_router.get("/")
 async def root():
     return {"message": "Shield Foundation API is running", "status": "healthy"}
 
+# Readiness probe: 503 until defaults are seeded and index reconciliation has finished
+@api_router.get("/ready")
+async def readiness():
+    ready = startup_state["seeded"] and startup_state["indexes_ready"]
+    # Failed index builds are reported (and retried on the next bootstrap) without taking the worker
+    # out of rotation: queries still work, only slower
+    degraded = startup_state["seeded"] and bool(startup_state["index_failures"])
+    return APIJSONResponse(
+        status_code=status.HTTP_200_OK if ready or degraded else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "ready" if ready else "degraded" if degraded else "starting", **startup_state}
+    )
+
 # PUBLIC ENDPOINTS
 
 @api_router.post("/contact", response_model=MessageResponse)
@@ -54,7 +98,7 @@ async def submit_contact_form(contact_data: ContactCreate):
     """Submit a contact form"""
     try:
         contact = Contact(**contact_data.dict())
-        await db.contacts.insert_one(contact.dict())
+        await write_buffer.insert("contacts", contact.dict())
         logger.info(f"New contact form submitted: {contact.email}")
         return MessageResponse(message="Thank you for your message. We will get back to you soon!")
     except Exception as e:
@@ -66,7 +110,7 @@ async def submit_volunteer_form(volunteer_data: VolunteerCreate):
     """Submit a volunteer application"""
     try:
         volunteer = Volunteer(**volunteer_data.dict())
-        await db.volunteers.insert_one(volunteer.dict())
+        await write_buffer.insert("volunteers", volunteer.dict())
         logger.info(f"New volunteer application: {volunteer.email}")
         return MessageResponse(message="Thank you for registering as a volunteer!")
     except Exception as e:
@@ -78,54 +122,110 @@ async def submit_donation(donation_data: DonationCreate):
     """Submit a donation"""
     try:
         donation = Donation(**donation_data.dict())
-        await db.donations.insert_one(donation.dict())
+        await write_buffer.insert("donations", donation.dict())
+        await record_donation(db, donation.dict())
         logger.info(f"New donation received: {donation.email} - {donation.currency} {donation.amount}")
         return MessageResponse(message="Thank you for your generous donation! We will process it shortly.")
     except Exception as e:
         logger.error(f"Donation submission failed: {e}")
         raise HTTPException(status_code=500, detail="Failed to submit donation")
 
+def newsletter_upsert(email: str, now: datetime) -> tuple:
+    """Filter and pipeline update that subscribes an email in one round trip"""
+    return {"email": email}, [{"$set": {
+        "id": {"$ifNull": ["$id", str(uuid.uuid4())]},
+        # Keep the original date for active subscribers; new and reactivated ones start now
+        "subscribed_at": {"$cond": [{"$eq": ["$is_active", True]}, "$subscribed_at", now]},
+        "is_active": True,
+    }}]
+
 @api_router.post("/newsletter/subscribe", response_model=MessageResponse)
 async def subscribe_newsletter(newsletter_data: NewsletterSubscribe):
     """Subscribe to newsletter"""
     try:
-        # Check if email already exists
-        existing = await db.newsletters.find_one({"email": newsletter_data.email})
+        query, update = newsletter_upsert(newsletter_data.email, datetime.utcnow())
+        try:
+            existing = await db.newsletters.find_one_and_update(
+                query, update, upsert=True, return_document=ReturnDocument.BEFORE
+            )
+        except DuplicateKeyError:
+            # A concurrent sign-up for the same email inserted first; ours now matches it
+            existing = await db.newsletters.find_one_and_update(
+                query, update, upsert=True, return_document=ReturnDocument.BEFORE
+            )
+        
         if existing:
             if existing.get("is_active"):
                 return MessageResponse(message="You are already subscribed to our newsletter!")
-            else:
-                # Reactivate subscription
-                await db.newsletters.update_one(
-                    {"email": newsletter_data.email},
-                    {"$set": {"is_active": True, "subscribed_at": datetime.utcnow()}}
-                )
-                return MessageResponse(message="Welcome back! Your newsletter subscription has been reactivated.")
-        
-        newsletter = Newsletter(**newsletter_data.dict())
-        await db.newsletters.insert_one(newsletter.dict())
-        logger.info(f"New newsletter subscription: {newsletter.email}")
+            return MessageResponse(message="Welcome back! Your newsletter subscription has been reactivated.")
+        
+        logger.info(f"New newsletter subscription: {newsletter_data.email}")
         return MessageResponse(message="Successfully subscribed to newsletter!")
     except Exception as e:
         logger.error(f"Newsletter subscription failed: {e}")
         raise HTTPException(status_code=500, detail="Failed to subscribe to newsletter")
 
+@api_router.post("/newsletter/subscribe-batch", response_model=NewsletterBatchResponse)
+async def subscribe_newsletter_batch(batch_data: NewsletterBatchSubscribe, current_user: dict = Depends(admin_required)):
+    """Import newsletter subscribers in a single bulk write"""
+    try:
+        emails = list(dict.fromkeys(batch_data.emails))
+        now = datetime.utcnow()
+        operations = [UpdateOne(*newsletter_upsert(email, now), upsert=True) for email in emails]
+        
+        failed = []
+        try:
+            result = await db.newsletters.bulk_write(operations, ordered=False)
+            bulk = result.bulk_api_result
+        except BulkWriteError as e:
+            bulk = e.details
+            failed = [emails[error["index"]] for error in bulk.get("writeErrors", [])]
+        
+        subscribed = bulk.get("nUpserted", 0)
+        # Pipeline updates only modify documents that were inactive
+        reactivated = bulk.get("nModified", 0)
+        already_subscribed = bulk.get("nMatched", 0) - reactivated
+        
+        logger.info(f"Newsletter import by {current_user['username']}: {subscribed} new, {reactivated} reactivated, {len(failed)} failed")
+        return NewsletterBatchResponse(
+            message=f"Imported {len(emails)} newsletter subscribers",
+            subscribed=subscribed,
+            reactivated=reactivated,
+            already_subscribed=already_subscribed,
+            failed=failed
+        )
+    except Exception as e:
+        logger.error(f"Newsletter import failed: {e}")
+        raise HTTPException(status_code=500, detail="Failed to import newsletter subscribers")
+
+# Listing pages only need summary fields; full bodies are served by the detail endpoints.
+# Rows are shaped by the projection itself (renames and defaults) and returned as-is;
+# datetimes are left to the response encoder.
+NEWS_EXCERPT_LENGTH = 300
+NEWS_SUMMARY_PROJECTION = {
+    "_id": 0, "id": ID_OR_OBJECT_ID, "title": 1, "status": 1,
+    # plain_text is the content without markup, so the cut never lands inside a tag
+    "excerpt": {"$substrCP": [{"$ifNull": ["$plain_text", ""]}, 0, NEWS_EXCERPT_LENGTH]},
+    "author": field_or("author", "Unknown"),
+    "date": field_or("created_at"),
+}
+BLOG_SUMMARY_PROJECTION = {
+    "_id": 0, "id": ID_OR_OBJECT_ID, "title": 1, "author": 1, "status": 1,
+    "excerpt": field_or("excerpt", ""),
+    "category": field_or("category", ""),
+    "tags": field_or("tags", []),
+    "image": field_or("image"),
+    "publishDate": field_or("created_at"),
+}
+
+async def load_published_news():
+    return await db.news.find({"status": "published"}, NEWS_SUMMARY_PROJECTION).sort("created_at", -1).to_list(length=None)
+
 @api_router.get("/news")
-async def get_published_news():
-    """Get all published news articles"""
-    try:
-        news_cursor = db.news.find({"status": "published"}).sort("created_at", -1)
-        news_list = []
-        async for news_item in news_cursor:
-            news_list.append({
-                "id": news_item.get("id", str(news_item["_id"])),
-                "title": news_item["title"],
-                "content": news_item["content"],
-                "author": news_item.get("author", "Unknown"),
-                "status": news_item["status"],
-                "date": news_item.get("created_at").isoformat() if news_item.get("created_at") else None,
-            })
-        return news_list
+async def get_published_news(request: Request):
+    """Get summaries of all published news articles"""
+    try:
+        return await conditional_response(request, "news", "published", load_published_news)
     except Exception as e:
         logger.error(f"Failed to fetch news: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch news")
@@ -138,14 +238,14 @@ async def get_news_by_id(news_id: str):
         if not news_item:
             raise HTTPException(status_code=404, detail="News not found")
 
-        return {
-            "id": news_item.get("id", str(news_item["_id"])),
+        return APIJSONResponse({
+            "id": news_item.get("id", news_item["_id"]),
             "title": news_item["title"],
             "content": news_item["content"],
             "author": news_item.get("author", "Unknown"),
             "status": news_item["status"],
-            "date": news_item["created_at"].isoformat() if news_item.get("created_at") else None,
-        }
+            "date": news_item.get("created_at"),
+        })
     except HTTPException:
         raise  # re-raise so FastAPI sends the correct response
     except Exception as e:
@@ -156,30 +256,80 @@ async def get_news_by_id(news_id: str):
 
 # BLOG ENDPOINTS
 
+async def load_published_blogs(category: Optional[str] = None, tag: Optional[str] = None):
+    query = {"status": "published"}
+    if category:
+        query["category"] = category
+    if tag:
+        query["tags"] = tag
+
+    return await db.blogs.find(query, BLOG_SUMMARY_PROJECTION).sort("created_at", -1).to_list(length=None)
+
 @api_router.get("/blogs")
-async def get_published_blogs():
-    """Get all published blogs (public endpoint)"""
-    try:
-        blogs_cursor = db.blogs.find({"status": "published"}).sort("created_at", -1)
-        blogs_list = []
-        async for blog_item in blogs_cursor:
-            blogs_list.append({
-            "id": blog_item.get("id", str(blog_item["_id"])),
-            "title": blog_item["title"],
-            "excerpt": blog_item.get("excerpt", ""),
-            "content": blog_item["content"],
-            "category": blog_item.get("category", ""),
-            "tags": blog_item.get("tags", []),
-            "image": blog_item.get("image"),
-            "author": blog_item["author"],
-            "publishDate": blog_item["created_at"].isoformat() if blog_item.get("created_at") else None,
-            "status": blog_item["status"]
-            })
-        return blogs_list
+async def get_published_blogs(
+    request: Request,
+    category: Optional[str] = Query(None, max_length=50),
+    tag: Optional[str] = Query(None, max_length=50)
+):
+    """Get summaries of published blogs, optionally filtered by category and tag (public endpoint)"""
+    try:
+        if category or tag:
+            facets = await load_blog_facets()
+            known = (
+                (not category or any(item["name"] == category for item in facets["categories"]))
+                and (not tag or any(item["name"] == tag for item in facets["tags"]))
+            )
+            if not known:
+                # Values no published blog carries match nothing; answering uncached keeps
+                # arbitrary query strings out of cms_cache
+                return APIJSONResponse([])
+        return await conditional_response(
+            request, "blogs", ("published", category, tag), lambda: load_published_blogs(category, tag)
+        )
     except Exception as e:
         logger.error(f"Failed to fetch blogs: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch blogs")
 
+async def aggregate_blog_facets():
+    # One pass over the published blogs; the result is cached until the next blog write
+    pipeline = [
+        {"$match": {"status": "published"}},
+        {"$project": {"_id": 0, "category": 1, "tags": 1}},
+        {"$facet": {
+            "categories": [
+                {"$group": {"_id": "$category", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1, "_id": 1}}
+            ],
+            "tags": [
+                {"$unwind": "$tags"},
+                {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1, "_id": 1}}
+            ],
+            "total": [{"$count": "count"}]
+        }}
+    ]
+    result = await db.blogs.aggregate(pipeline).to_list(length=1)
+    facets = result[0] if result else {}
+    total = facets.get("total") or [{"count": 0}]
+    return {
+        "categories": [{"name": item["_id"], "count": item["count"]} for item in facets.get("categories", []) if item["_id"]],
+        "tags": [{"name": item["_id"], "count": item["count"]} for item in facets.get("tags", []) if item["_id"]],
+        "total": total[0]["count"]
+    }
+
+async def load_blog_facets():
+    # Also validates /api/blogs filters, so the counts are cached on their own as well as encoded
+    return await cms_cache.get_or_load("blogs", "facet_counts", aggregate_blog_facets)
+
+@api_router.get("/blogs/facets")
+async def get_blog_facets(request: Request):
+    """Get category and tag counts for published blogs (public endpoint)"""
+    try:
+        return await conditional_response(request, "blogs", "facets", load_blog_facets)
+    except Exception as e:
+        logger.error(f"Failed to fetch blog facets: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch blog facets")
+
 @api_router.get("/blogs/{blog_id}")
 async def get_blog(blog_id: str):
     """Get a single published blog by ID (public endpoint)"""
@@ -188,8 +338,8 @@ async def get_blog(blog_id: str):
         if not blog_item:
             raise HTTPException(status_code=404, detail="Blog not found")
 
-        return {
-            "id": blog_item.get("id", str(blog_item["_id"])),
+        return APIJSONResponse({
+            "id": blog_item.get("id", blog_item["_id"]),
             "title": blog_item["title"],
             "excerpt": blog_item.get("excerpt", ""),
             "content": blog_item["content"],
@@ -197,36 +347,70 @@ async def get_blog(blog_id: str):
             "tags": blog_item.get("tags", []),
             "image": blog_item.get("image"),
             "author": blog_item["author"],
-            "publishDate": blog_item["created_at"].isoformat() if blog_item.get("created_at") else None,
+            "publishDate": blog_item.get("created_at"),
             "status": blog_item["status"]
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Failed to fetch blog {blog_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch blog")
 
+# SEARCH ENDPOINT
+
+@api_router.get("/search")
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=2, max_length=200),
+    type: str = Query("all", pattern="^(all|blogs|news)$"),
+    cursor: Optional[str] = None,
+    limit: int = Query(SEARCH_PAGE_SIZE, ge=1, le=SEARCH_MAX_PAGE_SIZE)
+):
+    """Full-text search over published blogs and news, ranked by relevance (public endpoint)"""
+    try:
+        query = " ".join(q.split())
+        sources = ["blogs", "news"] if type == "all" else [type]
+
+        async def load():
+            hits, next_cursor = await search_content(db, query, sources, cursor, limit)
+            return {"query": query, "items": hits, "next_cursor": next_cursor, "limit": limit}
+
+        # Cached as encoded bytes in search's own bounded cache; invalidation comes from its cms_cache
+        # listener, so no Last-Modified lookups, and compressed copies are not kept per query
+        return await conditional_response(
+            request, "search", (query.lower(), type, cursor, limit), load, sources=[],
+            cache=search_cache, keep_variants=False
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Search failed for {q!r}: {e}")
+        raise HTTPException(status_code=500, detail="Search failed")
+
 
 
+async def load_impact_stats():
+    stats = await db.impact_stats.find_one({}, sort=[("updated_at", -1)])
+    if not stats:
+        # Return default stats if none exist
+        return {
+            "youthTrained": 1300,
+            "youthPlaced": 1000, 
+            "seniorsSupported": 6000,
+            "womenEmpowered": 200
+        }
+    return {
+        "youthTrained": stats.get("youth_trained", 1300),
+        "youthPlaced": stats.get("youth_placed", 1000),
+        "seniorsSupported": stats.get("seniors_supported", 6000),
+        "womenEmpowered": stats.get("women_empowered", 200)
+    }
+
 @api_router.get("/impact-stats")
-async def get_impact_stats():
+async def get_impact_stats(request: Request):
     """Get current impact statistics"""
     try:
-        stats = await db.impact_stats.find_one({}, sort=[("updated_at", -1)])
-        if not stats:
-            # Return default stats if none exist
-            return {
-                "youthTrained": 1300,
-                "youthPlaced": 1000, 
-                "seniorsSupported": 6000,
-                "womenEmpowered": 200
-            }
-        return {
-            "youthTrained": stats.get("youth_trained", 1300),
-            "youthPlaced": stats.get("youth_placed", 1000),
-            "seniorsSupported": stats.get("seniors_supported", 6000),
-            "womenEmpowered": stats.get("women_empowered", 200)
-        }
+        return await conditional_response(request, "impact_stats", "public", load_impact_stats)
     except Exception as e:
         logger.error(f"Failed to fetch impact stats: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch impact statistics")
@@ -238,7 +422,7 @@ async def admin_login(login_data: AdminLogin):
     """Admin login"""
     try:
         admin_user = await db.admin_users.find_one({"username": login_data.username})
-        if not admin_user or not verify_password(login_data.password, admin_user["password"]):
+        if not admin_user or not await verify_password_async(login_data.password, admin_user["password"]):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials"
@@ -276,101 +460,139 @@ async def admin_login(login_data: AdminLogin):
         logger.error(f"Admin login failed: {e}")
         raise HTTPException(status_code=500, detail="Login failed")
 
+# Admin list rows, shaped server-side like the public summaries
+CONTACT_LIST_PROJECTION = {
+    "_id": 0, "id": ID_OR_OBJECT_ID, "name": 1, "email": 1, "subject": 1, "message": 1, "created_at": 1,
+    "phone": field_or("phone"),
+    "inquiry_type": field_or("inquiry_type"),
+    "status": field_or("status", "new"),
+}
+VOLUNTEER_LIST_PROJECTION = {
+    "_id": 0, "id": ID_OR_OBJECT_ID, "name": 1, "email": 1, "phone": 1,
+    "availability": 1, "interests": 1, "created_at": 1,
+    "skills": field_or("skills"),
+    "experience": field_or("experience"),
+    "status": field_or("status", "pending"),
+}
+NEWSLETTER_LIST_PROJECTION = {
+    "_id": 0, "id": ID_OR_OBJECT_ID, "email": 1, "subscribed_at": 1, "is_active": 1,
+}
+DONATION_LIST_PROJECTION = {
+    "_id": 0, "id": ID_OR_OBJECT_ID, "name": 1, "email": 1, "amount": 1, "currency": 1,
+    "payment_method": 1, "created_at": 1, "updated_at": 1,
+    "phone": field_or("phone"),
+    "message": field_or("message"),
+    "anonymous": field_or("anonymous", False),
+    "recurring": field_or("recurring", False),
+    "frequency": field_or("frequency"),
+    "status": field_or("status", "pending"),
+    "payment_reference": field_or("payment_reference"),
+    "notes": field_or("notes"),
+}
+NEWS_ADMIN_PROJECTION = {
+    "_id": 0, "id": ID_OR_OBJECT_ID, "title": 1, "content": 1, "status": 1, "author": 1,
+    "date": "$created_at",
+    "updated_at": field_or("updated_at", "$created_at"),
+}
+BLOG_ADMIN_PROJECTION = {
+    "_id": 0, "id": ID_OR_OBJECT_ID, "title": 1, "content": 1, "status": 1, "author": 1,
+    "excerpt": field_or("excerpt", ""),
+    "category": field_or("category", ""),
+    "tags": field_or("tags", []),
+    "image": field_or("image"),
+    "date": "$created_at",
+    "updated_at": field_or("updated_at", "$created_at"),
+}
+
 @api_router.get("/admin/contacts")
-async def get_contacts(current_user: dict = Depends(admin_required)):
-    """Get all contact form submissions"""
-    try:
-        contacts_cursor = db.contacts.find({}).sort("created_at", -1)
-        contacts_list = []
-        async for contact in contacts_cursor:
-            contacts_list.append({
-                "id": contact.get("id", str(contact["_id"])),
-                "name": contact["name"],
-                "email": contact["email"],
-                "phone": contact.get("phone"),
-                "subject": contact["subject"],
-                "message": contact["message"],
-                "inquiry_type": contact.get("inquiry_type"),
-                "created_at": contact["created_at"].isoformat(),
-                "status": contact.get("status", "new")
-            })
-        return contacts_list
+async def get_contacts(cursor: Optional[str] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), current_user: dict = Depends(admin_required)):
+    """Get contact form submissions, newest first, one page at a time"""
+    try:
+        contacts, next_cursor = await fetch_page(
+            db.contacts, {}, "created_at", cursor, limit, projection=CONTACT_LIST_PROJECTION
+        )
+        return APIJSONResponse({"items": contacts, "next_cursor": next_cursor, "limit": limit})
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch contacts: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch contacts")
 
 @api_router.get("/admin/volunteers")
-async def get_volunteers(current_user: dict = Depends(admin_required)):
-    """Get all volunteer applications"""
-    try:
-        volunteers_cursor = db.volunteers.find({}).sort("created_at", -1)
-        volunteers_list = []
-        async for volunteer in volunteers_cursor:
-            volunteers_list.append({
-                "id": volunteer.get("id", str(volunteer["_id"])),
-                "name": volunteer["name"],
-                "email": volunteer["email"],
-                "phone": volunteer["phone"],
-                "skills": volunteer.get("skills"),
-                "availability": volunteer["availability"],
-                "interests": volunteer["interests"],
-                "experience": volunteer.get("experience"),
-                "created_at": volunteer["created_at"].isoformat(),
-                "status": volunteer.get("status", "pending")
-            })
-        return volunteers_list
+async def get_volunteers(cursor: Optional[str] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), current_user: dict = Depends(admin_required)):
+    """Get volunteer applications, newest first, one page at a time"""
+    try:
+        volunteers, next_cursor = await fetch_page(
+            db.volunteers, {}, "created_at", cursor, limit, projection=VOLUNTEER_LIST_PROJECTION
+        )
+        return APIJSONResponse({"items": volunteers, "next_cursor": next_cursor, "limit": limit})
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch volunteers: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch volunteers")
 
 @api_router.get("/admin/newsletters")
-async def get_newsletter_subscribers(current_user: dict = Depends(admin_required)):
-    """Get all newsletter subscribers"""
-    try:
-        newsletters_cursor = db.newsletters.find({"is_active": True}).sort("subscribed_at", -1)
-        newsletters_list = []
-        async for newsletter in newsletters_cursor:
-            newsletters_list.append({
-                "id": newsletter.get("id", str(newsletter["_id"])),
-                "email": newsletter["email"],
-                "subscribed_at": newsletter["subscribed_at"].isoformat(),
-                "is_active": newsletter["is_active"]
-            })
-        return newsletters_list
+async def get_newsletter_subscribers(cursor: Optional[str] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), current_user: dict = Depends(admin_required)):
+    """Get active newsletter subscribers, newest first, one page at a time"""
+    try:
+        newsletters, next_cursor = await fetch_page(
+            db.newsletters, {"is_active": True}, "subscribed_at", cursor, limit, projection=NEWSLETTER_LIST_PROJECTION
+        )
+        return APIJSONResponse({"items": newsletters, "next_cursor": next_cursor, "limit": limit})
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch newsletter subscribers: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch newsletter subscribers")
 
 @api_router.get("/admin/donations")
-async def get_admin_donations(current_user: dict = Depends(admin_required)):
-    """Get all donations"""
-    try:
-        donations_cursor = db.donations.find({}).sort("created_at", -1)
-        donations_list = []
-        async for donation in donations_cursor:
-            donations_list.append({
-                "id": donation.get("id", str(donation["_id"])),
-                "name": donation["name"],
-                "email": donation["email"],
-                "phone": donation.get("phone"),
-                "amount": donation["amount"],
-                "currency": donation["currency"],
-                "payment_method": donation["payment_method"],
-                "message": donation.get("message"),
-                "anonymous": donation.get("anonymous", False),
-                "recurring": donation.get("recurring", False),
-                "frequency": donation.get("frequency"),
-                "status": donation.get("status", "pending"),
-                "payment_reference": donation.get("payment_reference"),
-                "notes": donation.get("notes"),
-                "created_at": donation["created_at"].isoformat() if isinstance(donation["created_at"], datetime) else donation["created_at"],
-                "updated_at": donation["updated_at"].isoformat() if isinstance(donation["updated_at"], datetime) else donation["updated_at"]
-            })
-        return donations_list
+async def get_admin_donations(cursor: Optional[str] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), current_user: dict = Depends(admin_required)):
+    """Get donations, newest first, one page at a time"""
+    try:
+        donations, next_cursor = await fetch_page(
+            db.donations, {}, "created_at", cursor, limit, projection=DONATION_LIST_PROJECTION
+        )
+        return APIJSONResponse({"items": donations, "next_cursor": next_cursor, "limit": limit})
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch donations: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch donations")
 
+@api_router.get("/admin/donations/summary")
+async def get_donation_summary(
+    days: int = Query(30, ge=1, le=366),
+    months: int = Query(12, ge=1, le=120),
+    current_user: dict = Depends(admin_required)
+):
+    """Get donation totals per currency with daily and monthly breakdowns"""
+    try:
+        return await donation_summary(db, days, months)
+    except Exception as e:
+        logger.error(f"Failed to fetch donation summary: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch donation summary")
+
+@api_router.get("/admin/reports")
+async def get_admin_reports(refresh: bool = False, current_user: dict = Depends(admin_required)):
+    """Get donor retention, lifetime value, churn and volunteer interest reports (computed once per day)"""
+    try:
+        return await daily_reports(db, refresh)
+    except Exception as e:
+        logger.error(f"Failed to build reports: {e}")
+        raise HTTPException(status_code=500, detail="Failed to build reports")
+
+@api_router.post("/admin/donations/summary/rebuild", response_model=MessageResponse)
+async def rebuild_donation_summary(current_user: dict = Depends(admin_required)):
+    """Recompute donation rollups from the donations collection"""
+    try:
+        buckets = await rebuild_rollups(db)
+        logger.info(f"Donation rollups rebuilt by {current_user['username']}")
+        return MessageResponse(message=f"Donation summary rebuilt ({buckets} buckets)")
+    except Exception as e:
+        logger.error(f"Failed to rebuild donation summary: {e}")
+        raise HTTPException(status_code=500, detail="Failed to rebuild donation summary")
+
 @api_router.put("/admin/donations/{donation_id}", response_model=MessageResponse)
 async def update_donation(donation_id: str, donation_data: DonationUpdate, current_user: dict = Depends(admin_required)):
     """Update a donation"""
@@ -378,14 +600,16 @@ async def update_donation(donation_id: str, donation_data: DonationUpdate, curre
         update_dict = donation_data.dict(exclude_unset=True)
         update_dict["updated_at"] = datetime.utcnow()
         
-        result = await db.donations.update_one(
+        before = await db.donations.find_one_and_update(
             {"id": donation_id},
-            {"$set": update_dict}
+            {"$set": update_dict},
+            return_document=ReturnDocument.BEFORE
         )
         
-        if result.matched_count == 0:
+        if not before:
             raise HTTPException(status_code=404, detail="Donation not found")
         
+        await move_donation_status(db, before, {**before, **update_dict})
         logger.info(f"Donation {donation_id} updated by {current_user['username']}")
         return MessageResponse(message="Donation updated successfully!")
     except HTTPException:
@@ -398,11 +622,12 @@ async def update_donation(donation_id: str, donation_data: DonationUpdate, curre
 async def delete_donation(donation_id: str, current_user: dict = Depends(admin_required)):
     """Delete a donation"""
     try:
-        result = await db.donations.delete_one({"id": donation_id})
+        donation = await db.donations.find_one_and_delete({"id": donation_id})
         
-        if result.deleted_count == 0:
+        if not donation:
             raise HTTPException(status_code=404, detail="Donation not found")
         
+        await remove_donation(db, donation)
         logger.info(f"Donation {donation_id} deleted by {current_user['username']}")
         return MessageResponse(message="Donation deleted successfully!")
     except HTTPException:
@@ -415,8 +640,9 @@ async def delete_donation(donation_id: str, current_user: dict = Depends(admin_r
 async def create_news(news_data: NewsCreate, current_user: dict = Depends(admin_required)):
     """Create a new news article"""
     try:
-        news = News(**news_data.dict(), author=current_user["username"])
+        news = News(**news_data.dict(), author=current_user["username"], plain_text=html_to_text(news_data.content))
         await db.news.insert_one(news.dict())
+        cms_cache.invalidate("news", "search")
         logger.info(f"News article created: {news.title}")
         return MessageResponse(message="News article created successfully!")
     except Exception as e:
@@ -428,6 +654,8 @@ async def update_news(news_id: str, news_data: NewsUpdate, current_user: dict =
     """Update a news article"""
     try:
         update_data = {k: v for k, v in news_data.dict().items() if v is not None}
+        if "content" in update_data:
+            update_data["plain_text"] = html_to_text(update_data["content"])
         update_data["updated_at"] = datetime.utcnow()
         
         result = await db.news.update_one(
@@ -438,6 +666,7 @@ async def update_news(news_id: str, news_data: NewsUpdate, current_user: dict =
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="News article not found")
             
+        cms_cache.invalidate("news", "search")
         logger.info(f"News article updated: {news_id}")
         return MessageResponse(message="News article updated successfully!")
     except HTTPException:
@@ -454,6 +683,8 @@ async def delete_news(news_id: str, current_user: dict = Depends(admin_required)
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="News article not found")
             
+        await touch_collection("news")
+        cms_cache.invalidate("news", "search")
         logger.info(f"News article deleted: {news_id}")
         return MessageResponse(message="News article deleted successfully!")
     except HTTPException:
@@ -463,22 +694,15 @@ async def delete_news(news_id: str, current_user: dict = Depends(admin_required)
         raise HTTPException(status_code=500, detail="Failed to delete news article")
 
 @api_router.get("/admin/news")
-async def get_all_news(current_user: dict = Depends(admin_required)):
-    """Get all news articles (including drafts)"""
-    try:
-        news_cursor = db.news.find({}).sort("created_at", -1)
-        news_list = []
-        async for news_item in news_cursor:
-            news_list.append({
-            "id": news_item.get("id", str(news_item["_id"])),
-            "title": news_item["title"],
-            "content": news_item["content"],
-            "status": news_item["status"],
-            "author": news_item["author"],
-            "date": news_item["created_at"].isoformat(),
-            "updated_at": news_item.get("updated_at", news_item["created_at"]).isoformat()
-            })
-        return news_list
+async def get_all_news(cursor: Optional[str] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), current_user: dict = Depends(admin_required)):
+    """Get news articles (including drafts), newest first, one page at a time"""
+    try:
+        news, next_cursor = await fetch_page(
+            db.news, {}, "created_at", cursor, limit, projection=NEWS_ADMIN_PROJECTION, cursor_fields=("date", "id")
+        )
+        return APIJSONResponse({"items": news, "next_cursor": next_cursor, "limit": limit})
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch all news: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch news")
@@ -487,8 +711,9 @@ async def get_all_news(current_user: dict = Depends(admin_required)):
 async def create_blog(blog_data: BlogCreate, current_user: dict = Depends(admin_required)):
     """Create a new blog post (admin only)"""
     try:
-        blog = Blog(**blog_data.dict(), author=current_user["username"])
+        blog = Blog(**blog_data.dict(), author=current_user["username"], plain_text=html_to_text(blog_data.content))
         await db.blogs.insert_one(blog.dict())
+        cms_cache.invalidate("blogs", "search")
         logger.info(f"Blog created: {blog.title}")
         return MessageResponse(message="Blog created successfully!")
     except Exception as e:
@@ -497,26 +722,15 @@ async def create_blog(blog_data: BlogCreate, current_user: dict = Depends(admin_
 
 
 @api_router.get("/admin/blogs")
-async def get_all_blogs(current_user: dict = Depends(admin_required)):
-    """Get all blogs (including drafts) for admin"""
-    try:
-        blogs_cursor = db.blogs.find({}).sort("created_at", -1)
-        blogs_list = []
-        async for blog_item in blogs_cursor:
-            blogs_list.append({
-            "id": blog_item.get("id", str(blog_item["_id"])),
-            "title": blog_item["title"],
-            "excerpt": blog_item.get("excerpt", ""),
-            "content": blog_item["content"],
-            "category": blog_item.get("category", ""),
-            "tags": blog_item.get("tags", []),
-            "image": blog_item.get("image"),
-            "status": blog_item["status"],
-            "author": blog_item["author"],
-            "date": blog_item["created_at"].isoformat(),
-            "updated_at": blog_item.get("updated_at", blog_item["created_at"]).isoformat()
-            })
-        return blogs_list
+async def get_all_blogs(cursor: Optional[str] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), current_user: dict = Depends(admin_required)):
+    """Get blogs (including drafts) for admin, newest first, one page at a time"""
+    try:
+        blogs, next_cursor = await fetch_page(
+            db.blogs, {}, "created_at", cursor, limit, projection=BLOG_ADMIN_PROJECTION, cursor_fields=("date", "id")
+        )
+        return APIJSONResponse({"items": blogs, "next_cursor": next_cursor, "limit": limit})
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch blogs: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch blogs")
@@ -527,6 +741,8 @@ async def update_blog(blog_id: str, blog_data: BlogUpdate, current_user: dict =
     """Update a blog post (admin only)"""
     try:
         update_data = {k: v for k, v in blog_data.dict().items() if v is not None}
+        if "content" in update_data:
+            update_data["plain_text"] = html_to_text(update_data["content"])
         update_data["updated_at"] = datetime.utcnow()
 
         result = await db.blogs.update_one(
@@ -537,6 +753,7 @@ async def update_blog(blog_id: str, blog_data: BlogUpdate, current_user: dict =
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Blog not found")
 
+        cms_cache.invalidate("blogs", "search")
         logger.info(f"Blog updated: {blog_id}")
         return MessageResponse(message="Blog updated successfully!")
     except HTTPException:
@@ -554,6 +771,8 @@ async def delete_blog(blog_id: str, current_user: dict = Depends(admin_required)
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Blog not found")
 
+        await touch_collection("blogs")
+        cms_cache.invalidate("blogs", "search")
         logger.info(f"Blog deleted: {blog_id}")
         return MessageResponse(message="Blog deleted successfully!")
     except HTTPException:
@@ -577,6 +796,7 @@ async def update_impact_stats(stats_data: ImpactStatsUpdate, current_user: dict
             upsert=True
         )
         
+        cms_cache.invalidate("impact_stats")
         logger.info(f"Impact stats updated by {current_user['username']}")
         return MessageResponse(message="Impact statistics updated successfully!")
     except Exception as e:
@@ -613,6 +833,7 @@ async def update_site_content(content_data: SiteContentUpdate, current_user: dic
             upsert=True
         )
         
+        cms_cache.invalidate("site_content")
         logger.info(f"Site content updated by {current_user['username']}")
         return MessageResponse(message="Site content updated successfully!")
     except Exception as e:
@@ -659,40 +880,43 @@ async def update_contact_info(contact_data: ContactInfoUpdate, current_user: dic
             upsert=True
         )
         
+        cms_cache.invalidate("site_content")
         logger.info(f"Contact info updated by {current_user['username']}")
         return MessageResponse(message="Contact information updated successfully!")
     except Exception as e:
         logger.error(f"Failed to update contact info: {e}")
         raise HTTPException(status_code=500, detail="Failed to update contact information")
 
+async def load_site_content():
+    content = await db.site_content.find_one({}, sort=[("updated_at", -1)])
+    if not content:
+        # Return empty content structure if none exists
+        return {"content": {}}
+    return {"content": content.get("content", {})}
+
 @api_router.get("/site-content")
-async def get_public_site_content():
+async def get_public_site_content(request: Request):
     """Get current site content for public pages (no authentication required)"""
     try:
-        content = await db.site_content.find_one({}, sort=[("updated_at", -1)])
-        if not content:
-            # Return empty content structure if none exists
-            return {"content": {}}
-        return {"content": content.get("content", {})}
+        return await conditional_response(request, "site_content", "public", load_site_content)
     except Exception as e:
         logger.error(f"Failed to fetch public site content: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch site content")
 
 # Success Stories Endpoints
+async def load_success_stories():
+    stories = await db.success_stories.find(
+        {"is_active": True}, 
+        sort=[("order", 1), ("created_at", -1)]
+    ).to_list(length=None)
+
+    return {"stories": stories}
+
 @api_router.get("/success-stories")
-async def get_success_stories():
+async def get_success_stories(request: Request):
     """Get all active success stories (no authentication required)"""
     try:
-        stories = await db.success_stories.find(
-            {"is_active": True}, 
-            sort=[("order", 1), ("created_at", -1)]
-        ).to_list(length=None)
-        
-        # Convert ObjectId to string for JSON serialization
-        for story in stories:
-            story["_id"] = str(story["_id"])
-            
-        return {"stories": stories}
+        return await conditional_response(request, "success_stories", "active", load_success_stories)
     except Exception as e:
         logger.error(f"Failed to fetch success stories: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch success stories")
@@ -703,11 +927,7 @@ async def get_admin_success_stories(current_user: dict = Depends(admin_required)
     try:
         stories = await db.success_stories.find({}, sort=[("order", 1), ("created_at", -1)]).to_list(length=None)
         
-        # Convert ObjectId to string for JSON serialization
-        for story in stories:
-            story["_id"] = str(story["_id"])
-            
-        return {"stories": stories}
+        return APIJSONResponse({"stories": stories})
     except Exception as e:
         logger.error(f"Failed to fetch admin success stories: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch success stories")
@@ -723,6 +943,7 @@ async def create_success_story(story_data: SuccessStoryCreate, current_user: dic
         
         result = await db.success_stories.insert_one(story_dict)
         
+        cms_cache.invalidate("success_stories")
         logger.info(f"Success story created by {current_user['username']}: {story_dict['name']}")
         return MessageResponse(message="Success story created successfully!")
     except Exception as e:
@@ -744,6 +965,7 @@ async def update_success_story(story_id: str, story_data: SuccessStoryUpdate, cu
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Success story not found")
         
+        cms_cache.invalidate("success_stories")
         logger.info(f"Success story updated by {current_user['username']}: {story_id}")
         return MessageResponse(message="Success story updated successfully!")
     except HTTPException:
@@ -761,6 +983,8 @@ async def delete_success_story(story_id: str, current_user: dict = Depends(admin
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Success story not found")
         
+        await touch_collection("success_stories")
+        cms_cache.invalidate("success_stories")
         logger.info(f"Success story deleted by {current_user['username']}: {story_id}")
         return MessageResponse(message="Success story deleted successfully!")
     except HTTPException:
@@ -770,23 +994,23 @@ async def delete_success_story(story_id: str, current_user: dict = Depends(admin
         raise HTTPException(status_code=500, detail="Failed to delete success story")
 
 # Leadership Team Endpoints
+async def load_leadership_team():
+    members = await db.leadership_team.find(
+        {"is_active": True}, 
+        sort=[("category", 1), ("order", 1), ("created_at", -1)]
+    ).to_list(length=None)
+    
+    # Ensure category exists (for backward compatibility)
+    for member in members:
+        member.setdefault("category", "Trustee")
+        
+    return {"members": members}
+
 @api_router.get("/leadership-team")
-async def get_leadership_team():
+async def get_leadership_team(request: Request):
     """Get all active leadership team members (no authentication required)"""
     try:
-        members = await db.leadership_team.find(
-            {"is_active": True}, 
-            sort=[("category", 1), ("order", 1), ("created_at", -1)]
-        ).to_list(length=None)
-        
-        # Convert ObjectId to string for JSON serialization
-        for member in members:
-            member["_id"] = str(member["_id"])
-            # Ensure category exists (for backward compatibility)
-            if "category" not in member:
-                member["category"] = "Trustee"
-            
-        return {"members": members}
+        return await conditional_response(request, "leadership_team", "active", load_leadership_team)
     except Exception as e:
         logger.error(f"Failed to fetch leadership team: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch leadership team")
@@ -797,14 +1021,11 @@ async def get_admin_leadership_team(current_user: dict = Depends(admin_required)
     try:
         members = await db.leadership_team.find({}, sort=[("category", 1), ("order", 1), ("created_at", -1)]).to_list(length=None)
         
-        # Convert ObjectId to string for JSON serialization
+        # Ensure category exists (for backward compatibility)
         for member in members:
-            member["_id"] = str(member["_id"])
-            # Ensure category exists (for backward compatibility)
-            if "category" not in member:
-                member["category"] = "Trustee"
+            member.setdefault("category", "Trustee")
             
-        return {"members": members}
+        return APIJSONResponse({"members": members})
     except Exception as e:
         logger.error(f"Failed to fetch admin leadership team: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch leadership team")
@@ -820,6 +1041,7 @@ async def create_team_member(member_data: TeamMemberCreate, current_user: dict =
         
         result = await db.leadership_team.insert_one(member_dict)
         
+        cms_cache.invalidate("leadership_team")
         logger.info(f"Team member created by {current_user['username']}: {member_dict['name']}")
         return MessageResponse(message="Team member created successfully!")
     except Exception as e:
@@ -841,6 +1063,7 @@ async def update_team_member(member_id: str, member_data: TeamMemberUpdate, curr
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Team member not found")
         
+        cms_cache.invalidate("leadership_team")
         logger.info(f"Team member updated by {current_user['username']}: {member_id}")
         return MessageResponse(message="Team member updated successfully!")
     except HTTPException:
@@ -858,6 +1081,8 @@ async def delete_team_member(member_id: str, current_user: dict = Depends(admin_
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Team member not found")
         
+        await touch_collection("leadership_team")
+        cms_cache.invalidate("leadership_team")
         logger.info(f"Team member deleted by {current_user['username']}: {member_id}")
         return MessageResponse(message="Team member deleted successfully!")
     except HTTPException:
@@ -867,20 +1092,29 @@ async def delete_team_member(member_id: str, current_user: dict = Depends(admin_
         raise HTTPException(status_code=500, detail="Failed to delete team member")
 
 # Page Sections Endpoints
+async def load_active_pages(collection: str) -> List[str]:
+    # Pages with at least one active section; cached until the next write to the collection
+    return await cms_cache.get_or_load(
+        collection, "active_pages", lambda: db[collection].distinct("page", {"is_active": True})
+    )
+
 @api_router.get("/page-sections/{page}")
-async def get_page_sections(page: str):
+async def get_page_sections(page: str, request: Request):
     """Get all active sections for a specific page (no authentication required)"""
     try:
-        sections = await db.page_sections.find(
-            {"page": page, "is_active": True}, 
-            sort=[("order", 1), ("created_at", -1)]
-        ).to_list(length=None)
-        
-        # Convert ObjectId to string for JSON serialization
-        for section in sections:
-            section["_id"] = str(section["_id"])
+        if page not in await load_active_pages("page_sections"):
+            # Pages without active sections answer uncached, keeping arbitrary paths out of cms_cache
+            return APIJSONResponse({"sections": []})
+
+        async def load():
+            sections = await db.page_sections.find(
+                {"page": page, "is_active": True}, 
+                sort=[("order", 1), ("created_at", -1)]
+            ).to_list(length=None)
             
-        return {"sections": sections}
+            return {"sections": sections}
+
+        return await conditional_response(request, "page_sections", ("active", page), load)
     except Exception as e:
         logger.error(f"Failed to fetch page sections for {page}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch page sections")
@@ -894,11 +1128,7 @@ async def get_admin_page_sections(page: str, current_user: dict = Depends(admin_
             sort=[("order", 1), ("created_at", -1)]
         ).to_list(length=None)
         
-        # Convert ObjectId to string for JSON serialization
-        for section in sections:
-            section["_id"] = str(section["_id"])
-            
-        return {"sections": sections}
+        return APIJSONResponse({"sections": sections})
     except Exception as e:
         logger.error(f"Failed to fetch admin page sections for {page}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch page sections")
@@ -914,6 +1144,7 @@ async def create_page_section(section_data: PageSectionCreate, current_user: dic
         
         result = await db.page_sections.insert_one(section_dict)
         
+        cms_cache.invalidate("page_sections")
         logger.info(f"Page section created by {current_user['username']}: {section_dict['page']}/{section_dict['section']}")
         return MessageResponse(message="Page section created successfully!")
     except Exception as e:
@@ -935,6 +1166,7 @@ async def update_page_section(section_id: str, section_data: PageSectionUpdate,
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Page section not found")
         
+        cms_cache.invalidate("page_sections")
         logger.info(f"Page section updated by {current_user['username']}: {section_id}")
         return MessageResponse(message="Page section updated successfully!")
     except HTTPException:
@@ -952,6 +1184,8 @@ async def delete_page_section(section_id: str, current_user: dict = Depends(admi
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Page section not found")
         
+        await touch_collection("page_sections")
+        cms_cache.invalidate("page_sections")
         logger.info(f"Page section deleted by {current_user['username']}: {section_id}")
         return MessageResponse(message="Page section deleted successfully!")
     except HTTPException:
@@ -961,20 +1195,20 @@ async def delete_page_section(section_id: str, current_user: dict = Depends(admi
         raise HTTPException(status_code=500, detail="Failed to delete page section")
 
 # Gallery Items Endpoints
+async def load_gallery_items():
+    items = await db.gallery_items.find(
+        {"is_active": True}, 
+        sort=[("order", 1), ("created_at", -1)]
+    ).to_list(length=None)
+    
+    # ObjectIds are encoded with the cached body (encode_payload)
+    return {"items": items}
+
 @api_router.get("/gallery-items")
-async def get_gallery_items():
+async def get_gallery_items(request: Request):
     """Get all active gallery items (no authentication required)"""
     try:
-        items = await db.gallery_items.find(
-            {"is_active": True}, 
-            sort=[("order", 1), ("created_at", -1)]
-        ).to_list(length=None)
-        
-        # Convert ObjectId to string for JSON serialization
-        for item in items:
-            item["_id"] = str(item["_id"])
-            
-        return {"items": items}
+        return await conditional_response(request, "gallery_items", "active", load_gallery_items)
     except Exception as e:
         logger.error(f"Failed to fetch gallery items: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch gallery items")
@@ -985,11 +1219,7 @@ async def get_admin_gallery_items(current_user: dict = Depends(admin_required)):
     try:
         items = await db.gallery_items.find({}, sort=[("order", 1), ("created_at", -1)]).to_list(length=None)
         
-        # Convert ObjectId to string for JSON serialization
-        for item in items:
-            item["_id"] = str(item["_id"])
-            
-        return {"items": items}
+        return APIJSONResponse({"items": items})
     except Exception as e:
         logger.error(f"Failed to fetch admin gallery items: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch gallery items")
@@ -1005,6 +1235,7 @@ async def create_gallery_item(item_data: GalleryItemCreate, current_user: dict =
         
         result = await db.gallery_items.insert_one(item_dict)
         
+        cms_cache.invalidate("gallery_items")
         logger.info(f"Gallery item created by {current_user['username']}: {item_dict['title']}")
         return MessageResponse(message="Gallery item created successfully!")
     except Exception as e:
@@ -1026,6 +1257,7 @@ async def update_gallery_item(item_id: str, item_data: GalleryItemUpdate, curren
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Gallery item not found")
         
+        cms_cache.invalidate("gallery_items")
         logger.info(f"Gallery item updated by {current_user['username']}: {item_id}")
         return MessageResponse(message="Gallery item updated successfully!")
     except HTTPException:
@@ -1043,6 +1275,8 @@ async def delete_gallery_item(item_id: str, current_user: dict = Depends(admin_r
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Gallery item not found")
         
+        await touch_collection("gallery_items")
+        cms_cache.invalidate("gallery_items")
         logger.info(f"Gallery item deleted by {current_user['username']}: {item_id}")
         return MessageResponse(message="Gallery item deleted successfully!")
     except HTTPException:
@@ -1052,20 +1286,19 @@ async def delete_gallery_item(item_id: str, current_user: dict = Depends(admin_r
         raise HTTPException(status_code=500, detail="Failed to delete gallery item")
 
 # Testimonials Endpoints
+async def load_testimonials():
+    testimonials = await db.testimonials.find(
+        {"is_active": True}, 
+        sort=[("order", 1), ("created_at", -1)]
+    ).to_list(length=None)
+
+    return {"testimonials": testimonials}
+
 @api_router.get("/testimonials")
-async def get_testimonials():
+async def get_testimonials(request: Request):
     """Get all active testimonials (no authentication required)"""
     try:
-        testimonials = await db.testimonials.find(
-            {"is_active": True}, 
-            sort=[("order", 1), ("created_at", -1)]
-        ).to_list(length=None)
-        
-        # Convert ObjectId to string for JSON serialization
-        for testimonial in testimonials:
-            testimonial["_id"] = str(testimonial["_id"])
-            
-        return {"testimonials": testimonials}
+        return await conditional_response(request, "testimonials", "active", load_testimonials)
     except Exception as e:
         logger.error(f"Failed to fetch testimonials: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch testimonials")
@@ -1076,11 +1309,7 @@ async def get_admin_testimonials(current_user: dict = Depends(admin_required)):
     try:
         testimonials = await db.testimonials.find({}, sort=[("order", 1), ("created_at", -1)]).to_list(length=None)
         
-        # Convert ObjectId to string for JSON serialization
-        for testimonial in testimonials:
-            testimonial["_id"] = str(testimonial["_id"])
-            
-        return {"testimonials": testimonials}
+        return APIJSONResponse({"testimonials": testimonials})
     except Exception as e:
         logger.error(f"Failed to fetch admin testimonials: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch testimonials")
@@ -1096,6 +1325,7 @@ async def create_testimonial(testimonial_data: TestimonialCreate, current_user:
         
         result = await db.testimonials.insert_one(testimonial_dict)
         
+        cms_cache.invalidate("testimonials")
         logger.info(f"Testimonial created by {current_user['username']}: {testimonial_dict['name']}")
         return MessageResponse(message="Testimonial created successfully!")
     except Exception as e:
@@ -1117,6 +1347,7 @@ async def update_testimonial(testimonial_id: str, testimonial_data: TestimonialU
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Testimonial not found")
         
+        cms_cache.invalidate("testimonials")
         logger.info(f"Testimonial updated by {current_user['username']}: {testimonial_id}")
         return MessageResponse(message="Testimonial updated successfully!")
     except HTTPException:
@@ -1134,6 +1365,8 @@ async def delete_testimonial(testimonial_id: str, current_user: dict = Depends(a
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Testimonial not found")
         
+        await touch_collection("testimonials")
+        cms_cache.invalidate("testimonials")
         logger.info(f"Testimonial deleted by {current_user['username']}: {testimonial_id}")
         return MessageResponse(message="Testimonial deleted successfully!")
     except HTTPException:
@@ -1143,20 +1376,19 @@ async def delete_testimonial(testimonial_id: str, current_user: dict = Depends(a
         raise HTTPException(status_code=500, detail="Failed to delete testimonial")
 
 # IMPACT HIGHLIGHTS ENDPOINTS
+async def load_impact_highlights():
+    highlights = await db.impact_highlights.find(
+        {"is_active": True}, 
+        sort=[("order", 1), ("created_at", -1)]
+    ).to_list(length=None)
+
+    return {"highlights": highlights}
+
 @api_router.get("/impact-highlights")
-async def get_impact_highlights():
+async def get_impact_highlights(request: Request):
     """Get all active impact highlights (no authentication required)"""
     try:
-        highlights = await db.impact_highlights.find(
-            {"is_active": True}, 
-            sort=[("order", 1), ("created_at", -1)]
-        ).to_list(length=None)
-        
-        # Convert ObjectId to string for JSON serialization
-        for highlight in highlights:
-            highlight["_id"] = str(highlight["_id"])
-            
-        return {"highlights": highlights}
+        return await conditional_response(request, "impact_highlights", "active", load_impact_highlights)
     except Exception as e:
         logger.error(f"Failed to fetch impact highlights: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch impact highlights")
@@ -1167,11 +1399,7 @@ async def get_admin_impact_highlights(current_user: dict = Depends(admin_require
     try:
         highlights = await db.impact_highlights.find({}, sort=[("order", 1), ("created_at", -1)]).to_list(length=None)
         
-        # Convert ObjectId to string for JSON serialization
-        for highlight in highlights:
-            highlight["_id"] = str(highlight["_id"])
-            
-        return {"highlights": highlights}
+        return APIJSONResponse({"highlights": highlights})
     except Exception as e:
         logger.error(f"Failed to fetch admin impact highlights: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch impact highlights")
@@ -1187,6 +1415,7 @@ async def create_impact_highlight(highlight_data: ImpactHighlightCreate, current
         
         result = await db.impact_highlights.insert_one(highlight_dict)
         
+        cms_cache.invalidate("impact_highlights")
         logger.info(f"Impact highlight created by {current_user['username']}: {highlight_dict['title']}")
         return MessageResponse(message="Impact highlight created successfully!")
     except Exception as e:
@@ -1208,6 +1437,7 @@ async def update_impact_highlight(highlight_id: str, highlight_data: ImpactHighl
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Impact highlight not found")
         
+        cms_cache.invalidate("impact_highlights")
         logger.info(f"Impact highlight updated by {current_user['username']}: {highlight_id}")
         return MessageResponse(message="Impact highlight updated successfully!")
     except HTTPException:
@@ -1225,6 +1455,8 @@ async def delete_impact_highlight(highlight_id: str, current_user: dict = Depend
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Impact highlight not found")
         
+        await touch_collection("impact_highlights")
+        cms_cache.invalidate("impact_highlights")
         logger.info(f"Impact highlight deleted by {current_user['username']}: {highlight_id}")
         return MessageResponse(message="Impact highlight deleted successfully!")
     except HTTPException:
@@ -1244,11 +1476,7 @@ async def get_users(current_user: dict = Depends(admin_required)):
         
         users = await db.admin_users.find({}, {"password": 0}).sort("created_at", -1).to_list(length=None)
         
-        # Convert ObjectId to string for JSON serialization
-        for user in users:
-            user["_id"] = str(user["_id"])
-            
-        return {"users": users}
+        return APIJSONResponse({"users": users})
     except HTTPException:
         raise
     except Exception as e:
@@ -1276,7 +1504,7 @@ async def create_user(user_data: UserCreate, current_user: dict = Depends(admin_
         # Hash password and create user
         user_dict = user_data.dict()
         user_dict["id"] = str(uuid.uuid4())
-        user_dict["password"] = hash_password(user_data.password)
+        user_dict["password"] = await hash_password_async(user_data.password)
         user_dict["is_active"] = True
         user_dict["created_at"] = datetime.utcnow()
         
@@ -1338,11 +1566,11 @@ async def update_user_password(user_id: str, password_data: UserPasswordUpdate,
         
         # Verify current password
         user = await db.admin_users.find_one({"id": user_id})
-        if not user or not verify_password(password_data.current_password, user["password"]):
+        if not user or not await verify_password_async(password_data.current_password, user["password"]):
             raise HTTPException(status_code=400, detail="Current password is incorrect")
         
         # Hash new password and update
-        new_password_hash = hash_password(password_data.new_password)
+        new_password_hash = await hash_password_async(password_data.new_password)
         result = await db.admin_users.update_one(
             {"id": user_id},
             {"$set": {"password": new_password_hash, "updated_at": datetime.utcnow()}}
@@ -1392,45 +1620,128 @@ async def delete_user(user_id: str, current_user: dict = Depends(admin_required)
         raise HTTPException(status_code=500, detail="Failed to delete user")
 
 # SITE SETTINGS/BRANDING ENDPOINTS
+async def load_site_settings():
+    settings = await db.site_settings.find_one({}, sort=[("updated_at", -1)])
+    if not settings:
+        # Return default settings if none exist
+        return {
+            "logo_url": None,
+            "favicon_url": None,
+            "site_title": "Shield Foundation",
+            "site_description": "Adding Life to Years",
+            "primary_color": "#2563eb",
+            "secondary_color": "#eab308",
+            "accent_color": "#ffffff",
+            "facebook_url": None,
+            "instagram_url": None,
+            "youtube_url": None,
+            "twitter_url": None,
+            "linkedin_url": None
+        }
+    return {
+        "logo_url": settings.get("logo_url"),
+        "favicon_url": settings.get("favicon_url"),
+        "site_title": settings.get("site_title", "Shield Foundation"),
+        "site_description": settings.get("site_description", "Adding Life to Years"),
+        "primary_color": settings.get("primary_color", "#2563eb"),
+        "secondary_color": settings.get("secondary_color", "#eab308"),
+        "accent_color": settings.get("accent_color", "#ffffff"),
+        "facebook_url": settings.get("facebook_url"),
+        "instagram_url": settings.get("instagram_url"),
+        "youtube_url": settings.get("youtube_url"),
+        "twitter_url": settings.get("twitter_url"),
+        "linkedin_url": settings.get("linkedin_url")
+    }
+
 @api_router.get("/site-settings")
-async def get_site_settings():
+async def get_site_settings(request: Request):
     """Get current site settings (no authentication required)"""
     try:
-        settings = await db.site_settings.find_one({}, sort=[("updated_at", -1)])
-        if not settings:
-            # Return default settings if none exist
-            return {
-                "logo_url": None,
-                "favicon_url": None,
-                "site_title": "Shield Foundation",
-                "site_description": "Adding Life to Years",
-                "primary_color": "#2563eb",
-                "secondary_color": "#eab308",
-                "accent_color": "#ffffff",
-                "facebook_url": None,
-                "instagram_url": None,
-                "youtube_url": None,
-                "twitter_url": None,
-                "linkedin_url": None
-            }
-        return {
-            "logo_url": settings.get("logo_url"),
-            "favicon_url": settings.get("favicon_url"),
-            "site_title": settings.get("site_title", "Shield Foundation"),
-            "site_description": settings.get("site_description", "Adding Life to Years"),
-            "primary_color": settings.get("primary_color", "#2563eb"),
-            "secondary_color": settings.get("secondary_color", "#eab308"),
-            "accent_color": settings.get("accent_color", "#ffffff"),
-            "facebook_url": settings.get("facebook_url"),
-            "instagram_url": settings.get("instagram_url"),
-            "youtube_url": settings.get("youtube_url"),
-            "twitter_url": settings.get("twitter_url"),
-            "linkedin_url": settings.get("linkedin_url")
-        }
+        return await conditional_response(request, "site_settings", "public", load_site_settings)
     except Exception as e:
         logger.error(f"Failed to fetch site settings: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch site settings")
 
+# BOOTSTRAP ENDPOINT
+
+# Page -> payload key -> (collection, loader); each value matches its standalone endpoint
+BOOTSTRAP_PAGES = {
+    "home": {
+        "site_settings": ("site_settings", load_site_settings),
+        "site_content": ("site_content", load_site_content),
+        "impact_stats": ("impact_stats", load_impact_stats),
+        "impact_highlights": ("impact_highlights", load_impact_highlights),
+        "testimonials": ("testimonials", load_testimonials),
+        "success_stories": ("success_stories", load_success_stories),
+    },
+}
+
+# A write to any source collection drops the cached composites
+for sections in BOOTSTRAP_PAGES.values():
+    cms_cache.add_dependency("bootstrap", *(collection for collection, _ in sections.values()))
+
+def bootstrap_sources(page: str) -> List[str]:
+    return [collection for collection, _ in BOOTSTRAP_PAGES[page].values()]
+
+async def load_bootstrap(page: str):
+    sections = BOOTSTRAP_PAGES[page]
+    values = await asyncio.gather(*(loader() for _, loader in sections.values()))
+    return dict(zip(sections, values))
+
+@api_router.get("/bootstrap")
+async def get_bootstrap(request: Request, page: str = "home"):
+    """Get everything a page needs for first paint in one response (no authentication required)"""
+    try:
+        if page not in BOOTSTRAP_PAGES:
+            raise HTTPException(status_code=404, detail="Unknown page")
+        return await conditional_response(
+            request, "bootstrap", page, lambda: load_bootstrap(page), sources=bootstrap_sources(page)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to fetch bootstrap data for {page}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch page data")
+
+# STATIC SNAPSHOTS
+
+# Public URLs pre-rendered to SNAPSHOT_DIR; each uses the (collection, key) its endpoint caches under
+PUBLIC_SNAPSHOTS = [
+    ("/api/news", "news", "published", load_published_news),
+    ("/api/blogs", "blogs", ("published", None, None), load_published_blogs),
+    ("/api/blogs/facets", "blogs", "facets", load_blog_facets),
+    ("/api/impact-stats", "impact_stats", "public", load_impact_stats),
+    ("/api/site-content", "site_content", "public", load_site_content),
+    ("/api/success-stories", "success_stories", "active", load_success_stories),
+    ("/api/leadership-team", "leadership_team", "active", load_leadership_team),
+    ("/api/gallery-items", "gallery_items", "active", load_gallery_items),
+    ("/api/testimonials", "testimonials", "active", load_testimonials),
+    ("/api/impact-highlights", "impact_highlights", "active", load_impact_highlights),
+    ("/api/site-settings", "site_settings", "public", load_site_settings),
+]
+for url, collection, key, loader in PUBLIC_SNAPSHOTS:
+    snapshot_publisher.register(url, collection, key, loader)
+for page in BOOTSTRAP_PAGES:
+    snapshot_publisher.register(
+        f"/api/bootstrap?page={page}", "bootstrap", page,
+        functools.partial(load_bootstrap, page), sources=bootstrap_sources(page)
+    )
+
+@api_router.post("/admin/snapshots/publish", response_model=MessageResponse)
+async def publish_snapshots(current_user: dict = Depends(admin_required)):
+    """Regenerate every public snapshot, e.g. after editing the database outside the API"""
+    try:
+        if not snapshot_publisher.enabled:
+            raise HTTPException(status_code=409, detail="Snapshots are disabled (SNAPSHOT_ENABLED)")
+        published = await snapshot_publisher.publish_all()
+        logger.info(f"Public snapshots published by {current_user['username']}")
+        return MessageResponse(message=f"Published {published} snapshots")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to publish snapshots: {e}")
+        raise HTTPException(status_code=500, detail="Failed to publish snapshots")
+
 @api_router.get("/admin/site-settings")
 async def get_admin_site_settings(current_user: dict = Depends(admin_required)):
     """Get current site settings for admin management"""
@@ -1453,9 +1764,7 @@ async def get_admin_site_settings(current_user: dict = Depends(admin_required)):
                 "linkedin_url": None
             }
         
-        # Convert ObjectId to string for JSON serialization
-        settings["_id"] = str(settings["_id"])
-        return settings
+        return APIJSONResponse(settings)
     except Exception as e:
         logger.error(f"Failed to fetch admin site settings: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch site settings")
@@ -1475,6 +1784,7 @@ async def update_site_settings(settings_data: SiteSettingsUpdate, current_user:
             upsert=True
         )
         
+        cms_cache.invalidate("site_settings")
         logger.info(f"Site settings updated by {current_user['username']}")
         return MessageResponse(message="Site settings updated successfully!")
     except Exception as e:
@@ -1483,19 +1793,21 @@ async def update_site_settings(settings_data: SiteSettingsUpdate, current_user:
 
 # ENHANCED PAGE SECTIONS ENDPOINTS (For detailed CMS)
 @api_router.get("/detailed-page-sections/{page}")
-async def get_detailed_page_sections(page: str):
+async def get_detailed_page_sections(page: str, request: Request):
     """Get all active detailed sections for a specific page (no authentication required)"""
     try:
-        sections = await db.detailed_page_sections.find(
-            {"page": page, "is_active": True}, 
-            sort=[("order", 1), ("created_at", -1)]
-        ).to_list(length=None)
-        
-        # Convert ObjectId to string for JSON serialization
-        for section in sections:
-            section["_id"] = str(section["_id"])
+        if page not in await load_active_pages("detailed_page_sections"):
+            return APIJSONResponse({"sections": []})
+
+        async def load():
+            sections = await db.detailed_page_sections.find(
+                {"page": page, "is_active": True}, 
+                sort=[("order", 1), ("created_at", -1)]
+            ).to_list(length=None)
             
-        return {"sections": sections}
+            return {"sections": sections}
+
+        return await conditional_response(request, "detailed_page_sections", ("active", page), load)
     except Exception as e:
         logger.error(f"Failed to fetch detailed page sections for {page}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch page sections")
@@ -1509,11 +1821,7 @@ async def get_admin_detailed_page_sections(page: str, current_user: dict = Depen
             sort=[("order", 1), ("created_at", -1)]
         ).to_list(length=None)
         
-        # Convert ObjectId to string for JSON serialization
-        for section in sections:
-            section["_id"] = str(section["_id"])
-            
-        return {"sections": sections}
+        return APIJSONResponse({"sections": sections})
     except Exception as e:
         logger.error(f"Failed to fetch admin detailed page sections for {page}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch page sections")
@@ -1529,6 +1837,7 @@ async def create_detailed_page_section(section_data: DetailedPageSectionCreate,
         
         result = await db.detailed_page_sections.insert_one(section_dict)
         
+        cms_cache.invalidate("detailed_page_sections")
         logger.info(f"Detailed page section created by {current_user['username']}: {section_dict['page']}/{section_dict['section']}")
         return MessageResponse(message="Page section created successfully!")
     except Exception as e:
@@ -1550,6 +1859,7 @@ async def update_detailed_page_section(section_id: str, section_data: DetailedPa
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Page section not found")
         
+        cms_cache.invalidate("detailed_page_sections")
         logger.info(f"Detailed page section updated by {current_user['username']}: {section_id}")
         return MessageResponse(message="Page section updated successfully!")
     except HTTPException:
@@ -1567,6 +1877,8 @@ async def delete_detailed_page_section(section_id: str, current_user: dict = Dep
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Page section not found")
         
+        await touch_collection("detailed_page_sections")
+        cms_cache.invalidate("detailed_page_sections")
         logger.info(f"Detailed page section deleted by {current_user['username']}: {section_id}")
         return MessageResponse(message="Page section deleted successfully!")
     except HTTPException:
@@ -1580,28 +1892,18 @@ async def delete_detailed_page_section(section_id: str, current_user: dict = Dep
 async def get_database_stats(current_user: dict = Depends(admin_required)):
     """Get overall database statistics"""
     try:
-        collections = await db.list_collection_names()
-        
-        total_documents = 0
-        collection_stats = []
-        
-        for collection_name in collections:
-            count = await db[collection_name].count_documents({})
-            total_documents += count
-            
-            collection_stats.append({
-                "collection": collection_name,
-                "count": count,
-                "size": 0  # Size calculation disabled for compatibility
-            })
+        collection_stats = await get_all_collection_stats()
         
         # Sort by document count descending
         collection_stats.sort(key=lambda x: x["count"], reverse=True)
         
         logger.info(f"Database stats retrieved by {current_user['username']}")
         return {
-            "total_collections": len(collections),
-            "total_documents": total_documents,
+            "total_collections": len(collection_stats),
+            "total_documents": sum(stats["count"] for stats in collection_stats),
+            "total_size": sum(stats["size"] for stats in collection_stats),
+            "total_storage_size": sum(stats["storage_size"] for stats in collection_stats),
+            "total_index_size": sum(stats["index_size"] for stats in collection_stats),
             "collection_stats": collection_stats
         }
     except Exception as e:
@@ -1612,7 +1914,7 @@ async def get_database_stats(current_user: dict = Depends(admin_required)):
 async def get_database_collections(current_user: dict = Depends(admin_required)):
     """Get all database collections and their document counts"""
     try:
-        collections = await db.list_collection_names()
+        collection_stats = await get_all_collection_stats()
         
         # Define collection display names and descriptions
         collection_info = {
@@ -1629,12 +1931,16 @@ async def get_database_collections(current_user: dict = Depends(admin_required))
             "gallery_items": {"name": "Gallery Items", "description": "Gallery photos and media items"},
             "donations": {"name": "Donations", "description": "Donation records and payment information"},
             "testimonials": {"name": "Testimonials", "description": "User testimonials and reviews"},
-            "blogs": {"name": "Blogs", "description": "Blog posts and articles"}
+            "blogs": {"name": "Blogs", "description": "Blog posts and articles"},
+            "donation_rollups": {"name": "Donation Rollups", "description": "Daily, monthly and all-time donation totals per currency"},
+            "analytics_reports": {"name": "Analytics Reports", "description": "Daily donor and volunteer report snapshots"},
+            "startup_locks": {"name": "Startup Locks", "description": "Locks coordinating one-time startup work across workers"},
+            "startup_status": {"name": "Startup Status", "description": "Applied index registry version"}
         }
         
         result = []
-        for collection_name in collections:
-            count = await db[collection_name].count_documents({})
+        for stats in collection_stats:
+            collection_name = stats["collection"]
             info = collection_info.get(collection_name, {
                 "name": collection_name.replace("_", " ").title(),
                 "description": f"Collection: {collection_name}"
@@ -1644,7 +1950,10 @@ async def get_database_collections(current_user: dict = Depends(admin_required))
                 "collection": collection_name,
                 "name": info["name"],
                 "description": info["description"],
-                "count": count
+                "count": stats["count"],
+                "size": stats["size"],
+                "storage_size": stats["storage_size"],
+                "index_size": stats["index_size"]
             })
         
         # Sort by collection name for consistency
@@ -1657,42 +1966,45 @@ async def get_database_collections(current_user: dict = Depends(admin_required))
         raise HTTPException(status_code=500, detail="Failed to retrieve database collections")
 
 @api_router.get("/admin/database/{collection_name}")
-async def get_collection_data(collection_name: str, limit: int = 100, skip: int = 0, current_user: dict = Depends(admin_required)):
-    """Get data from a specific collection"""
+async def get_collection_data(
+    collection_name: str,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    sort_by: str = Query("_id", pattern="^(_id|created_at)$"),
+    exact_count: bool = False,
+    current_user: dict = Depends(admin_required)
+):
+    """Get data from a specific collection using keyset pagination"""
     try:
         # Validate collection exists
-        collections = await db.list_collection_names()
-        if collection_name not in collections:
+        if not await collection_exists(collection_name):
             raise HTTPException(status_code=404, detail="Collection not found")
         
-        # Get collection data with pagination
-        cursor = db[collection_name].find({}).skip(skip).limit(limit)
-        
-        # Sort by created_at if available, otherwise by _id
-        try:
-            cursor = cursor.sort("created_at", -1)
-        except:
-            cursor = cursor.sort("_id", -1)
+        collection = db[collection_name]
         
-        documents = await cursor.to_list(length=limit)
+        # Newest first by _id (or created_at), resuming after the cursor
+        page_query = fetch_page(collection, {}, sort_by, cursor, limit, tiebreaker="_id")
         
-        # Convert ObjectIds to strings for JSON serialization
-        for doc in documents:
-            if "_id" in doc:
-                doc["_id"] = str(doc["_id"])
+        # Collection metadata is O(1); an exact count scans and is opt-in
+        if exact_count:
+            count_query = collection.count_documents({})
+        else:
+            count_query = collection.estimated_document_count()
         
-        # Get total count for pagination
-        total_count = await db[collection_name].count_documents({})
+        (documents, next_cursor), total_count = await asyncio.gather(page_query, count_query)
         
+        # ObjectIds (at any depth) and datetimes are encoded by the response class
         logger.info(f"Collection {collection_name} data retrieved by {current_user['username']}")
-        return {
+        return APIJSONResponse({
             "collection": collection_name,
             "documents": documents,
             "total_count": total_count,
+            "count_is_estimate": not exact_count,
             "limit": limit,
-            "skip": skip,
-            "has_more": (skip + limit) < total_count
-        }
+            "sort_by": sort_by,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -1704,8 +2016,7 @@ async def delete_document(collection_name: str, document_id: str, current_user:
     """Delete a document from a collection"""
     try:
         # Validate collection exists
-        collections = await db.list_collection_names()
-        if collection_name not in collections:
+        if not await collection_exists(collection_name):
             raise HTTPException(status_code=404, detail="Collection not found")
         
         # Prevent deletion of admin users (safety measure)
@@ -1713,19 +2024,25 @@ async def delete_document(collection_name: str, document_id: str, current_user:
             raise HTTPException(status_code=403, detail="Cannot delete admin users through this interface")
         
         # Try to delete by 'id' field first (our custom UUID), then by '_id' (MongoDB ObjectId)
-        result = await db[collection_name].delete_one({"id": document_id})
+        deleted = await db[collection_name].find_one_and_delete({"id": document_id})
         
-        if result.deleted_count == 0:
+        if not deleted:
             # Try with _id if id field doesn't work
             from bson import ObjectId
             try:
-                result = await db[collection_name].delete_one({"_id": ObjectId(document_id)})
+                deleted = await db[collection_name].find_one_and_delete({"_id": ObjectId(document_id)})
             except:
-                result = await db[collection_name].delete_one({"_id": document_id})
+                deleted = await db[collection_name].find_one_and_delete({"_id": document_id})
         
-        if result.deleted_count == 0:
+        if not deleted:
             raise HTTPException(status_code=404, detail="Document not found")
         
+        if collection_name == "donations":
+            await remove_donation(db, deleted)
+        await touch_collection(collection_name)
+        cms_cache.invalidate(collection_name)
+        if collection_name in SEARCH_SOURCES:
+            cms_cache.invalidate("search")
         logger.info(f"Document {document_id} deleted from {collection_name} by {current_user['username']}")
         return MessageResponse(message="Document deleted successfully!")
     except HTTPException:
@@ -1734,9 +2051,208 @@ async def delete_document(collection_name: str, document_id: str, current_user:
         logger.error(f"Failed to delete document {document_id} from {collection_name}: {e}")
         raise HTTPException(status_code=500, detail="Failed to delete document")
 
+# SYSTEM METRICS ENDPOINTS
+@api_router.get("/admin/system/metrics")
+async def get_system_metrics(current_user: dict = Depends(admin_required)):
+    """Get in-process runtime metrics for this worker"""
+    return {
+        "password_hashing": password_hasher.stats(),
+        "token_cache": token_cache.stats(),
+        "mongo_pool": pool_stats.stats(),
+        "cache": cms_cache.stats(),
+        "search_cache": search_cache.stats(),
+        "write_buffer": write_buffer.stats(),
+        "snapshots": snapshot_publisher.stats(),
+        "compression": compression_stats.stats()
+    }
+
+# BULK IMPORT ENDPOINTS
+
+# URL segment -> (collection, model validating each item)
+BULK_COLLECTIONS = {
+    "success-stories": ("success_stories", SuccessStoryCreate),
+    "leadership-team": ("leadership_team", TeamMemberCreate),
+    "page-sections": ("page_sections", PageSectionCreate),
+    "detailed-page-sections": ("detailed_page_sections", DetailedPageSectionCreate),
+    "gallery-items": ("gallery_items", GalleryItemCreate),
+    "testimonials": ("testimonials", TestimonialCreate),
+    "impact-highlights": ("impact_highlights", ImpactHighlightCreate),
+}
+
+@api_router.post("/admin/{collection}/bulk", response_model=BulkImportResponse)
+async def bulk_import(collection: str, import_data: BulkImportRequest, current_user: dict = Depends(admin_required)):
+    """Insert or update many CMS items in one bulk write; items with an id are upserted by id"""
+    try:
+        if collection not in BULK_COLLECTIONS:
+            raise HTTPException(status_code=404, detail="Bulk import is not available for this collection")
+        collection_name, model = BULK_COLLECTIONS[collection]
+        
+        now = datetime.utcnow()
+        results = [None] * len(import_data.items)
+        operations = []
+        positions = []  # operation index -> item index
+        for index, item in enumerate(import_data.items):
+            item_id = item.get("id")
+            try:
+                validated = model(**{k: v for k, v in item.items() if k != "id"})
+            except ValidationError as e:
+                results[index] = {"index": index, "id": item_id, "status": "invalid", "error": e.errors(include_url=False)}
+                continue
+            
+            fields = validated.dict()
+            if item_id:
+                # Updates only touch the fields the caller sent; model defaults apply to inserts alone
+                sent = validated.dict(exclude_unset=True)
+                defaults = {key: value for key, value in fields.items() if key not in sent}
+                operations.append(UpdateOne(
+                    {"id": item_id},
+                    {"$set": {**sent, "updated_at": now}, "$setOnInsert": {**defaults, "created_at": now}},
+                    upsert=True
+                ))
+            else:
+                item_id = str(uuid.uuid4())
+                operations.append(InsertOne({**fields, "id": item_id, "created_at": now, "updated_at": now}))
+            positions.append(index)
+            results[index] = {"index": index, "id": item_id, "status": "pending"}
+        
+        invalid = [result for result in results if result["status"] == "invalid"]
+        if invalid and import_data.ordered:
+            # Ordered imports are all-or-nothing with respect to validation
+            raise HTTPException(status_code=422, detail={"message": "No items were written", "results": invalid})
+        
+        write_errors = {}
+        upserted = set()
+        if operations:
+            try:
+                bulk = await db[collection_name].bulk_write(operations, ordered=import_data.ordered)
+                upserted = set(bulk.upserted_ids)
+            except BulkWriteError as e:
+                write_errors = {error["index"]: error.get("errmsg", "Write failed") for error in e.details.get("writeErrors", [])}
+                upserted = {upsert["index"] for upsert in e.details.get("upserted", [])}
+        
+        # An ordered bulk write stops at its first error; later operations never ran
+        stopped_at = min(write_errors) if write_errors and import_data.ordered else None
+        for op_index, item_index in enumerate(positions):
+            result = results[item_index]
+            if op_index in write_errors:
+                result.update(status="error", error=write_errors[op_index])
+            elif stopped_at is not None and op_index > stopped_at:
+                result["status"] = "skipped"
+            elif isinstance(operations[op_index], InsertOne) or op_index in upserted:
+                result["status"] = "inserted"
+            else:
+                result["status"] = "updated"
+        
+        inserted = sum(result["status"] == "inserted" for result in results)
+        updated = sum(result["status"] == "updated" for result in results)
+        failed = len(results) - inserted - updated
+        
+        if inserted or updated:
+            cms_cache.invalidate(collection_name)
+        logger.info(f"Bulk import into {collection_name} by {current_user['username']}: {inserted} inserted, {updated} updated, {failed} failed")
+        return BulkImportResponse(
+            message=f"Processed {len(results)} items",
+            success=failed == 0,
+            inserted=inserted,
+            updated=updated,
+            failed=failed,
+            results=results
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Bulk import into {collection} failed: {e}")
+        raise HTTPException(status_code=500, detail="Bulk import failed")
+
+@api_router.patch("/admin/{collection}/order", response_model=MessageResponse)
+async def reorder_items(collection: str, reorder_data: ReorderRequest, current_user: dict = Depends(admin_required)):
+    """Set the display order of many items at once from an ordered list of ids"""
+    try:
+        if collection not in BULK_COLLECTIONS:
+            raise HTTPException(status_code=404, detail="Reordering is not available for this collection")
+        collection_name = BULK_COLLECTIONS[collection][0]
+        
+        ids = reorder_data.ids
+        if len(set(ids)) != len(ids):
+            raise HTTPException(status_code=400, detail="Duplicate ids in order list")
+        
+        current = {
+            item["id"]: item.get("order")
+            async for item in db[collection_name].find({"id": {"$in": ids}}, {"_id": 0, "id": 1, "order": 1})
+        }
+        missing = [item_id for item_id in ids if item_id not in current]
+        if missing:
+            raise HTTPException(status_code=404, detail={"message": "Items not found", "ids": missing})
+        
+        # Only items whose position actually changed are written
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne({"id": item_id}, {"$set": {"order": position, "updated_at": now}})
+            for position, item_id in enumerate(ids, start=reorder_data.start)
+            if current[item_id] != position
+        ]
+        if operations:
+            await db[collection_name].bulk_write(operations, ordered=False)
+            cms_cache.invalidate(collection_name)
+        
+        logger.info(f"{collection_name} reordered by {current_user['username']}: {len(operations)} items moved")
+        return MessageResponse(message=f"Order updated for {len(operations)} items")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to reorder {collection}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to update order")
+
+# DATA EXPORT ENDPOINTS
+@api_router.get("/admin/{collection}/export")
+async def export_collection(
+    collection: str,
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    current_user: dict = Depends(admin_required)
+):
+    """Stream a collection as CSV or NDJSON, optionally limited to a date range"""
+    if collection not in EXPORT_COLLECTIONS:
+        raise HTTPException(status_code=404, detail="Export not available for this collection")
+    
+    date_field, fields = EXPORT_COLLECTIONS[collection]
+    query = {}
+    if start or end:
+        query[date_field] = {}
+        if start:
+            query[date_field]["$gte"] = start
+        if end:
+            query[date_field]["$lt"] = end
+    
+    projection = {field: 1 for field in fields}
+    projection["_id"] = 0
+    cursor = db[collection].find(query, projection, sort=[(date_field, 1)], batch_size=EXPORT_BATCH_SIZE)
+    
+    if format == "csv":
+        body, media_type = stream_csv(cursor, fields), "text/csv; charset=utf-8"
+    else:
+        body, media_type = stream_ndjson(cursor, fields), "application/x-ndjson"
+    
+    filename = f"{collection}-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.{format}"
+    logger.info(f"Export of {collection} ({format}) started by {current_user['username']}")
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 
 app.include_router(api_router)
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    pass
+    bootstrap_task = getattr(app.state, "bootstrap_task", None)
+    if bootstrap_task and not bootstrap_task.done():
+        bootstrap_task.cancel()
+        # Its finally blocks (releasing the startup lock) still need the client
+        await asyncio.gather(bootstrap_task, return_exceptions=True)
+    await write_buffer.close()
+    await snapshot_publisher.close()
+    close_mongo_connection()
+    password_hasher.shutdown()
@@ -0,0 +1,220 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import os
+
+from cache import cms_cache
+from compression import compress, supported_encodings
+
+logger = logging.getLogger(__name__)
+
+# Snapshot Configuration
+SNAPSHOT_ENABLED = os.environ.get('SNAPSHOT_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+SNAPSHOT_DIR = Path(os.environ.get('SNAPSHOT_DIR', str(Path(__file__).parent / 'snapshots')))
+SNAPSHOT_DEBOUNCE_MS = int(os.environ.get('SNAPSHOT_DEBOUNCE_MS', '250'))
+SNAPSHOT_GZIP_LEVEL = int(os.environ.get('SNAPSHOT_GZIP_LEVEL', '9'))
+SNAPSHOT_BROTLI_QUALITY = int(os.environ.get('SNAPSHOT_BROTLI_QUALITY', '11'))
+
+def snapshot_file(url: str) -> str:
+    """Relative file for a public URL; mirrors the $api_snapshot map in nginx.conf"""
+    path, _, query = url.partition("?")
+    stem = path.strip("/")
+    if query:
+        # Only single-parameter pages are snapshotted: /api/bootstrap?page=home -> api/bootstrap/home.json
+        stem += "/" + query.partition("=")[2]
+    return stem + ".json"
+
+class Snapshot:
+    """A public URL and the cached payload it is rendered from"""
+    __slots__ = ("url", "file", "collection", "key", "loader", "sources", "version")
+
+    def __init__(self, url: str, collection: str, key: Hashable, loader: Callable[[], Awaitable[Any]], sources: Sequence[str]):
+        self.url = url
+        self.file = snapshot_file(url)
+        self.collection = collection
+        self.key = key
+        self.loader = loader
+        self.sources = list(sources)
+        self.version: Optional[str] = None
+
+class SnapshotPublisher:
+    """Writes pre-encoded, precompressed public responses to disk whenever their collections change"""
+
+    def __init__(
+        self,
+        render: Callable[[Callable[[], Awaitable[Any]], Sequence[str]], Awaitable[Any]],
+        directory: Path = SNAPSHOT_DIR,
+        enabled: bool = SNAPSHOT_ENABLED,
+        debounce_ms: int = SNAPSHOT_DEBOUNCE_MS,
+    ):
+        # render(loader, sources) returns an object with body, etag and last_modified
+        self.render = render
+        self.directory = directory
+        self.enabled = enabled
+        self.debounce = debounce_ms / 1000
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._by_key: Dict[tuple, Snapshot] = {}
+        # url -> invalidations seen since its last publish
+        self._stale: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._published = 0
+        self._failed = 0
+        self._served = 0
+        self._last_published: Optional[datetime] = None
+        if enabled:
+            cms_cache.add_listener(self.collections_changed)
+
+    def register(
+        self,
+        url: str,
+        collection: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        sources: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Publish `url` from the same (collection, key) payload its endpoint caches"""
+        snapshot = Snapshot(url, collection, key, loader, sources or [collection])
+        self._snapshots[url] = snapshot
+        self._by_key[(collection, key)] = snapshot
+
+    def collections_changed(self, collections: set) -> None:
+        """Mark snapshots built from `collections` stale and schedule a republish"""
+        changed = [
+            url for url, snapshot in self._snapshots.items()
+            if snapshot.collection in collections or collections.intersection(snapshot.sources)
+        ]
+        if not changed:
+            return
+        for url in changed:
+            self._stale[url] = self._stale.get(url, 0) + 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        # Coalesce a burst of admin writes into one publish per snapshot
+        while self._stale:
+            await asyncio.sleep(self.debounce)
+            await self._publish(dict(self._stale))
+
+    async def publish_all(self) -> int:
+        """Render every registered snapshot; returns the number written"""
+        if not self.enabled:
+            return 0
+        return await self._publish({url: self._stale.get(url, 0) for url in self._snapshots})
+
+    async def _publish(self, batch: Dict[str, int]) -> int:
+        written = 0
+        for url, seen in batch.items():
+            snapshot = self._snapshots[url]
+            try:
+                entry = await self.render(snapshot.loader, snapshot.sources)
+                await asyncio.to_thread(self._write_files, snapshot, entry)
+            except Exception as e:
+                # Never leave an outdated file for nginx to serve; requests fall back to the app
+                logger.error(f"Snapshot {url} failed, removing it: {e}")
+                await asyncio.to_thread(self._remove_files, snapshot.file)
+                self._failed += 1
+                if self._stale.get(url) == seen:
+                    del self._stale[url]
+                continue
+            written += 1
+            self._published += 1
+            snapshot.version = entry.etag.strip('"')
+            # A write that landed while rendering keeps the snapshot stale for the next pass
+            if self._stale.get(url, 0) == seen:
+                self._stale.pop(url, None)
+                cms_cache.set(snapshot.collection, snapshot.key, entry)
+        self._last_published = datetime.utcnow()
+        if written:
+            logger.info(f"Published {written} public snapshots")
+        return written
+
+    def _write_files(self, snapshot: Snapshot, entry: Any) -> None:
+        stored = self._read_files(snapshot.file)
+        if stored is not None and stored[1] == entry.etag:
+            # Already on disk at this version (an earlier bootstrap of this deployment)
+            return
+        target = self.directory / snapshot.file
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Compressed variants go first so nginx never pairs a new body with an old .gz
+        variants = {".gz": compress(entry.body, "gzip", SNAPSHOT_GZIP_LEVEL)}
+        if "br" in supported_encodings():
+            variants[".br"] = compress(entry.body, "br", SNAPSHOT_BROTLI_QUALITY)
+        else:
+            target.with_name(target.name + ".br").unlink(missing_ok=True)
+        variants[""] = entry.body
+        for suffix, data in variants.items():
+            _atomic_write(target.with_name(target.name + suffix), data)
+
+        meta = {
+            "url": snapshot.url,
+            "version": entry.etag.strip('"'),
+            "etag": entry.etag,
+            "last_modified": entry.last_modified.isoformat() if entry.last_modified else None,
+            "sha256": hashlib.sha256(entry.body).hexdigest(),
+            "generated_at": datetime.utcnow().isoformat(),
+            "bytes": {suffix.lstrip(".") or "identity": len(data) for suffix, data in variants.items()},
+        }
+        # Not reachable through nginx: the $api_snapshot map only ever looks up *.json
+        _atomic_write(target.with_name(target.name + ".meta"), json.dumps(meta).encode("utf-8"))
+
+    def _remove_files(self, file: str) -> None:
+        target = self.directory / file
+        for suffix in ("", ".gz", ".br", ".meta"):
+            try:
+                target.with_name(target.name + suffix).unlink(missing_ok=True)
+            except OSError as e:
+                logger.error(f"Could not remove snapshot {target.name}{suffix}: {e}")
+
+    async def read(self, collection: str, key: Hashable) -> Optional[Tuple[bytes, str, Optional[datetime]]]:
+        """(body, etag, last_modified) of a current snapshot, or None to load from Mongo"""
+        if not self.enabled:
+            return None
+        snapshot = self._by_key.get((collection, key))
+        if snapshot is None or snapshot.url in self._stale:
+            return None
+        stored = await asyncio.to_thread(self._read_files, snapshot.file)
+        if stored is not None:
+            self._served += 1
+        return stored
+
+    def _read_files(self, file: str) -> Optional[Tuple[bytes, str, Optional[datetime]]]:
+        target = self.directory / file
+        try:
+            meta = json.loads(target.with_name(target.name + ".meta").read_bytes())
+            body = target.read_bytes()
+        except (OSError, ValueError):
+            return None
+        # Another worker may be halfway through replacing the pair
+        if hashlib.sha256(body).hexdigest() != meta.get("sha256"):
+            return None
+        last_modified = datetime.fromisoformat(meta["last_modified"]) if meta.get("last_modified") else None
+        return body, meta["etag"], last_modified
+
+    async def close(self) -> None:
+        """Finish a pending publish so no outdated snapshot outlives this worker"""
+        if self._task is not None and not self._task.done():
+            await self._task
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "directory": str(self.directory),
+            "brotli": "br" in supported_encodings(),
+            "snapshots": {url: snapshot.version for url, snapshot in self._snapshots.items()},
+            "stale": len(self._stale),
+            "published": self._published,
+            "failed": self._failed,
+            "served_from_disk": self._served,
+            "last_published": self._last_published.isoformat() if self._last_published else None,
+        }
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    # Readers (nginx or other workers) see either the old file or the new one, never a partial write
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temporary.write_bytes(data)
+    os.replace(temporary, path)
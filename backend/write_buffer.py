@@ -0,0 +1,181 @@
+from typing import Dict, List, Optional, Tuple
+from pymongo.errors import BulkWriteError
+import asyncio
+import logging
+import os
+
+from database import db
+
+logger = logging.getLogger(__name__)
+
+# Write Buffer Configuration
+WRITE_BUFFER_ENABLED = os.environ.get('WRITE_BUFFER_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+WRITE_BUFFER_MAX_BATCH = int(os.environ.get('WRITE_BUFFER_MAX_BATCH', '100'))
+WRITE_BUFFER_FLUSH_MS = int(os.environ.get('WRITE_BUFFER_FLUSH_MS', '20'))
+WRITE_BUFFER_MAX_PENDING = int(os.environ.get('WRITE_BUFFER_MAX_PENDING', '10000'))
+WRITE_BUFFER_RETRIES = int(os.environ.get('WRITE_BUFFER_RETRIES', '2'))
+# Per-collection durability, e.g. "contacts=async,volunteers=async,donations=sync":
+#   sync    - insert_one before responding (the default)
+#   batched - wait for the insert_many that carries the document (group commit)
+#   async   - respond once queued; the document is written by the next flush
+WRITE_BUFFER_DURABILITY = os.environ.get('WRITE_BUFFER_DURABILITY', 'contacts=async,volunteers=async,donations=sync')
+
+DURABILITY_MODES = ("sync", "batched", "async")
+DUPLICATE_KEY = 11000
+
+def _is_duplicate_id(error: dict) -> bool:
+    """A write error for a document whose _id is already stored"""
+    if error.get("code") != DUPLICATE_KEY:
+        return False
+    key_pattern = error.get("keyPattern")
+    if key_pattern is not None:
+        return list(key_pattern) == ["_id"]
+    return "index: _id_ " in error.get("errmsg", "")
+
+def _parse_durability(spec: str) -> Dict[str, str]:
+    durability = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        collection, mode = (part.strip() for part in item.split("=", 1))
+        if mode not in DURABILITY_MODES:
+            raise ValueError(f"Unknown write durability '{mode}' for {collection}")
+        durability[collection] = mode
+    return durability
+
+class WriteBuffer:
+    """Coalesces inserts into insert_many batches per collection"""
+
+    def __init__(
+        self,
+        enabled: bool = WRITE_BUFFER_ENABLED,
+        durability: Optional[Dict[str, str]] = None,
+        max_batch: int = WRITE_BUFFER_MAX_BATCH,
+        flush_ms: int = WRITE_BUFFER_FLUSH_MS,
+        max_pending: int = WRITE_BUFFER_MAX_PENDING,
+    ):
+        self.enabled = enabled
+        self.durability = durability if durability is not None else _parse_durability(WRITE_BUFFER_DURABILITY)
+        self.max_batch = max_batch
+        self.flush_interval = flush_ms / 1000
+        self.max_pending = max_pending
+        self._queues: Dict[str, List[Tuple[dict, Optional[asyncio.Future]]]] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self._closed = False
+        self._pending = 0
+        self._batches = 0
+        self._buffered_writes = 0
+        self._sync_writes = 0
+        self._largest_batch = 0
+        self._failed = 0
+
+    def mode(self, collection: str) -> str:
+        return self.durability.get(collection, "sync") if self.enabled else "sync"
+
+    async def insert(self, collection: str, document: dict) -> None:
+        """Insert a document with the durability configured for its collection"""
+        mode = self.mode(collection)
+        # Fall back to a direct write when buffering is off, shutting down, or backed up
+        if mode == "sync" or self._closed or self._pending >= self.max_pending:
+            await db[collection].insert_one(document)
+            self._sync_writes += 1
+            return
+
+        future = asyncio.get_running_loop().create_future() if mode == "batched" else None
+        self._queues.setdefault(collection, []).append((document, future))
+        self._pending += 1
+        self._ensure_flusher()
+        self._wakeup.set()
+        if future is not None:
+            await future
+
+    def _ensure_flusher(self) -> None:
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            # Let concurrent submissions join the batch unless a full batch is already waiting
+            if self._pending < self.max_batch:
+                await asyncio.sleep(self.flush_interval)
+            # Shielded so close() cannot cancel a batch halfway through its insert_many
+            self._inflight = asyncio.ensure_future(self.flush())
+            await asyncio.shield(self._inflight)
+
+    async def flush(self) -> None:
+        """Write everything queued so far"""
+        for collection, queue in list(self._queues.items()):
+            while queue:
+                batch = queue[:self.max_batch]
+                del queue[:self.max_batch]
+                await self._write(collection, batch)
+
+    async def _write(self, collection: str, batch: List[Tuple[dict, Optional[asyncio.Future]]]) -> None:
+        documents = [document for document, _ in batch]
+        errors: Dict[int, Exception] = {}
+        for attempt in range(WRITE_BUFFER_RETRIES + 1):
+            try:
+                await db[collection].insert_many(documents, ordered=False)
+                errors = {}
+                break
+            except BulkWriteError as e:
+                # Per-document failures (e.g. duplicate keys) will not succeed on retry
+                write_errors = e.details.get("writeErrors", [])
+                if attempt:
+                    # insert_many set each _id in place, so documents an interrupted attempt
+                    # already stored come back as duplicate _id errors: they were written
+                    write_errors = [error for error in write_errors if not _is_duplicate_id(error)]
+                errors = {error["index"]: e for error in write_errors}
+                break
+            except Exception as e:
+                errors = {index: e for index in range(len(documents))}
+                if attempt < WRITE_BUFFER_RETRIES:
+                    await asyncio.sleep(0.05 * 2 ** attempt)
+
+        for index, (document, future) in enumerate(batch):
+            error = errors.get(index)
+            if error is not None and future is None:
+                logger.error(f"Buffered insert into {collection} lost document {document.get('id')}: {error}")
+            if future is not None and not future.done():
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+        self._pending -= len(batch)
+        self._batches += 1
+        self._buffered_writes += len(batch) - len(errors)
+        self._failed += len(errors)
+        self._largest_batch = max(self._largest_batch, len(batch))
+
+    async def close(self) -> None:
+        """Stop the flusher and write whatever is still queued"""
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._inflight is not None:
+            await self._inflight
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "durability": {collection: self.mode(collection) for collection in self.durability},
+            "pending": self._pending,
+            "batches": self._batches,
+            "buffered_writes": self._buffered_writes,
+            "sync_writes": self._sync_writes,
+            "largest_batch": self._largest_batch,
+            "failed": self._failed,
+        }
+
+write_buffer = WriteBuffer()
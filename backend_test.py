@@ -9,6 +9,7 @@ import json
 import os
 from datetime import datetime
 import sys
+import time
 
 # Get backend URL from environment
 BACKEND_URL = os.environ.get('REACT_APP_BACKEND_URL', 'http://localhost:8001')
@@ -129,6 +130,25 @@ class BackendTester:
         except Exception as e:
             self.log_result("Health Check", False, "Connection failed", str(e))
     
+    def test_readiness(self):
+        """Test readiness probe once startup work has finished"""
+        try:
+            for _ in range(30):
+                response = self.session.get(f"{API_BASE}/ready")
+                if response.status_code != 503:
+                    break
+                time.sleep(1)
+            if response.status_code == 200:
+                data = response.json()
+                if data.get("seeded") and data.get("indexes_ready"):
+                    self.log_result("Readiness", True, f"Ready with index registry {data.get('index_registry_version', '')[:8]}")
+                else:
+                    self.log_result("Readiness", False, "Ready response missing startup flags", data)
+            else:
+                self.log_result("Readiness", False, f"HTTP {response.status_code}", response.text)
+        except Exception as e:
+            self.log_result("Readiness", False, "Connection failed", str(e))
+    
     def test_contact_form(self):
         """Test contact form submission"""
         try:
@@ -296,8 +316,8 @@ class BackendTester:
             response = self.session.get(f"{API_BASE}/news")
             if response.status_code == 200:
                 data = response.json()
-                if isinstance(data, list):
-                    self.log_result("Public News", True, f"Retrieved {len(data)} published news articles")
+                if isinstance(data, list) and not any("content" in item for item in data):
+                    self.log_result("Public News", True, f"Retrieved {len(data)} published news summaries")
                 else:
                     self.log_result("Public News", False, "Expected list response", data)
             else:
@@ -305,6 +325,69 @@ class BackendTester:
         except Exception as e:
             self.log_result("Public News", False, "Request failed", str(e))
     
+    def test_blog_facets(self):
+        """Test blog facet counts and category/tag filtering"""
+        try:
+            response = self.session.get(f"{API_BASE}/blogs/facets")
+            if response.status_code != 200:
+                self.log_result("Blog Facets", False, f"HTTP {response.status_code}", response.text)
+                return
+            facets = response.json()
+            if not all(field in facets for field in ["categories", "tags", "total"]):
+                self.log_result("Blog Facets", False, "Missing facet fields", facets)
+                return
+            self.log_result("Blog Facets", True, f"{len(facets['categories'])} categories, {len(facets['tags'])} tags over {facets['total']} posts")
+            
+            if facets["categories"]:
+                category = facets["categories"][0]
+                response = self.session.get(f"{API_BASE}/blogs", params={"category": category["name"]})
+                data = response.json()
+                if response.status_code == 200 and len(data) == category["count"] and all(post["category"] == category["name"] for post in data):
+                    self.log_result("Blog Category Filter", True, f"{len(data)} posts in {category['name']}")
+                else:
+                    self.log_result("Blog Category Filter", False, "Filtered posts do not match facet count", data)
+            
+            if facets["tags"]:
+                tag = facets["tags"][0]
+                response = self.session.get(f"{API_BASE}/blogs", params={"tag": tag["name"]})
+                data = response.json()
+                if response.status_code == 200 and len(data) == tag["count"] and all(tag["name"] in post["tags"] for post in data):
+                    self.log_result("Blog Tag Filter", True, f"{len(data)} posts tagged {tag['name']}")
+                else:
+                    self.log_result("Blog Tag Filter", False, "Filtered posts do not match facet count", data)
+        except Exception as e:
+            self.log_result("Blog Facets", False, "Request failed", str(e))
+    
+    def test_bootstrap(self):
+        """Test the aggregated homepage bootstrap payload and its revalidation"""
+        try:
+            response = self.session.get(f"{API_BASE}/bootstrap", params={"page": "home"})
+            if response.status_code != 200:
+                self.log_result("Homepage Bootstrap", False, f"HTTP {response.status_code}", response.text)
+                return
+            data = response.json()
+            sections = ["site_settings", "site_content", "impact_stats", "impact_highlights", "testimonials", "success_stories"]
+            missing = [section for section in sections if section not in data]
+            if missing:
+                self.log_result("Homepage Bootstrap", False, f"Missing sections: {missing}", data)
+                return
+            self.log_result("Homepage Bootstrap", True, f"{len(sections)} sections in one response")
+            
+            etag = response.headers.get("ETag")
+            response = self.session.get(f"{API_BASE}/bootstrap", params={"page": "home"}, headers={"If-None-Match": etag or ""})
+            if etag and response.status_code == 304:
+                self.log_result("Homepage Bootstrap Revalidation", True, "Unchanged bootstrap returned 304")
+            else:
+                self.log_result("Homepage Bootstrap Revalidation", False, f"Expected 304, got HTTP {response.status_code}")
+            
+            response = self.session.get(f"{API_BASE}/bootstrap", params={"page": "unknown"})
+            if response.status_code == 404:
+                self.log_result("Homepage Bootstrap Unknown Page", True, "Unknown page rejected")
+            else:
+                self.log_result("Homepage Bootstrap Unknown Page", False, f"Expected 404, got HTTP {response.status_code}")
+        except Exception as e:
+            self.log_result("Homepage Bootstrap", False, "Request failed", str(e))
+    
     def test_news_crud_operations(self):
         """Test news CRUD operations (requires admin token)"""
         if not self.admin_token:
@@ -331,9 +414,9 @@ class BackendTester:
             response = self.session.get(f"{API_BASE}/admin/news", headers=headers)
             if response.status_code == 200:
                 data = response.json()
-                if isinstance(data, list) and len(data) > 0:
-                    news_id = data[0].get("id")
-                    self.log_result("News Read", True, f"Retrieved {len(data)} news articles")
+                if isinstance(data.get("items"), list) and len(data["items"]) > 0:
+                    news_id = data["items"][0].get("id")
+                    self.log_result("News Read", True, f"Retrieved {len(data['items'])} news articles")
                 else:
                     self.log_result("News Read", False, "No news articles found", data)
                     return
@@ -359,6 +442,28 @@ class BackendTester:
             except Exception as e:
                 self.log_result("News Update", False, "Request failed", str(e))
         
+        # SEARCH (the update above published the article)
+        if news_id:
+            try:
+                response = self.session.get(f"{API_BASE}/search", params={"q": "youth training", "type": "news"})
+                if response.status_code == 200:
+                    data = response.json()
+                    hit = next((item for item in data.get("items", []) if item.get("id") == news_id), None)
+                    if hit and "<mark>" in hit.get("snippet", "") and "next_cursor" in data:
+                        self.log_result("News Search", True, f"Published article ranked with score {hit['score']}")
+                    else:
+                        self.log_result("News Search", False, "Published article missing from search hits", data)
+                else:
+                    self.log_result("News Search", False, f"HTTP {response.status_code}", response.text)
+                
+                response = self.session.get(f"{API_BASE}/search", params={"q": "y"})
+                if response.status_code == 422:
+                    self.log_result("Search Validation", True, "Too-short query rejected")
+                else:
+                    self.log_result("Search Validation", False, f"Expected 422, got {response.status_code}")
+            except Exception as e:
+                self.log_result("News Search", False, "Request failed", str(e))
+        
         # DELETE
         if news_id:
             try:
@@ -383,10 +488,10 @@ class BackendTester:
             response = self.session.get(f"{API_BASE}/admin/contacts", headers=headers)
             if response.status_code == 200:
                 data = response.json()
-                if isinstance(data, list):
-                    self.log_result("Admin Contacts", True, f"Retrieved {len(data)} contact submissions")
+                if isinstance(data.get("items"), list) and "next_cursor" in data:
+                    self.log_result("Admin Contacts", True, f"Retrieved {len(data['items'])} contact submissions")
                 else:
-                    self.log_result("Admin Contacts", False, "Expected list response", data)
+                    self.log_result("Admin Contacts", False, "Expected paginated response", data)
             else:
                 self.log_result("Admin Contacts", False, f"HTTP {response.status_code}", response.text)
         except Exception as e:
@@ -397,10 +502,10 @@ class BackendTester:
             response = self.session.get(f"{API_BASE}/admin/volunteers", headers=headers)
             if response.status_code == 200:
                 data = response.json()
-                if isinstance(data, list):
-                    self.log_result("Admin Volunteers", True, f"Retrieved {len(data)} volunteer applications")
+                if isinstance(data.get("items"), list) and "next_cursor" in data:
+                    self.log_result("Admin Volunteers", True, f"Retrieved {len(data['items'])} volunteer applications")
                 else:
-                    self.log_result("Admin Volunteers", False, "Expected list response", data)
+                    self.log_result("Admin Volunteers", False, "Expected paginated response", data)
             else:
                 self.log_result("Admin Volunteers", False, f"HTTP {response.status_code}", response.text)
         except Exception as e:
@@ -411,10 +516,10 @@ class BackendTester:
             response = self.session.get(f"{API_BASE}/admin/newsletters", headers=headers)
             if response.status_code == 200:
                 data = response.json()
-                if isinstance(data, list):
-                    self.log_result("Admin Newsletters", True, f"Retrieved {len(data)} newsletter subscribers")
+                if isinstance(data.get("items"), list) and "next_cursor" in data:
+                    self.log_result("Admin Newsletters", True, f"Retrieved {len(data['items'])} newsletter subscribers")
                 else:
-                    self.log_result("Admin Newsletters", False, "Expected list response", data)
+                    self.log_result("Admin Newsletters", False, "Expected paginated response", data)
             else:
                 self.log_result("Admin Newsletters", False, f"HTTP {response.status_code}", response.text)
         except Exception as e:
@@ -1653,20 +1758,33 @@ class BackendTester:
         
         # Test with contacts collection (should have data from our previous tests)
         try:
-            response = self.session.get(f"{API_BASE}/admin/database/contacts?limit=10&skip=0", headers=headers)
+            response = self.session.get(f"{API_BASE}/admin/database/contacts?limit=10", headers=headers)
             if response.status_code == 200:
                 data = response.json()
-                required_fields = ["collection", "documents", "total_count", "limit", "skip", "has_more"]
+                required_fields = ["collection", "documents", "total_count", "limit", "next_cursor", "has_more"]
                 
                 if all(field in data for field in required_fields):
                     if data["collection"] == "contacts" and isinstance(data["documents"], list):
                         self.log_result("Database Collection Data", True, f"Retrieved {len(data['documents'])} documents from contacts collection with pagination")
                         
                         # Verify pagination fields
-                        if data["limit"] == 10 and data["skip"] == 0:
+                        if data["limit"] == 10 and data["has_more"] == (data["next_cursor"] is not None):
                             self.log_result("Database Collection Pagination", True, "Pagination parameters working correctly")
                         else:
                             self.log_result("Database Collection Pagination", False, "Pagination parameters not reflected correctly")
+                        
+                        # Follow the cursor to the next page
+                        if data["next_cursor"]:
+                            next_page = self.session.get(
+                                f"{API_BASE}/admin/database/contacts",
+                                params={"limit": 10, "cursor": data["next_cursor"], "exact_count": "true"},
+                                headers=headers
+                            ).json()
+                            first_ids = {doc["_id"] for doc in data["documents"]}
+                            if not first_ids & {doc["_id"] for doc in next_page.get("documents", [])} and next_page.get("count_is_estimate") is False:
+                                self.log_result("Database Collection Cursor", True, "Next page is disjoint and exact count honoured")
+                            else:
+                                self.log_result("Database Collection Cursor", False, "Cursor page overlapped or exact count ignored", next_page)
                     else:
                         self.log_result("Database Collection Data", False, "Invalid collection data format", data)
                 else:
@@ -1778,7 +1896,7 @@ class BackendTester:
                         # Verify collection_stats structure
                         if data["collection_stats"]:
                             first_stat = data["collection_stats"][0]
-                            stat_fields = ["collection", "count", "size"]
+                            stat_fields = ["collection", "count", "size", "storage_size", "index_size"]
                             if all(field in first_stat for field in stat_fields):
                                 self.log_result("Database Stats Structure", True, "Collection statistics have proper structure")
                             else:
@@ -2460,6 +2578,317 @@ class BackendTester:
         except Exception as e:
             self.log_result("Detailed Page Section Delete Not Found", False, "Request failed", str(e))
     
+    def test_public_cache_invalidation(self):
+        """Test that admin writes are visible immediately on cached public endpoints"""
+        if not self.admin_token:
+            self.log_result("Public Cache Invalidation", False, "No admin token available")
+            return
+        
+        headers = {"Authorization": f"Bearer {self.admin_token}"}
+        try:
+            # Warm the cache
+            self.session.get(f"{API_BASE}/success-stories")
+            
+            story = dict(TEST_SUCCESS_STORY, name="Cache Invalidation Story")
+            response = self.session.post(f"{API_BASE}/admin/success-stories", json=story, headers=headers)
+            if response.status_code != 200:
+                self.log_result("Public Cache Invalidation", False, f"Create failed: HTTP {response.status_code}", response.text)
+                return
+            
+            response = self.session.get(f"{API_BASE}/success-stories")
+            stories = response.json().get("stories", [])
+            created = next((s for s in stories if s.get("name") == "Cache Invalidation Story"), None)
+            if created:
+                self.log_result("Public Cache Invalidation", True, "New story visible on public endpoint after create")
+                self.session.delete(f"{API_BASE}/admin/success-stories/{created['id']}", headers=headers)
+            else:
+                self.log_result("Public Cache Invalidation", False, "Stale cached response after create", stories)
+        except Exception as e:
+            self.log_result("Public Cache Invalidation", False, "Request failed", str(e))
+    
+    def test_conditional_get(self):
+        """Test ETag / If-None-Match handling on public GET endpoints"""
+        for endpoint in ["site-settings", "site-content", "testimonials", "blogs"]:
+            test_name = f"Conditional GET /{endpoint}"
+            try:
+                response = self.session.get(f"{API_BASE}/{endpoint}")
+                etag = response.headers.get("ETag")
+                if response.status_code != 200 or not etag:
+                    self.log_result(test_name, False, f"Missing ETag (HTTP {response.status_code})", dict(response.headers))
+                    continue
+                
+                response = self.session.get(f"{API_BASE}/{endpoint}", headers={"If-None-Match": etag})
+                if response.status_code == 304 and not response.content:
+                    self.log_result(test_name, True, "Matching If-None-Match answered with 304")
+                else:
+                    self.log_result(test_name, False, f"Expected 304, got HTTP {response.status_code}", response.text)
+            except Exception as e:
+                self.log_result(test_name, False, "Request failed", str(e))
+    
+    def test_admin_keyset_pagination(self):
+        """Test cursor-based pagination on admin list endpoints"""
+        if not self.admin_token:
+            self.log_result("Admin Keyset Pagination", False, "No admin token available")
+            return
+        
+        headers = {"Authorization": f"Bearer {self.admin_token}"}
+        try:
+            seen = []
+            cursor = None
+            for _ in range(3):
+                params = {"limit": 1}
+                if cursor:
+                    params["cursor"] = cursor
+                response = self.session.get(f"{API_BASE}/admin/contacts", params=params, headers=headers)
+                if response.status_code != 200:
+                    self.log_result("Admin Keyset Pagination", False, f"HTTP {response.status_code}", response.text)
+                    return
+                data = response.json()
+                seen.extend(item["id"] for item in data["items"])
+                cursor = data.get("next_cursor")
+                if not cursor:
+                    break
+            
+            if len(seen) == len(set(seen)):
+                self.log_result("Admin Keyset Pagination", True, f"Walked {len(seen)} pages without duplicates")
+            else:
+                self.log_result("Admin Keyset Pagination", False, "Duplicate rows across pages", seen)
+            
+            response = self.session.get(f"{API_BASE}/admin/contacts", params={"cursor": "not-a-cursor"}, headers=headers)
+            if response.status_code == 400:
+                self.log_result("Admin Keyset Pagination (Invalid Cursor)", True, "Invalid cursor rejected")
+            else:
+                self.log_result("Admin Keyset Pagination (Invalid Cursor)", False, f"Expected 400, got HTTP {response.status_code}", response.text)
+        except Exception as e:
+            self.log_result("Admin Keyset Pagination", False, "Request failed", str(e))
+    
+    def test_streaming_export(self):
+        """Test streaming CSV/NDJSON export endpoints"""
+        if not self.admin_token:
+            self.log_result("Streaming Export", False, "No admin token available")
+            return
+        
+        headers = {"Authorization": f"Bearer {self.admin_token}"}
+        try:
+            response = self.session.get(f"{API_BASE}/admin/contacts/export", params={"format": "csv"}, headers=headers)
+            if response.status_code == 200 and response.text.startswith("id,name,email"):
+                self.log_result("Streaming Export (CSV)", True, f"Exported {len(response.text.splitlines()) - 1} contacts as CSV")
+            else:
+                self.log_result("Streaming Export (CSV)", False, f"HTTP {response.status_code}", response.text[:200])
+            
+            response = self.session.get(
+                f"{API_BASE}/admin/donations/export",
+                params={"format": "ndjson", "start": "2000-01-01T00:00:00"},
+                headers=headers
+            )
+            lines = [line for line in response.text.splitlines() if line]
+            if response.status_code == 200 and all(json.loads(line).get("id") for line in lines):
+                self.log_result("Streaming Export (NDJSON)", True, f"Exported {len(lines)} donations as NDJSON")
+            else:
+                self.log_result("Streaming Export (NDJSON)", False, f"HTTP {response.status_code}", response.text[:200])
+            
+            response = self.session.get(f"{API_BASE}/admin/admin_users/export", headers=headers)
+            if response.status_code == 404:
+                self.log_result("Streaming Export (Not Allowed)", True, "Non-exportable collection rejected")
+            else:
+                self.log_result("Streaming Export (Not Allowed)", False, f"Expected 404, got HTTP {response.status_code}", response.text[:200])
+        except Exception as e:
+            self.log_result("Streaming Export", False, "Request failed", str(e))
+    
+    def test_cms_bulk_import(self):
+        """Test bulk insert/update of gallery items with per-item results"""
+        if not self.admin_token:
+            self.log_result("CMS Bulk Import", False, "No admin token available")
+            return
+        
+        headers = {"Authorization": f"Bearer {self.admin_token}"}
+        items = [
+            {"title": f"Bulk Item {i}", "description": "Bulk imported gallery item", "image": "https://example.com/bulk.jpg",
+             "category": "Events", "date": "2024", "is_active": False}
+            for i in range(3)
+        ]
+        try:
+            response = self.session.post(f"{API_BASE}/admin/gallery-items/bulk", json={"items": items + [{"title": "Missing fields"}]}, headers=headers)
+            data = response.json()
+            statuses = [result["status"] for result in data.get("results", [])]
+            if response.status_code != 200 or statuses != ["inserted", "inserted", "inserted", "invalid"]:
+                self.log_result("CMS Bulk Import", False, "Unexpected per-item results", data)
+                return
+            
+            ids = [result["id"] for result in data["results"][:3]]
+            update = [{**items[0], "id": ids[0], "title": "Bulk Item Renamed"}]
+            response = self.session.post(f"{API_BASE}/admin/gallery-items/bulk", json={"items": update, "ordered": True}, headers=headers)
+            if response.status_code == 200 and response.json().get("updated") == 1:
+                self.log_result("CMS Bulk Import", True, "3 inserted, 1 rejected by validation, 1 updated by id")
+            else:
+                self.log_result("CMS Bulk Import", False, "Update by id failed", response.json())
+            
+            # Reverse the three items in one request
+            response = self.session.patch(f"{API_BASE}/admin/gallery-items/order", json={"ids": ids[::-1]}, headers=headers)
+            if response.status_code == 200:
+                self.log_result("CMS Bulk Reorder", True, response.json().get("message"))
+            else:
+                self.log_result("CMS Bulk Reorder", False, f"HTTP {response.status_code}", response.text)
+            
+            response = self.session.patch(f"{API_BASE}/admin/gallery-items/order", json={"ids": ["missing-id"]}, headers=headers)
+            if response.status_code == 404:
+                self.log_result("CMS Reorder Validation", True, "Unknown ids rejected")
+            else:
+                self.log_result("CMS Reorder Validation", False, f"Expected 404, got {response.status_code}")
+            
+            for item_id in ids:
+                self.session.delete(f"{API_BASE}/admin/gallery-items/{item_id}", headers=headers)
+        except Exception as e:
+            self.log_result("CMS Bulk Import", False, "Request failed", str(e))
+    
+    def test_newsletter_batch_import(self):
+        """Test bulk newsletter import counts"""
+        if not self.admin_token:
+            self.log_result("Newsletter Batch Import", False, "No admin token available")
+            return
+        
+        headers = {"Authorization": f"Bearer {self.admin_token}"}
+        suffix = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        emails = [f"import.{suffix}.{i}@example.com" for i in range(3)]
+        try:
+            response = self.session.post(f"{API_BASE}/newsletter/subscribe-batch", json={"emails": emails}, headers=headers)
+            first = response.json()
+            response = self.session.post(f"{API_BASE}/newsletter/subscribe-batch", json={"emails": emails + emails[:1]}, headers=headers)
+            second = response.json()
+            if first.get("subscribed") == 3 and second.get("already_subscribed") == 3 and second.get("subscribed") == 0:
+                self.log_result("Newsletter Batch Import", True, "New and existing subscribers counted correctly")
+            else:
+                self.log_result("Newsletter Batch Import", False, "Unexpected import counts", {"first": first, "second": second})
+        except Exception as e:
+            self.log_result("Newsletter Batch Import", False, "Request failed", str(e))
+    
+    def test_response_compression(self):
+        """Test Accept-Encoding negotiation on cached public and admin JSON responses"""
+        if not self.admin_token:
+            self.log_result("Response Compression", False, "No admin token available")
+            return
+        
+        headers = {"Authorization": f"Bearer {self.admin_token}", "Accept-Encoding": "gzip"}
+        try:
+            for path in ["/blogs", "/admin/database/contacts"]:
+                response = self.session.get(f"{API_BASE}{path}", headers=headers)
+                encoding = response.headers.get("Content-Encoding")
+                vary = response.headers.get("Vary", "")
+                # Bodies below COMPRESSION_MIN_SIZE are sent uncompressed
+                compressed_ok = encoding == "gzip" or len(response.content) < 1024
+                if response.status_code == 200 and "accept-encoding" in vary.lower() and compressed_ok:
+                    self.log_result(f"Response Compression {path}", True, f"Content-Encoding: {encoding or 'identity'} ({len(response.content)} bytes decoded)")
+                else:
+                    self.log_result(f"Response Compression {path}", False, f"HTTP {response.status_code}, encoding {encoding}, vary {vary!r}")
+            
+            response = self.session.get(f"{API_BASE}/admin/database/contacts", headers={**headers, "Accept-Encoding": "identity"})
+            if response.status_code == 200 and not response.headers.get("Content-Encoding"):
+                self.log_result("Response Compression Identity", True, "Identity requested, body sent uncompressed")
+            else:
+                self.log_result("Response Compression Identity", False, f"Unexpected encoding {response.headers.get('Content-Encoding')}")
+        except Exception as e:
+            self.log_result("Response Compression", False, "Request failed", str(e))
+    
+    def test_snapshot_publish(self):
+        """Test regenerating the public snapshots (409 when SNAPSHOT_ENABLED is off)"""
+        if not self.admin_token:
+            self.log_result("Snapshot Publish", False, "No admin token available")
+            return
+        
+        headers = {"Authorization": f"Bearer {self.admin_token}"}
+        try:
+            response = self.session.post(f"{API_BASE}/admin/snapshots/publish", headers=headers)
+            if response.status_code == 409:
+                self.log_result("Snapshot Publish", True, "Snapshots disabled on this server")
+                return
+            metrics = self.session.get(f"{API_BASE}/admin/system/metrics", headers=headers).json()
+            snapshots = metrics.get("snapshots", {})
+            if response.status_code == 200 and snapshots.get("stale") == 0 and "/api/site-settings" in snapshots.get("snapshots", {}):
+                self.log_result("Snapshot Publish", True, response.json().get("message"))
+            else:
+                self.log_result("Snapshot Publish", False, f"HTTP {response.status_code}", snapshots)
+        except Exception as e:
+            self.log_result("Snapshot Publish", False, "Request failed", str(e))
+    
+    def test_donation_summary(self):
+        """Test that donation rollups track a new donation"""
+        if not self.admin_token:
+            self.log_result("Donation Summary", False, "No admin token available")
+            return
+        
+        headers = {"Authorization": f"Bearer {self.admin_token}"}
+        
+        def inr_total(summary):
+            total = next((item for item in summary.get("totals", []) if item["currency"] == "INR"), None)
+            return (total["count"], total["amount"]) if total else (0, 0)
+        
+        try:
+            response = self.session.get(f"{API_BASE}/admin/donations/summary", headers=headers)
+            if response.status_code != 200:
+                self.log_result("Donation Summary", False, f"HTTP {response.status_code}", response.text)
+                return
+            count_before, amount_before = inr_total(response.json())
+            
+            donation = {"name": "Rollup Donor", "email": "rollup.donor@example.com", "amount": 250.0, "currency": "INR"}
+            self.session.post(f"{API_BASE}/donation", json=donation)
+            
+            summary = self.session.get(f"{API_BASE}/admin/donations/summary", headers=headers).json()
+            count_after, amount_after = inr_total(summary)
+            if count_after == count_before + 1 and round(amount_after - amount_before, 2) == 250.0 and summary.get("daily"):
+                self.log_result("Donation Summary", True, f"INR total {amount_after} over {count_after} donations")
+            else:
+                self.log_result("Donation Summary", False, "Rollup did not reflect the new donation", summary)
+        except Exception as e:
+            self.log_result("Donation Summary", False, "Request failed", str(e))
+    
+    def test_admin_reports(self):
+        """Test daily donor and volunteer analytics reports"""
+        if not self.admin_token:
+            self.log_result("Admin Reports", False, "No admin token available")
+            return
+        
+        headers = {"Authorization": f"Bearer {self.admin_token}"}
+        try:
+            response = self.session.get(f"{API_BASE}/admin/reports", params={"refresh": "true"}, headers=headers)
+            if response.status_code != 200:
+                self.log_result("Admin Reports", False, f"HTTP {response.status_code}", response.text)
+                return
+            data = response.json()
+            sections = ["cohort_retention", "donor_lifetime_value", "recurring_churn", "volunteer_interests", "contacts"]
+            if not all(section in data for section in sections):
+                self.log_result("Admin Reports", False, "Missing report sections", data)
+                return
+            
+            # A second request the same day must be served from the daily snapshot
+            cached = self.session.get(f"{API_BASE}/admin/reports", headers=headers).json()
+            if cached.get("generated_at") == data.get("generated_at"):
+                self.log_result("Admin Reports", True, f"{len(data['cohort_retention'])} cohorts, {data['recurring_churn']['donors']} recurring donors")
+            else:
+                self.log_result("Admin Reports", False, "Reports recomputed instead of cached", cached)
+        except Exception as e:
+            self.log_result("Admin Reports", False, "Request failed", str(e))
+    
+    def test_system_metrics(self):
+        """Test worker runtime metrics endpoint"""
+        if not self.admin_token:
+            self.log_result("System Metrics", False, "No admin token available")
+            return
+        
+        headers = {"Authorization": f"Bearer {self.admin_token}"}
+        try:
+            response = self.session.get(f"{API_BASE}/admin/system/metrics", headers=headers)
+            if response.status_code == 200:
+                data = response.json()
+                hashing = data.get("password_hashing", {})
+                if all(field in hashing for field in ["workers", "pending", "queued", "completed", "rejected"]):
+                    self.log_result("System Metrics", True, f"Password pool: {hashing['completed']} completed, {hashing['rejected']} rejected")
+                else:
+                    self.log_result("System Metrics", False, "Missing password hashing metrics", data)
+            else:
+                self.log_result("System Metrics", False, f"HTTP {response.status_code}", response.text)
+        except Exception as e:
+            self.log_result("System Metrics", False, "Request failed", str(e))
+    
     def run_all_tests(self):
         """Run all backend tests"""
         print(f"🚀 Starting Backend API Tests for Shield Foundation")
@@ -2468,6 +2897,7 @@ class BackendTester:
         
         # Basic connectivity and health
         self.test_health_check()
+        self.test_readiness()
         
         # Public endpoints
         self.test_contact_form()
@@ -2478,6 +2908,8 @@ class BackendTester:
         self.test_newsletter_duplicate()
         self.test_impact_stats()
         self.test_public_news()
+        self.test_blog_facets()
+        self.test_bootstrap()
         self.test_success_stories_public()
         self.test_leadership_team_public()
         self.test_page_sections_public()
@@ -2550,6 +2982,20 @@ class BackendTester:
             
             # Enhanced Page Sections API
             self.test_detailed_page_sections_crud_operations()
+            
+            # Performance features
+            print("\n⚡ TESTING PERFORMANCE FEATURES")
+            print("=" * 60)
+            self.test_public_cache_invalidation()
+            self.test_admin_keyset_pagination()
+            self.test_streaming_export()
+            self.test_cms_bulk_import()
+            self.test_newsletter_batch_import()
+            self.test_snapshot_publish()
+            self.test_response_compression()
+            self.test_donation_summary()
+            self.test_admin_reports()
+            self.test_system_metrics()
         
         # Test new features auth requirements (without token)
         print("\n🔒 TESTING NEW FEATURES AUTH REQUIREMENTS")
@@ -2565,6 +3011,7 @@ class BackendTester:
         
         self.test_site_settings_public()
         self.test_detailed_page_sections_public()
+        self.test_conditional_get()
         
         # Summary
         print("\n" + "=" * 60)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for admin request authentication
+Compares full JWT verification against the verified-token cache fast path
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent / "backend"
+sys.path.insert(0, str(backend_dir))
+
+import auth
+from fastapi.security import HTTPAuthorizationCredentials
+
+ITERATIONS = 20000
+
+async def time_requests(credentials, iterations):
+    """Return mean microseconds per get_current_user call"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await auth.get_current_user(credentials)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+async def run_benchmark():
+    token = auth.create_access_token({"sub": "admin", "role": "super_admin"})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    auth.TOKEN_CACHE_ENABLED = False
+    uncached = await time_requests(credentials, ITERATIONS)
+
+    auth.TOKEN_CACHE_ENABLED = True
+    auth.token_cache.clear()
+    cached = await time_requests(credentials, ITERATIONS)
+
+    print(f"📊 get_current_user over {ITERATIONS} calls")
+    print(f"   Full verification: {uncached:8.2f} µs/request")
+    print(f"   Cached claims:     {cached:8.2f} µs/request")
+    print(f"   Speedup:           {uncached / cached:8.1f}x")
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for JSON response encoding on the list endpoints
+Compares FastAPI's default path (jsonable_encoder + stdlib json) against the
+orjson response class and the pre-encoded bytes kept in the public cache
+"""
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent / "backend"
+sys.path.insert(0, str(backend_dir))
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+
+from cache import TTLCache
+from responses import APIJSONResponse
+
+ROW_COUNTS = [20, 100, 1000]
+MIN_SECONDS = 0.5
+
+def contact_rows(count):
+    """Rows shaped like /api/admin/contacts items before the .isoformat() calls"""
+    now = datetime.utcnow()
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"Contact {i}",
+            "email": f"contact{i}@example.com",
+            "phone": "+91 98765 43210",
+            "subject": "Volunteering enquiry",
+            "message": "I would like to know more about the programmes in my area. " * 3,
+            "inquiry_type": "volunteer",
+            "created_at": now - timedelta(minutes=i),
+            "status": "new",
+        }
+        for i in range(count)
+    ]
+
+def collection_rows(count):
+    """Raw documents as returned by the database explorer (ObjectId _id, nested dates)"""
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "id": str(uuid.uuid4()),
+            "title": f"Blog post {i}",
+            "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20,
+            "tags": ["community", "seniors", "skills"],
+            "created_at": now - timedelta(hours=i),
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+
+def stringify(rows):
+    # What the handlers had to do before the stdlib encoder could see the rows
+    result = []
+    for row in rows:
+        row = dict(row)
+        for key, value in row.items():
+            if isinstance(value, ObjectId):
+                row[key] = str(value)
+            elif isinstance(value, datetime):
+                row[key] = value.isoformat()
+        result.append(row)
+    return result
+
+def per_call(fn):
+    """Mean microseconds per call, repeating until MIN_SECONDS have elapsed"""
+    iterations = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        iterations += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SECONDS:
+            return elapsed / iterations * 1_000_000
+
+def run_benchmark():
+    cache = TTLCache()
+    print("📊 Response encoding, µs per response (lower is better)")
+    print(f"   {'payload':<22}{'rows':>6}{'stdlib':>12}{'orjson':>12}{'cached':>10}{'speedup':>10}")
+    for name, make_rows in [("admin contacts", contact_rows), ("database explorer", collection_rows)]:
+        for count in ROW_COUNTS:
+            rows = make_rows(count)
+            payload = {"items": rows, "next_cursor": None, "limit": count}
+
+            stdlib = per_call(lambda: JSONResponse(jsonable_encoder({**payload, "items": stringify(rows)})).body)
+            fast = per_call(lambda: APIJSONResponse(payload).body)
+
+            cache.set("bench", count, APIJSONResponse(payload).body)
+            cached = per_call(lambda: cache.get("bench", count))
+
+            assert APIJSONResponse(payload).body == JSONResponse(jsonable_encoder({**payload, "items": stringify(rows)})).body
+            print(f"   {name:<22}{count:>6}{stdlib:>12.1f}{fast:>12.1f}{cached:>10.2f}{stdlib / fast:>9.1f}x")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for list row shaping
+Compares the former per-document Python loops against rows shaped by the server-side
+projections, timing everything the worker does per row: BSON decode, reshape, JSON encode
+"""
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent / "backend"
+sys.path.insert(0, str(backend_dir))
+
+import bson
+from bson import ObjectId
+
+from responses import dumps
+
+ROWS = 1000
+MIN_SECONDS = 0.5
+
+def contact_document(i, now):
+    return {
+        "_id": ObjectId(), "id": str(uuid.uuid4()), "name": f"Contact {i}", "email": f"contact{i}@example.com",
+        "phone": "+91 98765 43210", "subject": "Volunteering enquiry",
+        "message": "I would like to know more about the programmes in my area. " * 3,
+        "inquiry_type": "volunteer", "created_at": now - timedelta(minutes=i), "status": "new",
+    }
+
+def donation_document(i, now):
+    return {
+        "_id": ObjectId(), "id": str(uuid.uuid4()), "name": f"Donor {i}", "email": f"donor{i}@example.com",
+        "phone": None, "amount": 500.0 + i, "currency": "INR", "payment_method": "upi", "message": None,
+        "anonymous": False, "recurring": i % 3 == 0, "frequency": "monthly" if i % 3 == 0 else None,
+        "status": "completed", "payment_reference": f"UPI{i:08d}", "notes": None,
+        "created_at": now - timedelta(hours=i), "updated_at": now,
+    }
+
+def blog_document(i, now):
+    return {
+        "_id": ObjectId(), "id": str(uuid.uuid4()), "title": f"Blog post {i}", "excerpt": "Short summary of the post.",
+        "content": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 40, "category": "Community",
+        "tags": ["seniors", "skills"], "image": None, "status": "published", "author": "admin",
+        "created_at": now - timedelta(days=i), "updated_at": now,
+    }
+
+# The loops the handlers ran before the projections did the shaping
+def contact_loop(contact):
+    return {
+        "id": contact.get("id", str(contact["_id"])),
+        "name": contact["name"],
+        "email": contact["email"],
+        "phone": contact.get("phone"),
+        "subject": contact["subject"],
+        "message": contact["message"],
+        "inquiry_type": contact.get("inquiry_type"),
+        "created_at": contact["created_at"],
+        "status": contact.get("status", "new"),
+    }
+
+def donation_loop(donation):
+    return {
+        "id": donation.get("id", str(donation["_id"])),
+        "name": donation["name"], "email": donation["email"], "phone": donation.get("phone"),
+        "amount": donation["amount"], "currency": donation["currency"], "payment_method": donation["payment_method"],
+        "message": donation.get("message"), "anonymous": donation.get("anonymous", False),
+        "recurring": donation.get("recurring", False), "frequency": donation.get("frequency"),
+        "status": donation.get("status", "pending"), "payment_reference": donation.get("payment_reference"),
+        "notes": donation.get("notes"), "created_at": donation["created_at"], "updated_at": donation["updated_at"],
+    }
+
+def blog_admin_loop(blog_item):
+    return {
+        "id": blog_item.get("id", str(blog_item["_id"])),
+        "title": blog_item["title"], "excerpt": blog_item.get("excerpt", ""), "content": blog_item["content"],
+        "category": blog_item.get("category", ""), "tags": blog_item.get("tags", []), "image": blog_item.get("image"),
+        "status": blog_item["status"], "author": blog_item["author"],
+        "date": blog_item["created_at"], "updated_at": blog_item.get("updated_at", blog_item["created_at"]),
+    }
+
+def blog_summary_loop(blog_item):
+    return {
+        "id": blog_item.get("id", str(blog_item["_id"])),
+        "title": blog_item["title"], "excerpt": blog_item.get("excerpt", ""),
+        "category": blog_item.get("category", ""), "tags": blog_item.get("tags", []), "image": blog_item.get("image"),
+        "author": blog_item["author"],
+        "publishDate": blog_item["created_at"].isoformat() if blog_item.get("created_at") else None,
+        "status": blog_item["status"],
+    }
+
+def fetched(documents, fields=None):
+    """BSON of the documents as the server would send them (optionally limited to `fields`)"""
+    if fields:
+        documents = [{key: document[key] for key in ["_id", *fields]} for document in documents]
+    return b"".join(bson.encode(document) for document in documents)
+
+def per_row(fn):
+    """Mean microseconds per row, repeating until MIN_SECONDS have elapsed"""
+    iterations = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        iterations += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SECONDS:
+            return elapsed / iterations / ROWS * 1_000_000
+
+def run_benchmark():
+    now = datetime.utcnow()
+    summary_fields = ["id", "title", "excerpt", "category", "tags", "image", "author", "status", "created_at"]
+    cases = [
+        ("admin contacts", contact_document, contact_loop, None),
+        ("admin donations", donation_document, donation_loop, None),
+        ("admin blogs", blog_document, blog_admin_loop, None),
+        ("published blogs", blog_document, blog_summary_loop, summary_fields),
+    ]
+    print(f"📊 List shaping over {ROWS} rows, µs per row (decode + shape + encode)")
+    print(f"   {'endpoint':<18}{'python loop':>13}{'projection':>12}{'speedup':>10}")
+    for name, make_document, loop, fields in cases:
+        documents = [make_document(i, now) for i in range(ROWS)]
+        raw = fetched(documents, fields)
+        # What the projection returns: the loop's output, built from round-tripped (millisecond) dates
+        shaped = b"".join(bson.encode(loop(document)) for document in bson.decode_all(raw))
+
+        before = per_row(lambda: dumps([loop(document) for document in bson.decode_all(raw)]))
+        after = per_row(lambda: dumps(bson.decode_all(shaped)))
+
+        assert dumps([loop(document) for document in bson.decode_all(raw)]) == dumps(bson.decode_all(shaped))
+        print(f"   {name:<18}{before:>13.2f}{after:>12.2f}{before / after:>9.1f}x")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -34,6 +34,54 @@ apiClient.interceptors.response.use(
   }
 );
 
+// Admin tables load one keyset page at a time and ask for the next with its cursor
+const ADMIN_PAGE_SIZE = 50;
+
+// Fetch one page of a cursor-paginated admin list: { items, next_cursor, limit }
+const fetchPage = async (path, cursor = null, limit = ADMIN_PAGE_SIZE) => {
+  const params = cursor ? { limit, cursor } : { limit };
+  const response = await apiClient.get(path, { params });
+  return response.data;
+};
+
+// Homepage data arrives in one /bootstrap request shared by every section that needs it.
+// Only routes listed here use it; elsewhere (Header/Footer on other pages) each section
+// keeps its own endpoint instead of downloading the homepage payload.
+const BOOTSTRAP_ROUTES = { '/': 'home' };
+const BOOTSTRAP_TTL_MS = 30000;
+const bootstrapRequests = {};
+
+const loadBootstrap = (page) => {
+  const cached = bootstrapRequests[page];
+  if (!cached || Date.now() - cached.requestedAt > BOOTSTRAP_TTL_MS) {
+    const request = apiClient.get('/bootstrap', { params: { page } }).then((response) => response.data);
+    bootstrapRequests[page] = { request, requestedAt: Date.now() };
+    request.catch(() => {
+      if (bootstrapRequests[page]?.request === request) {
+        delete bootstrapRequests[page];
+      }
+    });
+  }
+  return bootstrapRequests[page].request;
+};
+
+// Read one section from the current page's bootstrap payload, falling back to its own endpoint
+const getBootstrapSection = async (section, path) => {
+  const page = BOOTSTRAP_ROUTES[window.location.pathname];
+  if (page) {
+    try {
+      const data = await loadBootstrap(page);
+      if (data && section in data) {
+        return data[section];
+      }
+    } catch (error) {
+      console.log(`Bootstrap unavailable, fetching ${path} directly`);
+    }
+  }
+  const response = await apiClient.get(path);
+  return response.data;
+};
+
 // PUBLIC API FUNCTIONS
 export const api = {
   // Contact form submission
@@ -78,9 +126,15 @@ export const api = {
   return response.data;
   },
 
-    // Get published blogs
-  getPublishedBlogs: async () => {
-    const response = await apiClient.get('/blogs');
+    // Get published blogs, optionally filtered by { category, tag }
+  getPublishedBlogs: async (filters = {}) => {
+    const response = await apiClient.get('/blogs', { params: filters });
+    return response.data;
+  },
+
+  // Get category and tag counts for published blogs
+  getBlogFacets: async () => {
+    const response = await apiClient.get('/blogs/facets');
     return response.data;
   },
 
@@ -89,6 +143,14 @@ export const api = {
   return response.data;
   },
 
+  // Full-text search over published blogs and news, ranked by relevance
+  searchContent: async (q, type = 'all', cursor = null, limit = 10) => {
+    const params = { q, type, limit };
+    if (cursor) params.cursor = cursor;
+    const response = await apiClient.get('/search', { params });
+    return response.data;
+  },
+
   // Get impact statistics
   getImpactStats: async () => {
     const response = await apiClient.get('/impact-stats');
@@ -113,28 +175,24 @@ export const api = {
       localStorage.removeItem('adminUser');
     },
 
-    // Get contacts
-    getContacts: async () => {
-      const response = await apiClient.get('/admin/contacts');
-      return response.data;
+    // Get one page of contacts; pass next_cursor for the following page
+    getContacts: async (cursor = null) => {
+      return fetchPage('/admin/contacts', cursor);
     },
 
-    // Get volunteers
-    getVolunteers: async () => {
-      const response = await apiClient.get('/admin/volunteers');
-      return response.data;
+    // Get one page of volunteers
+    getVolunteers: async (cursor = null) => {
+      return fetchPage('/admin/volunteers', cursor);
     },
 
-    // Get newsletter subscribers
-    getNewsletterSubscribers: async () => {
-      const response = await apiClient.get('/admin/newsletters');
-      return response.data;
+    // Get one page of newsletter subscribers
+    getNewsletterSubscribers: async (cursor = null) => {
+      return fetchPage('/admin/newsletters', cursor);
     },
 
-    // Get all news (including drafts)
-    getAllNews: async () => {
-      const response = await apiClient.get('/admin/news');
-      return response.data;
+    // Get one page of news (including drafts)
+    getAllNews: async (cursor = null) => {
+      return fetchPage('/admin/news', cursor);
     },
 
     // Create news
@@ -155,10 +213,9 @@ export const api = {
       return response.data;
     },
 
-    // Get all blogs (including drafts)
-    getAllBlogs: async () => {
-      const response = await apiClient.get('/admin/blogs');
-      return response.data;
+    // Get one page of blogs (including drafts)
+    getAllBlogs: async (cursor = null) => {
+      return fetchPage('/admin/blogs', cursor);
     },
 
     // Create a blog
@@ -266,6 +323,18 @@ export const api = {
       return response.data;
     },
 
+    // Bulk insert/update for CMS collections, e.g. bulkImport('gallery-items', items)
+    bulkImport: async (collection, items, ordered = false) => {
+      const response = await apiClient.post(`/admin/${collection}/bulk`, { items, ordered });
+      return response.data;
+    },
+
+    // Save a new display order (ids first to last) with one request
+    reorderItems: async (collection, ids) => {
+      const response = await apiClient.patch(`/admin/${collection}/order`, { ids });
+      return response.data;
+    },
+
     // Gallery Items Management
     getAllGalleryItems: async () => {
       const response = await apiClient.get('/admin/gallery-items');
@@ -330,8 +399,17 @@ export const api = {
     },
 
     // Donations Management
-    getAllDonations: async () => {
-      const response = await apiClient.get('/admin/donations');
+    getAllDonations: async (cursor = null) => {
+      return fetchPage('/admin/donations', cursor);
+    },
+
+    getDonationSummary: async (days = 30, months = 12) => {
+      const response = await apiClient.get('/admin/donations/summary', { params: { days, months } });
+      return response.data;
+    },
+
+    getReports: async (refresh = false) => {
+      const response = await apiClient.get('/admin/reports', { params: { refresh } });
       return response.data;
     },
 
@@ -351,8 +429,9 @@ export const api = {
       return response.data;
     },
 
-    getCollectionData: async (collectionName, limit = 100, skip = 0) => {
-      const response = await apiClient.get(`/admin/database/${collectionName}?limit=${limit}&skip=${skip}`);
+    getCollectionData: async (collectionName, limit = 100, cursor = null) => {
+      const params = cursor ? { limit, cursor } : { limit };
+      const response = await apiClient.get(`/admin/database/${collectionName}`, { params });
       return response.data;
     },
 
@@ -429,8 +508,7 @@ export const api = {
 // Public site content API (no authentication required)
 export const getPublicSiteContent = async () => {
   try {
-    const response = await apiClient.get('/site-content');
-    return response.data;
+    return await getBootstrapSection('site_content', '/site-content');
   } catch (error) {
     console.error('Failed to fetch public site content:', error);
     throw error;
@@ -440,8 +518,7 @@ export const getPublicSiteContent = async () => {
 // Success Stories API (public)
 export const getSuccessStories = async () => {
   try {
-    const response = await apiClient.get('/success-stories');
-    return response.data;
+    return await getBootstrapSection('success_stories', '/success-stories');
   } catch (error) {
     console.error('Failed to fetch success stories:', error);
     throw error;
@@ -484,8 +561,7 @@ export const getGalleryItems = async () => {
 // Testimonials API (public)
 export const getTestimonials = async () => {
   try {
-    const response = await apiClient.get('/testimonials');
-    return response.data;
+    return await getBootstrapSection('testimonials', '/testimonials');
   } catch (error) {
     console.error('Failed to fetch testimonials:', error);
     throw error;
@@ -495,8 +571,7 @@ export const getTestimonials = async () => {
 // Site Settings API (public)
 export const getSiteSettings = async () => {
   try {
-    const response = await apiClient.get('/site-settings');
-    return response.data;
+    return await getBootstrapSection('site_settings', '/site-settings');
   } catch (error) {
     console.error('Failed to fetch site settings:', error);
     throw error;
@@ -517,10 +592,19 @@ export const getDetailedPageSections = async (page) => {
 // Impact Highlights API (public)
 export const getImpactHighlights = async () => {
   try {
-    const response = await apiClient.get('/impact-highlights');
-    return response.data;
+    return await getBootstrapSection('impact_highlights', '/impact-highlights');
   } catch (error) {
     console.error('Failed to fetch impact highlights:', error);
     throw error;
   }
 };
+
+// Impact Statistics API (public, served from the bootstrap payload on the homepage)
+export const getPublicImpactStats = async () => {
+  try {
+    return await getBootstrapSection('impact_stats', '/impact-stats');
+  } catch (error) {
+    console.error('Failed to fetch impact statistics:', error);
+    throw error;
+  }
+};
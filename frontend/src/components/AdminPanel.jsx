@@ -47,6 +47,7 @@ const AdminPanel = () => {
   const [currentUser, setCurrentUser] = useState(null);
   const [activeTab, setActiveTab] = useState('dashboard');
   const [news, setNews] = useState([]);
+  const [newsCursor, setNewsCursor] = useState(null);
   const [impactStats, setImpactStats] = useState({});
   const [showNewsForm, setShowNewsForm] = useState(false);
   const [editingNews, setEditingNews] = useState(null);
@@ -59,6 +60,7 @@ const AdminPanel = () => {
 
   // Blog management state
   const [blogPosts, setBlogPosts] = useState([]);
+  const [blogCursor, setBlogCursor] = useState(null);
   const [showBlogForm, setShowBlogForm] = useState(false);
   const [editingBlog, setEditingBlog] = useState(null);
   const [blogForm, setBlogForm] = useState({
@@ -142,6 +144,7 @@ const AdminPanel = () => {
 
   // Donations Management state
   const [donations, setDonations] = useState([]);
+  const [donationCursor, setDonationCursor] = useState(null);
   const [editingDonation, setEditingDonation] = useState(null);
   const [donationForm, setDonationForm] = useState({
     status: 'pending',
@@ -244,8 +247,7 @@ const AdminPanel = () => {
 
       // Load news if on news tab
       if (activeTab === 'news') {
-        const newsData = await api.admin.getAllNews();
-        setNews(newsData);
+        await loadNews();
       }
 
       // Always load blog posts and site content for the admin
@@ -263,10 +265,12 @@ const AdminPanel = () => {
     }
   }, [activeTab, currentUser]);
 
-  const loadNews = async () => {
+  // Without a cursor the list restarts at the newest page; with one the next page is appended
+  const loadNews = async (cursor = null) => {
     try {
-      const newsData = await api.admin.getAllNews();
-      setNews(newsData);
+      const page = await api.admin.getAllNews(cursor);
+      setNews(prev => (cursor ? [...prev, ...page.items] : page.items));
+      setNewsCursor(page.next_cursor);
     } catch (error) {
       showAlert({
         title: "Error",
@@ -431,13 +435,16 @@ const AdminPanel = () => {
   };
 
   // Blog Management Functions
-  const loadBlogPosts = async () => {
+  const loadBlogPosts = async (cursor = null) => {
     try {
-      const data = await api.admin.getAllBlogs();
-      setBlogPosts(data || []);
+      const page = await api.admin.getAllBlogs(cursor);
+      setBlogPosts(prev => (cursor ? [...prev, ...page.items] : page.items));
+      setBlogCursor(page.next_cursor);
     } catch (error) {
       console.log('Error loading blog posts');
-      setBlogPosts([]);
+      if (!cursor) {
+        setBlogPosts([]);
+      }
     }
   };
 
@@ -965,10 +972,11 @@ const AdminPanel = () => {
   };
 
   // Donations Management Functions
-  const loadDonations = async () => {
+  const loadDonations = async (cursor = null) => {
     try {
-      const data = await api.admin.getAllDonations();
-      setDonations(data || []);
+      const page = await api.admin.getAllDonations(cursor);
+      setDonations(prev => (cursor ? [...prev, ...page.items] : page.items));
+      setDonationCursor(page.next_cursor);
     } catch (error) {
       console.error('Failed to load donations:', error);
       showAlert({
@@ -1073,7 +1081,7 @@ const AdminPanel = () => {
   const loadCollectionData = async (collectionName) => {
     try {
       setDatabaseLoading(true);
-      const data = await api.admin.getCollectionData(collectionName, 50, 0);
+      const data = await api.admin.getCollectionData(collectionName, 50);
       setCollectionData(data.documents || []);
       setSelectedCollection(data);
     } catch (error) {
@@ -2121,6 +2129,14 @@ const handleAddBlog = async () => {
                     </Card>
                   ))}
 
+                  {newsCursor && (
+                    <div className="flex justify-center">
+                      <Button variant="outline" onClick={() => loadNews(newsCursor)}>
+                        Load more articles
+                      </Button>
+                    </div>
+                  )}
+
                   {news.length === 0 && (
                     <Card>
                       <CardContent className="p-8 text-center">
@@ -2328,6 +2344,14 @@ const handleAddBlog = async () => {
                     </Card>
                   ))}
 
+                  {blogCursor && (
+                    <div className="flex justify-center">
+                      <Button variant="outline" onClick={() => loadBlogPosts(blogCursor)}>
+                        Load more posts
+                      </Button>
+                    </div>
+                  )}
+
                   {blogPosts.length === 0 && (
                     <Card>
                       <CardContent className="p-8 text-center">
@@ -3261,6 +3285,14 @@ const handleAddBlog = async () => {
                     </Card>
                   ))}
 
+                  {donationCursor && (
+                    <div className="flex justify-center">
+                      <Button variant="outline" onClick={() => loadDonations(donationCursor)}>
+                        Load more donations
+                      </Button>
+                    </div>
+                  )}
+
                   {donations.length === 0 && (
                     <Card>
                       <CardContent className="p-8 text-center">
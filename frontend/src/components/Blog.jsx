@@ -6,19 +6,38 @@ import { Input } from './ui/input';
 import { Calendar, User, Search, Tag, ChevronRight, BookOpen } from 'lucide-react';
 import { api } from '../api';
 import { Link } from 'react-router-dom';
+import DOMPurify from 'dompurify';
 import Header from './Header';
 import Footer from './Footer';
 
 const Blog = () => {
   const [selectedCategory, setSelectedCategory] = useState('All');
   const [searchTerm, setSearchTerm] = useState('');
+  const [selectedTag, setSelectedTag] = useState(null);
   const [blogPosts, setBlogPosts] = useState([]);
+  const [facets, setFacets] = useState({ categories: [], tags: [] });
 
-  // Load published blog posts
+  // Load category and tag counts
+  useEffect(() => {
+    const loadFacets = async () => {
+      try {
+        const response = await api.getBlogFacets();
+        setFacets(response);
+      } catch (error) {
+        console.log('No blog facets available');
+      }
+    };
+    loadFacets();
+  }, []);
+
+  // Load published blog posts for the selected category and tag
   useEffect(() => {
     const loadBlogPosts = async () => {
+      const filters = {};
+      if (selectedCategory !== 'All') filters.category = selectedCategory;
+      if (selectedTag) filters.tag = selectedTag;
       try {
-        const response = await api.getPublishedBlogs();
+        const response = await api.getPublishedBlogs(filters);
         setBlogPosts(response || []); // response is already an array
       } catch (error) {
         console.log('No blog posts available');
@@ -26,31 +45,62 @@ const Blog = () => {
       }
     };
     loadBlogPosts();
-  }, []);
+  }, [selectedCategory, selectedTag]);
+
+  // Ranked hits from the server-side search, rendered as-is (null when not searching)
+  const [searchResults, setSearchResults] = useState(null);
+  const [searchCursor, setSearchCursor] = useState(null);
+
+  const runSearch = async (query, cursor = null) => {
+    try {
+      const response = await api.searchContent(query, 'blogs', cursor, 20);
+      const hits = response.items.map((hit) => ({ ...hit, publishDate: hit.date }));
+      setSearchResults((prev) => (cursor ? [...(prev || []), ...hits] : hits));
+      setSearchCursor(response.next_cursor);
+    } catch (error) {
+      console.log('Search failed');
+      if (!cursor) {
+        setSearchResults([]);
+        setSearchCursor(null);
+      }
+    }
+  };
+
+  useEffect(() => {
+    const query = searchTerm.trim();
+    if (query.length < 2) {
+      setSearchResults(null);
+      setSearchCursor(null);
+      return undefined;
+    }
+    const timer = setTimeout(() => runSearch(query), 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
 
   // Get published blog posts only
   const publishedPosts = blogPosts.filter((post) => post.status === 'published');
 
-  // Filter posts based on search and category
-  const filteredPosts = publishedPosts.filter((post) => {
-    const matchesSearch =
-      post.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      post.excerpt.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      post.tags.some((tag) => tag.toLowerCase().includes(searchTerm.toLowerCase()));
+  // Category and tag are filtered server-side for the list; search hits are narrowed here, in relevance order
+  const filteredPosts = searchResults
+    ? searchResults.filter(
+        (hit) =>
+          (selectedCategory === 'All' || hit.category === selectedCategory) &&
+          (!selectedTag || hit.tags.includes(selectedTag))
+      )
+    : publishedPosts;
 
-    const matchesCategory = selectedCategory === 'All' || post.category === selectedCategory;
+  // Search titles and snippets arrive escaped with <mark> around matched terms; keep only the marks
+  const markedHtml = (html) => ({ __html: DOMPurify.sanitize(html, { ALLOWED_TAGS: ['mark'], ALLOWED_ATTR: [] }) });
 
-    return matchesSearch && matchesCategory;
-  });
-
-  // Get unique categories
-  const categories = ['All', ...new Set(publishedPosts.map((post) => post.category))];
+  // Get categories with their post counts
+  const categoryCounts = Object.fromEntries(facets.categories.map((facet) => [facet.name, facet.count]));
+  const categories = ['All', ...facets.categories.map((facet) => facet.name)];
 
   // Get recent posts for sidebar
   const recentPosts = publishedPosts.slice(0, 3);
 
   // Get all tags
-  const allTags = [...new Set(publishedPosts.flatMap((post) => post.tags))];
+  const allTags = facets.tags.map((facet) => facet.name);
 
   const formatDate = (dateString) => {
     return new Date(dateString).toLocaleDateString('en-US', {
@@ -145,11 +195,19 @@ const Blog = () => {
                             </Badge>
                           </div>
                           <CardTitle className="text-2xl hover:text-blue-600 transition-colors cursor-pointer">
-                            <Link to={`/blog/${post.id}`}>{post.title}</Link>
+                            {post.title_highlighted ? (
+                              <Link to={`/blog/${post.id}`} dangerouslySetInnerHTML={markedHtml(post.title_highlighted)} />
+                            ) : (
+                              <Link to={`/blog/${post.id}`}>{post.title}</Link>
+                            )}
                           </CardTitle>
                         </CardHeader>
                         <CardContent>
-                          <p className="text-gray-600 mb-4 line-clamp-3">{post.excerpt}</p>
+                          {post.snippet !== undefined ? (
+                            <p className="text-gray-600 mb-4 line-clamp-3" dangerouslySetInnerHTML={markedHtml(post.snippet)} />
+                          ) : (
+                            <p className="text-gray-600 mb-4 line-clamp-3">{post.excerpt}</p>
+                          )}
                           <div className="flex items-center justify-between">
                             <div className="flex gap-2">
                               {post.tags.slice(0, 3).map((tag) => (
@@ -181,6 +239,14 @@ const Blog = () => {
                   <p className="text-gray-600">Try adjusting your search or filter criteria.</p>
                 </div>
               )}
+
+              {searchResults && searchCursor && (
+                <div className="flex justify-center">
+                  <Button variant="outline" onClick={() => runSearch(searchTerm.trim(), searchCursor)}>
+                    More results
+                  </Button>
+                </div>
+              )}
             </div>
           </div>
 
@@ -222,9 +288,7 @@ const Blog = () => {
                     {categories
                       .filter((cat) => cat !== 'All')
                       .map((category) => {
-                        const count = publishedPosts.filter(
-                          (post) => post.category === category
-                        ).length;
+                        const count = categoryCounts[category] || 0;
                         return (
                           <button
                             key={category}
@@ -256,9 +320,9 @@ const Blog = () => {
                     {allTags.map((tag) => (
                       <Badge
                         key={tag}
-                        variant="outline"
+                        variant={selectedTag === tag ? 'default' : 'outline'}
                         className="cursor-pointer hover:bg-blue-100 hover:border-blue-300 text-xs"
-                        onClick={() => setSearchTerm(tag)}
+                        onClick={() => setSelectedTag(selectedTag === tag ? null : tag)}
                       >
                         <Tag className="h-3 w-3 mr-1" />
                         {tag}
@@ -6,7 +6,7 @@ import { Input } from './ui/input';
 import { Textarea } from './ui/textarea';
 import { useToast } from '../hooks/use-toast';
 import { Heart, Users, GraduationCap, Award, Phone, Mail, MapPin, ArrowRight, CheckCircle, Clock } from 'lucide-react';
-import { api, getPublicSiteContent } from '../api';
+import { api, getPublicSiteContent, getPublicImpactStats } from '../api';
 
 import Header from './Header';
 import Footer from './Footer';
@@ -28,7 +28,7 @@ const Homepage = () => {
     const loadData = async () => {
       try {
         // Load impact statistics
-        const stats = await api.getImpactStats();
+        const stats = await getPublicImpactStats();
         setImpactStats(stats);
         
         // Load site content from database API
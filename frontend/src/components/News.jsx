@@ -77,11 +77,8 @@ const News = () => {
                 </Link>
               </CardHeader>
               <CardContent>
-                {/*<p className="text-gray-600 mb-4 line-clamp-3">{article.content}</p>*/}
-                <div
-                  className="text-gray-600 mb-4 line-clamp-3 prose"
-                   dangerouslySetInnerHTML={{ __html: article.content }}
-                />
+                {/* The excerpt is plain text cut from the article, so it renders as text */}
+                <p className="text-gray-600 mb-4 line-clamp-3">{article.excerpt}</p>
                 <Link to={`/news/${article.id}`}>
                   <Button
                     variant="ghost"
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Index coverage tests for Shield Foundation
+Applies the index registry and checks with explain() that every hot query
+shape is answered by an index scan without a collection scan or in-memory sort
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent / "backend"
+sys.path.insert(0, str(backend_dir))
+
+from database import db, close_mongo_connection
+from indexes import ensure_indexes
+
+# (collection, filter, sort) for every query shape served by server.py
+QUERY_SHAPES = [
+    ("success_stories", {"is_active": True}, [("order", 1), ("created_at", -1)]),
+    ("success_stories", {}, [("order", 1), ("created_at", -1)]),
+    ("gallery_items", {"is_active": True}, [("order", 1), ("created_at", -1)]),
+    ("testimonials", {"is_active": True}, [("order", 1), ("created_at", -1)]),
+    ("impact_highlights", {"is_active": True}, [("order", 1), ("created_at", -1)]),
+    ("leadership_team", {"is_active": True}, [("category", 1), ("order", 1), ("created_at", -1)]),
+    ("leadership_team", {}, [("category", 1), ("order", 1), ("created_at", -1)]),
+    ("page_sections", {"page": "about", "is_active": True}, [("order", 1), ("created_at", -1)]),
+    ("page_sections", {"page": "about"}, [("order", 1), ("created_at", -1)]),
+    ("detailed_page_sections", {"page": "about", "is_active": True}, [("order", 1), ("created_at", -1)]),
+    ("blogs", {"status": "published"}, [("created_at", -1)]),
+    ("blogs", {"status": "published", "category": "Education"}, [("created_at", -1)]),
+    ("blogs", {"status": "published", "tags": "youth"}, [("created_at", -1)]),
+    ("news", {"status": "published"}, [("created_at", -1)]),
+    ("contacts", {}, [("created_at", -1), ("id", -1)]),
+    ("volunteers", {}, [("created_at", -1), ("id", -1)]),
+    ("donations", {}, [("created_at", -1), ("id", -1)]),
+    ("news", {}, [("created_at", -1), ("id", -1)]),
+    ("blogs", {}, [("created_at", -1), ("id", -1)]),
+    ("newsletters", {"is_active": True}, [("subscribed_at", -1), ("id", -1)]),
+    ("site_settings", {}, [("updated_at", -1)]),
+    ("site_content", {}, [("updated_at", -1)]),
+    ("impact_stats", {}, [("updated_at", -1)]),
+    ("blogs", {"status": "published", "$text": {"$search": "youth skills"}}, None),
+    ("news", {"status": "published", "$text": {"$search": "youth skills"}}, None),
+]
+
+# Lookups by the custom id field on every collection that has one
+ID_LOOKUPS = [
+    "contacts", "volunteers", "newsletters", "donations", "news", "blogs", "admin_users",
+    "success_stories", "gallery_items", "testimonials", "impact_highlights",
+    "leadership_team", "page_sections", "detailed_page_sections",
+]
+
+def plan_stages(plan) -> set:
+    """Collect every stage name in a (possibly nested) explain plan"""
+    stages = set()
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.add(plan["stage"])
+        for value in plan.values():
+            stages |= plan_stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            stages |= plan_stages(item)
+    return stages
+
+async def check_shape(collection, query, sort=None):
+    cursor = db[collection].find(query)
+    if sort:
+        cursor = cursor.sort(sort)
+    explain = await cursor.explain()
+    stages = plan_stages(explain["queryPlanner"]["winningPlan"])
+    ok = "IXSCAN" in stages and "COLLSCAN" not in stages and "SORT" not in stages
+    return ok, stages
+
+async def run_tests():
+    print("🗂  Applying index registry...")
+    report = await ensure_indexes(db)
+    if report["failed"]:
+        print(f"❌ FAIL Index creation: {report['failed']}")
+
+    failures = 0
+    for collection, query, sort in QUERY_SHAPES:
+        ok, stages = await check_shape(collection, query, sort)
+        failures += not ok
+        status = "✅ PASS" if ok else "❌ FAIL"
+        print(f"{status} {collection} {query} sort={sort}: {sorted(stages)}")
+
+    for collection in ID_LOOKUPS:
+        ok, stages = await check_shape(collection, {"id": "00000000-0000-0000-0000-000000000000"})
+        failures += not ok
+        status = "✅ PASS" if ok else "❌ FAIL"
+        print(f"{status} {collection} lookup by id: {sorted(stages)}")
+
+    close_mongo_connection()
+    print(f"\n{'All query shapes are index-backed' if not failures else f'{failures} query shapes not index-backed'}")
+    return failures == 0 and not report["failed"]
+
+if __name__ == "__main__":
+    success = asyncio.run(run_tests())
+    sys.exit(0 if success else 1)
@@ -13,6 +13,7 @@ backend_dir = Path(__file__).parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
 from database import db
+from pymongo import UpdateOne
 
 async def update_testimonials():
     """Update or add testimonials to the database"""
@@ -60,38 +61,29 @@ async def update_testimonials():
             }
         ]
 
-        updated_count = 0
-        added_count = 0
-        
-        for testimonial_data in testimonials_data:
-            # Check if testimonial exists by name
-            existing = await db.testimonials.find_one({"name": testimonial_data["name"]})
-            
-            if existing:
-                # Update existing testimonial
-                testimonial_data["id"] = existing.get("id", str(uuid.uuid4()))
-                testimonial_data["updated_at"] = datetime.utcnow()
-                # Preserve created_at if it exists
-                if "created_at" in existing:
-                    testimonial_data["created_at"] = existing["created_at"]
-                else:
-                    testimonial_data["created_at"] = datetime.utcnow()
-                
-                await db.testimonials.update_one(
-                    {"name": testimonial_data["name"]},
-                    {"$set": testimonial_data}
-                )
-                updated_count += 1
-                print(f"✓ Updated testimonial by {testimonial_data['name']}")
-            else:
-                # Add new testimonial
-                testimonial_data["id"] = str(uuid.uuid4())
-                testimonial_data["created_at"] = datetime.utcnow()
-                testimonial_data["updated_at"] = datetime.utcnow()
-                
-                await db.testimonials.insert_one(testimonial_data)
-                added_count += 1
-                print(f"✓ Added testimonial by {testimonial_data['name']}")
+        # Upsert every testimonial by name in a single bulk write; the pipeline update keeps
+        # existing ids and created_at and fills them in for documents that lack them
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"name": testimonial_data["name"]},
+                [{"$set": {
+                    **{key: {"$literal": value} for key, value in testimonial_data.items()},
+                    "id": {"$ifNull": ["$id", str(uuid.uuid4())]},
+                    "created_at": {"$ifNull": ["$created_at", now]},
+                    "updated_at": now
+                }}],
+                upsert=True
+            )
+            for testimonial_data in testimonials_data
+        ]
+        result = await db.testimonials.bulk_write(operations, ordered=False)
+
+        for index, testimonial_data in enumerate(testimonials_data):
+            action = "Added" if index in result.upserted_ids else "Updated"
+            print(f"✓ {action} testimonial by {testimonial_data['name']}")
+        added_count = result.upserted_count
+        updated_count = result.matched_count
 
         total_count = await db.testimonials.count_documents({"is_active": True})
         print(f"\n✅ Successfully processed testimonials!")